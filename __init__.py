@@ -14,11 +14,14 @@ import os
 import re
 import sys
 import time
+import weakref
 from collections import defaultdict
+from contextlib import contextmanager
 import xml.etree.ElementTree as ET
-from functools import wraps
+from functools import lru_cache, wraps
+from operator import attrgetter, itemgetter
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple, Union
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Sequence, Set, Tuple, Union
 from types import ModuleType
 
 from anki.collection import Collection
@@ -72,6 +75,33 @@ try:
 except ImportError:
     QMessageBox = None  # type: ignore[assignment]
 
+# lxml parses KANJIDIC2 noticeably faster when another add-on or the environment provides it.
+# It is only needed when the dictionary cache is rebuilt, so import it on first use.
+_xml_etree: Any = None
+_XML_PARSE_ERRORS: Tuple[type, ...] = (ET.ParseError,)
+
+
+def _ensure_xml_backend() -> Any:
+    global _xml_etree, _XML_PARSE_ERRORS
+    if _xml_etree is None:
+        try:
+            from lxml import etree as lxml_etree
+        except ImportError:
+            _xml_etree = ET
+        else:
+            _xml_etree = lxml_etree
+            _XML_PARSE_ERRORS = (ET.ParseError, lxml_etree.XMLSyntaxError)
+    return _xml_etree
+
+
+# orjson decodes large JSON dictionaries several times faster when it is importable.
+try:
+    import orjson as _orjson
+except ImportError:
+    _json_loads: Callable[[Union[str, bytes]], Any] = json.loads
+else:
+    _json_loads = _orjson.loads
+
 try:  # PyQt6-style enums
     SINGLE_SELECTION = QAbstractItemView.SelectionMode.SingleSelection
     NO_SELECTION = QAbstractItemView.SelectionMode.NoSelection
@@ -105,8 +135,30 @@ except AttributeError:
     BUTTON_CANCEL = QDialogButtonBox.Cancel
 
 KANJI_PATTERN = re.compile(r"[\u3400-\u9FFF\uF900-\uFAFF]")
+_kanji_findall = KANJI_PATTERN.findall
+
+
+def _find_kanji(value: str) -> List[str]:
+    # str.isascii() is a constant-time flag check, so ASCII-only fields (English, sound tags) skip the regex.
+    if value.isascii():
+        return []
+    return _kanji_findall(value)
+
 
-SQLITE_MAX_VARIABLES = 900
+# Collection queries run on the SQLite bundled with Anki's backend, not the one Python links, so stay within 999,
+# the default host parameter limit of SQLite builds before 3.32.
+SQLITE_MAX_VARIABLES = 999
+
+# Minimum spacing between Qt event-loop pumps while reporting recalc progress.
+PROGRESS_EVENTS_INTERVAL_NS = 100_000_000
+
+# Questions shown but never answered (undo, leaving the reviewer) would otherwise pile up in the pre-answer map.
+PRE_ANSWER_STATE_LIMIT = 32
+
+# Backoff for post-sync recalcs deferred while Anki reports itself busy.
+SYNC_BUSY_RETRY_DELAY_MS = 200
+SYNC_BUSY_RETRY_MAX_DELAY_MS = 5000
+SYNC_BUSY_MAX_RETRIES = 20
 
 BUCKET_TAG_KEYS: Tuple[str, str, str] = (
     "reviewed_vocab",
@@ -114,8 +166,52 @@ BUCKET_TAG_KEYS: Tuple[str, str, str] = (
     "no_vocab",
 )
 
+# Recalc stats whose non-zero counts mean the collection changed and should be synced.
+SYNC_STAT_KEYS: Tuple[str, ...] = (
+    "created",
+    "existing_tagged",
+    "unsuspended",
+    "tag_removed",
+    "resuspended",
+    "vocab_suspended",
+    "vocab_unsuspended",
+    "cards_reordered",
+    "bucket_tags_updated",
+)
+
 SCHEDULING_FIELD_DEFAULT_NAME = "KanjiCards Scheduling Info"
 
+# One line per value; filled with a single %-format instead of joining eleven f-strings.
+SCHEDULING_INFO_TEMPLATE = "\n".join(
+    [
+        "kanji: %s",
+        "reorder_mode: %s",
+        "has_vocab_usage: %s",
+        "reviewed_vocab: %s",
+        "first_review_order: %s",
+        "first_review_due: %s",
+        "first_new_due: %s",
+        "first_new_order: %s",
+        "vocab_occurrences: %s",
+        "dictionary_entry: %s",
+        "dictionary_frequency: %s",
+    ]
+)
+
+# Parameters echoed when a query fails; the rest are summarised by count.
+DB_ERROR_MAX_PARAMS = 20
+
+DICTIONARY_CACHE_FILE_NAME = "kanjicards_dictionary_cache.json"
+# Bump when the parsed dictionary entry layout changes so stale caches are ignored.
+DICTIONARY_CACHE_VERSION = 1
+
+# Deck manager methods across Anki versions, in the order they are tried.
+DECK_CURRENT_ID_ATTRS: Tuple[str, ...] = ("get_current_id", "current_id", "selected")
+DECK_ID_FOR_NAME_ATTRS: Tuple[str, ...] = ("id_for_name", "idForName", "id")
+DECK_NAMES_ATTRS: Tuple[str, ...] = ("all_names_and_ids", "allNamesAndIds", "allNames")
+# Collection note insertion methods, newest first.
+ADD_NOTE_ATTRS: Tuple[str, ...] = ("add_note", "addNote")
+
 KANJICARDS_TOOLBAR_CMD = "kanjicards_recalc"
 KANJICARDS_TOOLBAR_ID = "kanjicards_recalc_toolbar"
 PRIORITYSIEVE_TOOLBAR_CMD = "recalc_toolbar"
@@ -222,6 +318,11 @@ class KanjiVocabRecalcManager:
         self._existing_notes_cache: Optional[Dict[str, Any]] = None
         self._kanji_model_cache: Optional[Dict[str, Any]] = None
         self._vocab_model_cache: Optional[Dict[str, Any]] = None
+        self._field_index_cache: Dict[int, Tuple[int, int, Dict[str, int]]] = {}
+        self._vocab_char_index: Dict[int, Tuple[Tuple[int, int], Dict[str, Set[int]]]] = {}
+        self._vocab_note_chars_cache: Dict[int, Tuple[int, Tuple[int, ...], FrozenSet[str]]] = {}
+        self._deck_name_to_id_cache: Optional[Tuple[Any, Dict[str, int]]] = None
+        self._models_by_name_cache: Optional[Dict[str, NotetypeDict]] = None
         self._realtime_error_logged = False
         self._missing_deck_logged = False
         self._sync_hook_installed = False
@@ -230,7 +331,11 @@ class KanjiVocabRecalcManager:
         self._profile_state_error_logged = False
         self._pre_answer_card_state: Dict[int, Dict[str, Optional[int]]] = {}
         self._last_question_card_id: Optional[int] = None
+        self._last_process_events_ns = 0
+        self._realtime_enabled_cached: Optional[bool] = None
+        self._config_cache: Optional[AddonConfig] = None
         self._debug_path: Optional[str] = None
+        self._debug_dir_ready: Optional[str] = None
         self._debug_enabled = False
         self._last_vocab_sync_mod: Optional[int] = None
         self._last_vocab_sync_count: Optional[int] = None
@@ -240,6 +345,7 @@ class KanjiVocabRecalcManager:
         self._recalc_action = None
         self._prioritysieve_recalc_wrapped = False
         self._prioritysieve_waiting_post_sync = False
+        self._wrapped_completion_hooks: weakref.WeakSet = weakref.WeakSet()
         self.addon_name = self.mw.addonManager.addonFromModule(__name__)
         if self.addon_name:
             self.addon_dir = os.path.join(self.mw.addonManager.addonsFolder(), self.addon_name)
@@ -288,7 +394,10 @@ class KanjiVocabRecalcManager:
         if not path:
             return
         try:
-            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Realtime logging writes on every review, so create the log directory once per path.
+            if self._debug_dir_ready != path:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                self._debug_dir_ready = path
             timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
             payload = message
             if extra:
@@ -300,7 +409,7 @@ class KanjiVocabRecalcManager:
             with open(path, "a", encoding="utf-8") as handle:
                 handle.write(f"{timestamp} {payload}\n")
         except Exception:
-            pass
+            self._debug_dir_ready = None
 
     def _apply_profile_state_payload(self, payload: Dict[str, Any]) -> None:
         def _coerce_int(value: Any) -> Optional[int]:
@@ -430,10 +539,20 @@ class KanjiVocabRecalcManager:
             return
         write_succeeded = False
         try:
-            os.makedirs(os.path.dirname(path), exist_ok=True)
-            payload = dict(data)
-            with open(path, "w", encoding="utf-8") as handle:
-                json.dump(payload, handle, indent=2, ensure_ascii=False)
+            encoded = json.dumps(dict(data), indent=2, ensure_ascii=False).encode("utf-8")
+            try:
+                with open(path, "rb") as handle:
+                    unchanged = handle.read() == encoded
+            except OSError:
+                unchanged = False
+            # Saving settings without edits leaves the file alone; real changes land through a rename so a crash
+            # mid-write never leaves a truncated profile config behind.
+            if not unchanged:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp_path = f"{path}.tmp"
+                with open(tmp_path, "wb") as handle:
+                    handle.write(encoded)
+                os.replace(tmp_path, path)
             write_succeeded = True
         except Exception as err:  # noqa: BLE001
             _safe_print(f"[KanjiCards] Failed to write profile config: {err}")
@@ -445,11 +564,18 @@ class KanjiVocabRecalcManager:
             return dict(global_cfg)
 
         merged = dict(global_cfg)
-        for key, value in profile_cfg.items():
-            if isinstance(value, dict) and isinstance(merged.get(key), dict):
-                merged[key] = self._merge_config_sources(merged[key], value)  # type: ignore[arg-type]
-            else:
-                merged[key] = value
+        # Nested sections are copied before they are merged into, so Anki's cached global config is never mutated.
+        pending: List[Tuple[Dict[str, Any], Dict[str, Any]]] = [(merged, profile_cfg)]
+        while pending:
+            target, overrides = pending.pop()
+            for key, value in overrides.items():
+                current = target.get(key)
+                if isinstance(value, dict) and isinstance(current, dict):
+                    section = dict(current)
+                    target[key] = section
+                    pending.append((section, value))
+                else:
+                    target[key] = value
         return merged
 
     def _normalize_kanji_fields(self, raw_fields: Optional[Dict[str, object]]) -> Dict[str, str]:
@@ -585,6 +711,21 @@ class KanjiVocabRecalcManager:
         return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
     def load_config(self) -> AddonConfig:
+        # Shared by the reviewer hooks, so callers must treat the result as read-only.
+        cached = self._config_cache
+        if cached is not None:
+            return cached
+        cfg = self._read_config()
+        self._config_cache = cfg
+        self._realtime_enabled_cached = cfg.realtime_review
+        return cfg
+
+    def _invalidate_config_cache(self) -> None:
+        # The realtime flag is derived from the cached config, so the two are always dropped together.
+        self._config_cache = None
+        self._realtime_enabled_cached = None
+
+    def _read_config(self) -> AddonConfig:
         global_raw_obj = self.mw.addonManager.getConfig(__name__)
         global_raw = global_raw_obj if isinstance(global_raw_obj, dict) else {}
         profile_raw = self._load_profile_config_or_seed(global_raw)
@@ -595,10 +736,13 @@ class KanjiVocabRecalcManager:
         raw = self._serialize_config(cfg)
         self.mw.addonManager.writeConfig(__name__, raw)
         self._write_profile_config(raw)
-        self._dictionary_cache = None
+        self._config_cache = cfg
+        self._realtime_enabled_cached = cfg.realtime_review
+        # The dictionary cache is keyed by path and mtime, so a new dictionary_file setting misses it on its own.
         self._existing_notes_cache = None
         self._kanji_model_cache = None
         self._vocab_model_cache = None
+        self._models_by_name_cache = None
         self._realtime_error_logged = False
         self._missing_deck_logged = False
         self._sync_hook_installed = False
@@ -663,7 +807,8 @@ class KanjiVocabRecalcManager:
             break
 
     def show_settings(self) -> None:
-        dialog = KanjiVocabRecalcSettingsDialog(self, self.load_config())
+        # The dialog edits its config in place, so give it a private copy.
+        dialog = KanjiVocabRecalcSettingsDialog(self, self._read_config())
         dialog.exec()
 
     def _prioritysieve_recalc_main(self) -> Optional[ModuleType]:
@@ -832,7 +977,8 @@ class KanjiVocabRecalcManager:
         original = getattr(ps_main, attr_name, None)
         if not callable(original):
             return
-        if getattr(original, "_kanjicards_completion_wrapper", False):
+        wrapped_hooks = self._wrapped_completion_hooks
+        if original in wrapped_hooks:
             return
 
         manager = self
@@ -844,7 +990,7 @@ class KanjiVocabRecalcManager:
             finally:
                 manager._run_on_main(manager._handle_prioritysieve_recalc_completed)
 
-        setattr(wrapped, "_kanjicards_completion_wrapper", True)
+        wrapped_hooks.add(wrapped)
         setattr(ps_main, attr_name, wrapped)
 
     def _prioritysieve_post_sync_active(self) -> bool:
@@ -899,9 +1045,8 @@ class KanjiVocabRecalcManager:
 
     def _on_top_toolbar_init_links(self, links: List[str], toolbar: Toolbar) -> None:
         ps_available = self._prioritysieve_recalc_main() is not None
-        for index in range(len(links) - 1, -1, -1):
-            if f'id="{KANJICARDS_TOOLBAR_ID}"' in links[index]:
-                links.pop(index)
+        marker = f'id="{KANJICARDS_TOOLBAR_ID}"'
+        links[:] = [link for link in links if marker not in link]
         if ps_available:
             return
         label = "Recalc"
@@ -930,7 +1075,7 @@ class KanjiVocabRecalcManager:
         self.mw.progress.start(label="Preparing KanjiCards…", immediate=True)
         progress_tracker: Optional[Dict[str, object]] = None
         if progress_obj and hasattr(progress_obj, "update"):
-            progress_tracker = {"progress": progress_obj, "current": 0, "max": 5}
+            progress_tracker = self._new_progress_tracker(progress_obj, 5)
             try:
                 progress_obj.update(label="Collecting configuration…", value=0, max=5)
             except TypeError:
@@ -954,11 +1099,20 @@ class KanjiVocabRecalcManager:
             self.mw.reset()
             return stats
 
+    def _new_progress_tracker(self, progress_obj: Any, max_steps: int) -> Dict[str, object]:
+        # The update and run_on_main handles are resolved once here; each _progress_step only reads them.
+        return {
+            "progress": progress_obj,
+            "current": 0,
+            "max": max_steps,
+            "_update": getattr(progress_obj, "update", None),
+            "_run_on_main": getattr(getattr(self.mw, "taskman", None), "run_on_main", None),
+        }
+
     def _progress_step(self, tracker: Optional[Dict[str, object]], label: str) -> None:
         if not tracker:
             return
-        progress = tracker.get("progress")
-        update = getattr(progress, "update", None)
+        update = tracker.get("_update")
         if not callable(update):
             return
         current = int(tracker.get("current", 0)) + 1
@@ -978,15 +1132,19 @@ class KanjiVocabRecalcManager:
                 except TypeError:
                     pass
 
-        taskman = getattr(self.mw, "taskman", None)
-        if taskman and hasattr(taskman, "run_on_main"):
+        run_on_main = tracker.get("_run_on_main")
+        if callable(run_on_main):
             try:
-                taskman.run_on_main(_do_update)
+                run_on_main(_do_update)
             except Exception:
                 _do_update()
         else:
             _do_update()
 
+        now_ns = time.monotonic_ns()
+        if now_ns - self._last_process_events_ns <= PROGRESS_EVENTS_INTERVAL_NS:
+            return
+        self._last_process_events_ns = now_ns
         try:
             QApplication.processEvents()
         except Exception:
@@ -1074,7 +1232,7 @@ class KanjiVocabRecalcManager:
     def _compute_vocab_sync_marker(
         self,
         collection: Collection,
-        vocab_models: Sequence[Tuple[NotetypeDict, List[int], float]],
+        vocab_models: Sequence[Tuple[NotetypeDict, Sequence[int], float]],
     ) -> Tuple[int, int]:
         model_ids = [
             model["id"]
@@ -1083,12 +1241,13 @@ class KanjiVocabRecalcManager:
         ]
         if not model_ids:
             return 0, 0
-        placeholders = ",".join("?" for _ in model_ids)
+        # A single JSON-array bind keeps the statement text fixed so SQLite can
+        # reuse its prepared statement however many vocab note types are set.
         try:
             rows = _db_all(
                 collection,
-                f"SELECT COUNT(*), MAX(mod) FROM notes WHERE mid IN ({placeholders})",
-                *model_ids,
+                "SELECT COUNT(*), MAX(mod) FROM notes WHERE mid IN (SELECT value FROM json_each(?))",
+                json.dumps(model_ids),
                 context="compute_vocab_sync_marker",
             )
         except Exception:
@@ -1132,82 +1291,93 @@ class KanjiVocabRecalcManager:
         self._write_profile_config(raw)
         self._pending_vocab_sync_marker = None
 
+    def _realtime_review_enabled(self) -> bool:
+        cached = self._realtime_enabled_cached
+        if cached is None:
+            try:
+                # load_config records the flag when it fills the config cache.
+                cached = bool(self.load_config().realtime_review)
+            except Exception:
+                # Fall back to the per-answer config check in _process_reviewed_card.
+                return True
+        return cached
+
     def _on_reviewer_did_show_question(self, card: Any, *args: Any, **kwargs: Any) -> None:
-        if not card:
+        if not card or not self._realtime_review_enabled():
             return
-        card_id = getattr(card, "id", None)
+        card_id, card_type, queue, note_id = _card_state_attrs(card)
         if card_id is None or not isinstance(card_id, int):
-            if isinstance(card_id, (str, bytes)):
-                try:
-                    numeric_id = int(card_id)
-                except Exception:
-                    numeric_id = None
-                else:
-                    self._debug("realtime/fallback_card_id", original=card_id, fallback=numeric_id, source="string")
-                    card_id = numeric_id
-            if card_id is None or not isinstance(card_id, int):
-                if self._last_question_card_id is not None and self._last_question_card_id in self._pre_answer_card_state:
-                    self._debug(
-                        "realtime/fallback_card_id",
-                        original=card_id,
-                        fallback=self._last_question_card_id,
-                        source="last_question",
-                    )
-                    card_id = self._last_question_card_id
-                elif self._pre_answer_card_state:
-                    # Use the most recent stored key.
-                    fallback_id = next(reversed(self._pre_answer_card_state))
-                    self._debug(
-                        "realtime/fallback_card_id",
-                        original=card_id,
-                        fallback=fallback_id,
-                        source="stored_state",
-                    )
-                    card_id = fallback_id
-                elif hasattr(card, "card"):
-                    candidate = getattr(card, "card", None)
-                    fallback_id = getattr(candidate, "id", None)
-                    self._debug(
-                        "realtime/fallback_card_id",
-                        original=card_id,
-                        fallback=fallback_id,
-                        source="card_attr",
-                    )
-                    card_id = fallback_id
+            numeric_id = _coerce_card_id(card_id)
+            if numeric_id is not None:
+                self._debug("realtime/fallback_card_id", original=card_id, fallback=numeric_id, source="string")
+                card_id = numeric_id
+            elif self._last_question_card_id is not None and self._last_question_card_id in self._pre_answer_card_state:
+                self._debug(
+                    "realtime/fallback_card_id",
+                    original=card_id,
+                    fallback=self._last_question_card_id,
+                    source="last_question",
+                )
+                card_id = self._last_question_card_id
+            elif self._pre_answer_card_state:
+                # Use the most recent stored key.
+                fallback_id = next(reversed(self._pre_answer_card_state))
+                self._debug(
+                    "realtime/fallback_card_id",
+                    original=card_id,
+                    fallback=fallback_id,
+                    source="stored_state",
+                )
+                card_id = fallback_id
+            elif hasattr(card, "card"):
+                candidate = getattr(card, "card", None)
+                fallback_id = getattr(candidate, "id", None)
+                self._debug(
+                    "realtime/fallback_card_id",
+                    original=card_id,
+                    fallback=fallback_id,
+                    source="card_attr",
+                )
+                card_id = fallback_id
         if card_id is None or not isinstance(card_id, int):
             self._debug("realtime/skip", reason="missing_card_id")
             return
-        card_type = getattr(card, "type", None)
         stored_type = card_type if isinstance(card_type, int) else None
-        queue = getattr(card, "queue", None)
         stored_queue = queue if isinstance(queue, int) else None
-        note_id = getattr(card, "nid", None)
         stored_note_id = note_id if isinstance(note_id, int) else None
-        self._pre_answer_card_state[card_id] = {
+        pre_answer_state = self._pre_answer_card_state
+        # Re-insert so a re-shown card moves to the newest end before the oldest entries are evicted.
+        pre_answer_state.pop(card_id, None)
+        pre_answer_state[card_id] = {
             "type": stored_type,
             "queue": stored_queue,
             "note_id": stored_note_id,
         }
+        while len(pre_answer_state) > PRE_ANSWER_STATE_LIMIT:
+            del pre_answer_state[next(iter(pre_answer_state))]
         self._last_question_card_id = card_id
-        self._debug(
-            "realtime/question",
-            card_id=card_id,
-            card_type=stored_type,
-            queue=stored_queue,
-            note_id=stored_note_id,
-        )
+        if self._debug_enabled:
+            self._debug(
+                "realtime/question",
+                card_id=card_id,
+                card_type=stored_type,
+                queue=stored_queue,
+                note_id=stored_note_id,
+            )
 
     def _on_reviewer_did_answer_card(self, card: Any, *args: Any, **kwargs: Any) -> None:
-        if not card:
+        if not card or not self._realtime_review_enabled():
             return
         if self.mw.col is None:
             return
-        self._debug(
-            "realtime/did_answer",
-            card_id=getattr(card, "id", None),
-            queue=getattr(card, "queue", None),
-            type=getattr(card, "type", None),
-        )
+        # This hook and the question hook run for every card, so skip building their payloads unless logging.
+        if self._debug_enabled:
+            self._debug(
+                "realtime/did_answer",
+                card_id=getattr(card, "id", None),
+                queue=getattr(card, "queue", None),
+                type=getattr(card, "type", None),
+            )
         try:
             self._process_reviewed_card(card)
         except Exception as err:  # noqa: BLE001
@@ -1221,23 +1391,14 @@ class KanjiVocabRecalcManager:
             return
 
         card_id_obj = getattr(card, "id", None)
-        card_id: Optional[int]
-        if isinstance(card_id_obj, int):
-            card_id = card_id_obj
-        elif isinstance(card_id_obj, (str, bytes)):
-            try:
-                card_id = int(card_id_obj)
-            except Exception:
-                card_id = None
-            else:
-                self._debug(
-                    "realtime/fallback_card_id",
-                    original=card_id_obj,
-                    fallback=card_id,
-                    source="string",
-                )
-        else:
-            card_id = None
+        card_id = _coerce_card_id(card_id_obj)
+        if card_id is not None and not isinstance(card_id_obj, int):
+            self._debug(
+                "realtime/fallback_card_id",
+                original=card_id_obj,
+                fallback=card_id,
+                source="string",
+            )
 
         if card_id is None or card_id not in self._pre_answer_card_state:
             if self._last_question_card_id is not None and self._last_question_card_id in self._pre_answer_card_state:
@@ -1361,9 +1522,9 @@ class KanjiVocabRecalcManager:
         except Exception:  # noqa: BLE001
             fields = note.split_fields() if hasattr(note, "split_fields") else []
 
-        kanji_chars: Set[str] = set()
-        if kanji_field_index < len(fields):
-            kanji_chars.update(KANJI_PATTERN.findall(fields[kanji_field_index]))
+        kanji_chars: Set[str] = (
+            set(_find_kanji(fields[kanji_field_index])) if kanji_field_index < len(fields) else set()
+        )
 
         if not kanji_chars:
             self._debug("realtime/skip", reason="no_kanji_chars", card_id=card_id)
@@ -1379,15 +1540,15 @@ class KanjiVocabRecalcManager:
             return
 
         vocab_field_map = {model["id"]: indexes for model, indexes, _ in vocab_map.values()}
-        note_id_value = getattr(note, "id", note_id_hint)
-        self._debug(
-            "realtime/process",
-            card_id=card_id,
-            note_id=note_id_value,
-            chars="".join(sorted(kanji_chars)),
-            prev_type=prev_type,
-            prev_queue=prev_queue,
-        )
+        if self._debug_enabled:
+            self._debug(
+                "realtime/process",
+                card_id=card_id,
+                note_id=getattr(note, "id", note_id_hint),
+                chars="".join(sorted(kanji_chars)),
+                prev_type=prev_type,
+                prev_queue=prev_queue,
+            )
 
         existing_notes = self._get_existing_kanji_notes(collection, kanji_model, kanji_field_index)
         if not existing_notes:
@@ -1404,7 +1565,15 @@ class KanjiVocabRecalcManager:
 
         self._realtime_error_logged = False
 
+    def _reset_note_caches(self) -> None:
+        # Notes pulled in by a sync keep the other device's mod times, which can be older than anything already
+        # seen here, so the count/max-mod markers cannot be trusted across a sync or a profile switch.
+        self._existing_notes_cache = None
+        self._vocab_char_index = {}
+        self._vocab_note_chars_cache = {}
+
     def _on_sync_event(self, *args: Any, **kwargs: Any) -> None:
+        self._reset_note_caches()
         if self._prioritysieve_post_sync_active():
             self._prioritysieve_waiting_post_sync = True
             return
@@ -1416,6 +1585,7 @@ class KanjiVocabRecalcManager:
         *,
         allow_followup: bool = True,
         on_finished: Optional[Callable[[bool], None]] = None,
+        _retry: int = 0,
     ) -> None:
         callback = on_finished or (lambda _changed: None)
         self._prioritysieve_waiting_post_sync = False
@@ -1460,11 +1630,17 @@ class KanjiVocabRecalcManager:
 
         busy_check = getattr(self.mw.progress, "busy", None)
         if callable(busy_check) and busy_check():
+            if _retry >= SYNC_BUSY_MAX_RETRIES:
+                self._debug("run_after_sync/busy_gave_up", retries=_retry)
+                callback(False)
+                return
+            delay = min(SYNC_BUSY_RETRY_DELAY_MS * (2**_retry), SYNC_BUSY_RETRY_MAX_DELAY_MS)
             QTimer.singleShot(
-                200,
+                delay,
                 lambda: self.run_after_sync(
                     allow_followup=allow_followup,
                     on_finished=callback,
+                    _retry=_retry + 1,
                 ),
             )
             return
@@ -1483,23 +1659,7 @@ class KanjiVocabRecalcManager:
         self._suppress_next_auto_sync = True
 
     def _stats_warrant_sync(self, stats: Dict[str, object]) -> bool:
-        for key in (
-            "created",
-            "existing_tagged",
-            "unsuspended",
-            "tag_removed",
-            "resuspended",
-            "vocab_suspended",
-            "vocab_unsuspended",
-            "cards_reordered",
-            "bucket_tags_updated",
-        ):
-            try:
-                if int(stats.get(key, 0)) > 0:
-                    return True
-            except Exception:
-                continue
-        return False
+        return any(_positive_count(stats.get(key)) for key in SYNC_STAT_KEYS)
 
     def _trigger_followup_sync(self) -> bool:
         methods = [
@@ -1526,6 +1686,16 @@ class KanjiVocabRecalcManager:
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
+    def _models_by_name(self, collection: Collection) -> Dict[str, NotetypeDict]:
+        cached = self._models_by_name_cache
+        if cached is not None:
+            return cached
+        by_name: Dict[str, NotetypeDict] = {}
+        for model in collection.models.all():
+            by_name.setdefault(model["name"], model)
+        self._models_by_name_cache = by_name
+        return by_name
+
     def _get_kanji_model_context(
         self,
         collection: Collection,
@@ -1565,16 +1735,29 @@ class KanjiVocabRecalcManager:
             "field_indexes": kanji_field_indexes,
             "kanji_field_index": kanji_field_index,
         }
-        self._existing_notes_cache = None
 
         return kanji_model, kanji_field_indexes, kanji_field_index
 
+    def _field_name_index(self, model: NotetypeDict) -> Dict[str, int]:
+        # Anki bumps a note type's "mod" whenever its fields change, so (mod, field count) is a safe cache key.
+        flds = model["flds"]
+        model_id = model.get("id")
+        mod = model.get("mod")
+        cache = self._field_index_cache
+        cached = cache.get(model_id) if model_id is not None and mod is not None else None
+        if cached is not None and cached[0] == mod and cached[1] == len(flds):
+            return cached[2]
+        mapping = {fld["name"]: idx for idx, fld in enumerate(flds)}
+        if model_id is not None and mod is not None:
+            cache[model_id] = (mod, len(flds), mapping)
+        return mapping
+
     def _resolve_field_indexes(
         self,
         model: NotetypeDict,
         mapping: Dict[str, str],
     ) -> Dict[str, int]:
-        name_to_index = {fld["name"]: idx for idx, fld in enumerate(model["flds"])}
+        name_to_index = self._field_name_index(model)
         result: Dict[str, int] = {}
         for logical_name, field_name in mapping.items():
             if not field_name:
@@ -1590,21 +1773,20 @@ class KanjiVocabRecalcManager:
         self,
         collection: Collection,
         cfg: AddonConfig,
-    ) -> List[Tuple[NotetypeDict, List[int], float]]:
-        vocab_models: List[Tuple[NotetypeDict, List[int], float]] = []
+    ) -> List[Tuple[NotetypeDict, Tuple[int, ...], float]]:
+        vocab_models: List[Tuple[NotetypeDict, Tuple[int, ...], float]] = []
         for vocab_cfg in cfg.vocab_note_types:
             if not vocab_cfg.name:
                 continue
             model = collection.models.byName(vocab_cfg.name)
             if model is None:
                 continue
-            field_indexes = []
-            name_to_index = {fld["name"]: idx for idx, fld in enumerate(model["flds"])}
+            name_to_index = self._field_name_index(model)
             fields_missing = [f for f in vocab_cfg.fields if f not in name_to_index]
             if fields_missing:
                 continue
-            for fname in vocab_cfg.fields:
-                field_indexes.append(name_to_index[fname])
+            # Resolved once per model so the per-note scans index split fields positionally.
+            field_indexes = tuple(name_to_index[fname] for fname in vocab_cfg.fields)
             multiplier = vocab_cfg.due_multiplier if vocab_cfg.due_multiplier > 0 else 1.0
             try:
                 multiplier = float(multiplier)
@@ -1619,7 +1801,7 @@ class KanjiVocabRecalcManager:
         self,
         collection: Collection,
         cfg: AddonConfig,
-    ) -> Dict[int, Tuple[NotetypeDict, List[int], float]]:
+    ) -> Dict[int, Tuple[NotetypeDict, Tuple[int, ...], float]]:
         key = tuple(
             sorted(
                 (entry.name, tuple(entry.fields), float(entry.due_multiplier))
@@ -1642,122 +1824,179 @@ class KanjiVocabRecalcManager:
         path = file_name
         if not os.path.isabs(path):
             path = os.path.join(self.addon_dir, path)
-        if not os.path.exists(path):
-            raise RuntimeError(f"Dictionary file not found at '{path}'")
+        try:
+            stat = os.stat(path)
+        except OSError:
+            raise RuntimeError(f"Dictionary file not found at '{path}'") from None
         lower_path = path.lower()
-        mtime = os.path.getmtime(path)
+        mtime = stat.st_mtime
         cache = self._dictionary_cache
         if cache and cache.get("path") == path and cache.get("mtime") == mtime:
             return cache["data"]
 
+        size = stat.st_size
         if lower_path.endswith(".json"):
-            data = self._load_dictionary_json(path)
+            data = self._load_dictionary_with_disk_cache(path, mtime, size, self._load_dictionary_json)
         elif lower_path.endswith(".xml"):
-            data = self._load_dictionary_kanjidic(path)
+            data = self._load_dictionary_with_disk_cache(path, mtime, size, self._load_dictionary_kanjidic)
         else:
             try:
-                data = self._load_dictionary_kanjidic(path)
+                data = self._load_dictionary_with_disk_cache(path, mtime, size, self._load_dictionary_kanjidic)
             except Exception:
-                data = self._load_dictionary_json(path)
+                data = self._load_dictionary_with_disk_cache(path, mtime, size, self._load_dictionary_json)
 
         self._dictionary_cache = {"path": path, "mtime": mtime, "data": data}
         return data
 
+    def _load_dictionary_with_disk_cache(
+        self,
+        path: str,
+        mtime: float,
+        size: int,
+        loader: Callable[[str], Dict[str, Dict[str, object]]],
+    ) -> Dict[str, Dict[str, object]]:
+        # Parsing KANJIDIC2 dominates cold starts and JSON sources need their frequencies normalised, so keep the
+        # loaded, normalised entries on disk until the source file changes.
+        cache_path = os.path.join(self.addon_dir, DICTIONARY_CACHE_FILE_NAME)
+        signature = {"version": DICTIONARY_CACHE_VERSION, "path": path, "mtime": mtime, "size": size}
+        try:
+            with open(cache_path, "rb") as handle:
+                cached = _json_loads(handle.read())
+        except FileNotFoundError:
+            cached = None
+        except Exception as err:  # noqa: BLE001
+            self._debug("dictionary_cache/read_failed", error=str(err))
+            cached = None
+        if (
+            isinstance(cached, dict)
+            and all(cached.get(key) == value for key, value in signature.items())
+            and isinstance(cached.get("data"), dict)
+            and cached["data"]
+        ):
+            return cached["data"]
+
+        data = loader(path)
+        tmp_path = f"{cache_path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as handle:
+                json.dump({**signature, "data": data}, handle, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, cache_path)
+        except Exception as err:  # noqa: BLE001
+            self._debug("dictionary_cache/write_failed", error=str(err))
+        return data
+
     def _load_dictionary_json(self, path: str) -> Dict[str, Dict[str, object]]:
-        with open(path, "r", encoding="utf-8") as handle:
-            data = json.load(handle)
+        with open(path, "rb") as handle:
+            data = _json_loads(handle.read())
         if not isinstance(data, dict):
             raise RuntimeError("Dictionary file must contain a JSON object mapping kanji to data")
-        for key, value in data.items():
-            if not isinstance(value, dict):
+        for value in data.values():
+            if not isinstance(value, dict) or "frequency" not in value:
+                continue
+            freq_val = value["frequency"]
+            if type(freq_val) is int:
                 continue
-            freq_val = value.get("frequency")
             if isinstance(freq_val, str) and freq_val.isdigit():
                 value["frequency"] = int(freq_val)
             elif isinstance(freq_val, (int, float)):
                 value["frequency"] = int(freq_val)
-            elif "frequency" in value:
+            else:
                 value["frequency"] = None
         return data
 
     def _load_dictionary_kanjidic(self, path: str) -> Dict[str, Dict[str, object]]:
+        dictionary: Dict[str, Dict[str, object]] = {}
+        root: Optional[ET.Element] = None
+        depth = 0
+        xml_etree = _ensure_xml_backend()
         try:
-            tree = ET.parse(path)
-        except ET.ParseError as err:
+            with open(path, "rb") as handle:
+                # Stream the file so only one <character> record is held in memory at a time.
+                for event, character in xml_etree.iterparse(handle, events=("start", "end")):
+                    if event == "start":
+                        depth += 1
+                        if root is None:
+                            root = character
+                            if root.tag != "kanjidic2":
+                                raise RuntimeError("Dictionary XML does not appear to be a KANJIDIC2 file")
+                        continue
+                    depth -= 1
+                    if depth != 1 or character.tag != "character":
+                        continue
+                    parsed = self._parse_kanjidic_character(character)
+                    if parsed is not None:
+                        dictionary[parsed[0]] = parsed[1]
+                    root.clear()
+        except _XML_PARSE_ERRORS as err:
             raise RuntimeError(
                 "Dictionary XML could not be parsed; ensure it is a valid KANJIDIC2 file"
             ) from err
-        root = tree.getroot()
-        if root is None or root.tag != "kanjidic2":
-            raise RuntimeError("Dictionary XML does not appear to be a KANJIDIC2 file")
-
-        dictionary: Dict[str, Dict[str, object]] = {}
-        for character in root.findall("character"):
-            literal = (character.findtext("literal") or "").strip()
-            if not literal:
-                continue
-
-            misc = character.find("misc")
-            stroke_value = ""
-            if misc is not None:
-                stroke_el = misc.find("stroke_count")
-                if stroke_el is not None and stroke_el.text:
-                    stroke_text = stroke_el.text.strip()
-                    if stroke_text.isdigit():
-                        stroke_value = int(stroke_text)
-                    else:
-                        stroke_value = stroke_text
-
-            reading_meaning = character.find("reading_meaning")
-            kunyomi: List[str] = []
-            onyomi: List[str] = []
-            meanings: List[str] = []
-
-            if reading_meaning is not None:
-                for rmgroup in reading_meaning.findall("rmgroup"):
-                    for reading in rmgroup.findall("reading"):
-                        text = (reading.text or "").strip()
-                        if not text:
-                            continue
-                        r_type = reading.get("r_type") or ""
-                        if r_type == "ja_kun":
-                            kunyomi.append(text)
-                        elif r_type == "ja_on":
-                            onyomi.append(text)
-                    for meaning in rmgroup.findall("meaning"):
-                        text = (meaning.text or "").strip()
-                        if not text:
-                            continue
-                        lang = meaning.get("m_lang")
-                        if lang and lang not in {"", "en"}:
-                            continue
-                        meanings.append(text)
-
-            frequency_value: Optional[int] = None
-            if misc is not None:
-                freq_el = misc.find("freq")
-                if freq_el is not None and freq_el.text:
-                    freq_text = freq_el.text.strip()
-                    if freq_text.isdigit():
-                        frequency_value = int(freq_text)
-
-            entry = {
-                "definition": "; ".join(dict.fromkeys(meanings)),
-                "stroke_count": stroke_value,
-                "kunyomi": list(dict.fromkeys(kunyomi)),
-                "onyomi": list(dict.fromkeys(onyomi)),
-                "frequency": frequency_value,
-            }
-            dictionary[literal] = entry
 
         if not dictionary:
             raise RuntimeError("No kanji entries were parsed from the dictionary XML")
         return dictionary
 
+    def _parse_kanjidic_character(self, character: ET.Element) -> Optional[Tuple[str, Dict[str, object]]]:
+        literal = (character.findtext("literal") or "").strip()
+        if not literal:
+            return None
+
+        misc = character.find("misc")
+        stroke_value = ""
+        if misc is not None:
+            stroke_el = misc.find("stroke_count")
+            if stroke_el is not None and stroke_el.text:
+                stroke_text = stroke_el.text.strip()
+                if stroke_text.isdigit():
+                    stroke_value = int(stroke_text)
+                else:
+                    stroke_value = stroke_text
+
+        reading_meaning = character.find("reading_meaning")
+        kunyomi: List[str] = []
+        onyomi: List[str] = []
+        meanings: List[str] = []
+
+        if reading_meaning is not None:
+            for rmgroup in reading_meaning.findall("rmgroup"):
+                for reading in rmgroup.findall("reading"):
+                    text = (reading.text or "").strip()
+                    if not text:
+                        continue
+                    r_type = reading.get("r_type") or ""
+                    if r_type == "ja_kun":
+                        kunyomi.append(text)
+                    elif r_type == "ja_on":
+                        onyomi.append(text)
+                for meaning in rmgroup.findall("meaning"):
+                    text = (meaning.text or "").strip()
+                    if not text:
+                        continue
+                    lang = meaning.get("m_lang")
+                    if lang and lang not in {"", "en"}:
+                        continue
+                    meanings.append(text)
+
+        frequency_value: Optional[int] = None
+        if misc is not None:
+            freq_el = misc.find("freq")
+            if freq_el is not None and freq_el.text:
+                freq_text = freq_el.text.strip()
+                if freq_text.isdigit():
+                    frequency_value = int(freq_text)
+
+        return literal, {
+            "definition": "; ".join(dict.fromkeys(meanings)),
+            "stroke_count": stroke_value,
+            "kunyomi": list(dict.fromkeys(kunyomi)),
+            "onyomi": list(dict.fromkeys(onyomi)),
+            "frequency": frequency_value,
+        }
+
     def _collect_vocab_usage(
         self,
         collection: Collection,
-        vocab_models: Sequence[Tuple[NotetypeDict, List[int], float]],
+        vocab_models: Sequence[Tuple[NotetypeDict, Sequence[int], float]],
         cfg: AddonConfig,
     ) -> Dict[str, KanjiUsageInfo]:
         usage: Dict[str, KanjiUsageInfo] = {}
@@ -1774,13 +2013,18 @@ class KanjiVocabRecalcManager:
             Tuple[
                 int,
                 str,
-                Set[str],
                 bool,
                 Optional[int],
                 Optional[int],
                 Tuple[int, ...],
+                int,
             ]
         ] = []
+        auto_suspend_tag_lower = cfg.auto_suspend_tag.strip().lower()
+        # Only membership of the auto-suspend tag matters here, so test the space-delimited tag string directly
+        # instead of building a lowercase tag set for every vocab note.
+        auto_suspend_needle = f" {auto_suspend_tag_lower} " if auto_suspend_tag_lower else ""
+        ignore_suspended = cfg.ignore_suspended_vocab
 
         for model, field_indexes, multiplier in vocab_models:
             if not field_indexes:
@@ -1796,7 +2040,8 @@ class KanjiVocabRecalcManager:
                 "MAX(CASE WHEN cards.type != 0 THEN 1 ELSE 0 END) AS has_reviewed, "
                 "MIN(CASE WHEN cards.queue = 0 THEN cards.due END) AS min_new_due, "
                 "MIN(CASE WHEN cards.queue = -1 THEN cards.due END) AS min_suspended_due, "
-                "MIN(CASE WHEN cards.type != 0 THEN cards.due END) AS min_review_due "
+                "MIN(CASE WHEN cards.type != 0 THEN cards.due END) AS min_review_due, "
+                "MAX(CASE WHEN cards.queue != -1 THEN 1 ELSE 0 END) AS has_active "
                 "FROM notes JOIN cards ON cards.nid = notes.id "
                 "WHERE notes.mid = ? GROUP BY notes.id"
             )
@@ -1806,11 +2051,9 @@ class KanjiVocabRecalcManager:
                 model["id"],
                 context=f"collect_vocab_usage:{model.get('name')}",
             )
-            auto_suspend_tag = cfg.auto_suspend_tag.strip()
-            auto_suspend_tag_lower = auto_suspend_tag.lower()
-            prepared_rows: List[
-                Tuple[int, str, Set[str], bool, Optional[int], Optional[int]]
-            ] = []
+            field_indexes_tuple = tuple(field_indexes)
+            # Split only as far as the last mapped field; later fields may hold long text that is never scanned.
+            field_split_limit = max(field_indexes_tuple) + 1
             for (
                 note_id,
                 flds,
@@ -1819,14 +2062,18 @@ class KanjiVocabRecalcManager:
                 min_new_due,
                 min_suspended_due,
                 min_review_due,
+                has_active,
             ) in rows:
-                tags_string = tags_text or ""
-                note_tags_lower = {tag.lower() for tag in tags_string.split() if tag}
+                auto_suspend_tagged = bool(
+                    auto_suspend_needle and tags_text and auto_suspend_needle in f" {tags_text.lower()} "
+                )
+                # Card activity comes from the same grouped query, so no second pass over cards is needed.
+                if ignore_suspended and not has_active and not auto_suspend_tagged:
+                    continue
                 new_due_value = _safe_int(min_new_due)
                 suspended_due_value = _safe_int(min_suspended_due)
                 if (
-                    auto_suspend_tag_lower
-                    and auto_suspend_tag_lower in note_tags_lower
+                    auto_suspend_tagged
                     and suspended_due_value is not None
                     and (new_due_value is None or suspended_due_value < new_due_value)
                 ):
@@ -1839,32 +2086,15 @@ class KanjiVocabRecalcManager:
                     if scaled_value < 0:
                         scaled_value = 0
                     new_due_value = scaled_value
-                review_due_value = _safe_int(min_review_due)
-                prepared_rows.append(
-                    (note_id, flds, note_tags_lower, bool(has_reviewed), new_due_value, review_due_value)
-                )
-
-            active_map: Dict[int, bool] = {}
-            if cfg.ignore_suspended_vocab and prepared_rows:
-                note_ids = [row[0] for row in prepared_rows]
-                active_map = self._load_note_active_status(collection, note_ids)
-
-            field_indexes_tuple = tuple(field_indexes)
-            for note_id, flds, note_tags_lower, reviewed_flag, new_due_value, review_due_value in prepared_rows:
-                if cfg.ignore_suspended_vocab:
-                    has_active = active_map.get(note_id, False)
-                    if not has_active:
-                        if not auto_suspend_tag_lower or auto_suspend_tag_lower not in note_tags_lower:
-                            continue
                 all_rows.append(
                     (
                         note_id,
                         flds,
-                        note_tags_lower,
-                        reviewed_flag,
+                        bool(has_reviewed),
                         new_due_value,
-                        review_due_value,
+                        _safe_int(min_review_due),
                         field_indexes_tuple,
+                        field_split_limit,
                     )
                 )
 
@@ -1872,66 +2102,64 @@ class KanjiVocabRecalcManager:
             return usage
 
         big = 10**9
-        new_rows = [row for row in all_rows if row[4] is not None]
-        new_rank_map: Dict[int, int] = {}
-        if new_rows:
-            new_rows.sort(key=lambda row: (row[4], row[0]))  # type: ignore[arg-type]
-            for idx, row in enumerate(new_rows):
-                new_rank_map[row[0]] = idx
-
-        review_rows = [row for row in all_rows if row[3]]
-        review_rank_map: Dict[int, int] = {}
-        if review_rows:
-            review_rows.sort(key=lambda row: ((row[5] if row[5] is not None else big), row[0]))
-            for idx, row in enumerate(review_rows):
-                review_rank_map[row[0]] = idx
-
         all_rows.sort(
             key=lambda row: (
-                0 if row[4] is not None else 1,
-                row[4] if row[4] is not None else big,
+                0 if row[3] is not None else 1,
+                row[3] if row[3] is not None else big,
                 row[0],
             )
         )
 
-        for note_id, flds, _note_tags_lower, reviewed_flag, new_due_value, review_due_value, field_indexes_tuple in all_rows:
-            review_rank = review_rank_map.get(note_id)
-            new_rank = new_rank_map.get(note_id)
-            fields = flds.split("\x1f")
-            seen_in_note: Set[str] = set()
+        # Ranks are kept by row position. Rows with a new-card due sort first by (due, note id), so a row's
+        # position is its new rank; review ranks come from ordering the reviewed positions by review due.
+        def _review_order(position: int) -> Tuple[int, int]:
+            row = all_rows[position]
+            return (row[4] if row[4] is not None else big, row[0])
+
+        review_positions = sorted((position for position, row in enumerate(all_rows) if row[2]), key=_review_order)
+        review_ranks: List[Optional[int]] = [None] * len(all_rows)
+        for rank, position in enumerate(review_positions):
+            review_ranks[position] = rank
+
+        usage_get = usage.get
+        for position, (
+            note_id,
+            flds,
+            reviewed_flag,
+            new_due_value,
+            review_due_value,
+            field_indexes_tuple,
+            field_split_limit,
+        ) in enumerate(all_rows):
+            fields = flds.split("\x1f", field_split_limit)
+            note_chars: List[str] = []
             for field_index in field_indexes_tuple:
-                if field_index >= len(fields):
-                    continue
-                value = fields[field_index]
-                chars = KANJI_PATTERN.findall(value)
-                if not chars:
-                    continue
-                for char in chars:
-                    info = usage.get(char)
-                    if info is None:
-                        info = KanjiUsageInfo()
-                        usage[char] = info
-                    if char not in seen_in_note:
-                        info.vocab_occurrences += 1
-                        seen_in_note.add(char)
-                    if reviewed_flag:
-                        info.reviewed = True
-                        if review_rank is not None and (
-                            info.first_review_order is None or review_rank < info.first_review_order
-                        ):
-                            info.first_review_order = review_rank
-                        if review_due_value is not None and (
-                            info.first_review_due is None or review_due_value < info.first_review_due
-                        ):
-                            info.first_review_due = review_due_value
-                    if new_due_value is not None and (
-                        info.first_new_due is None or new_due_value < info.first_new_due
+                if field_index < len(fields):
+                    note_chars.extend(_find_kanji(fields[field_index]))
+            if not note_chars:
+                continue
+            review_rank = review_ranks[position]
+            # Every update below is idempotent within a note, so visit each distinct kanji once. Rows arrive in
+            # new-due order, so the first row with a new due already carries each kanji's minimum due and rank.
+            for char in dict.fromkeys(note_chars):
+                info = usage_get(char)
+                if info is None:
+                    info = KanjiUsageInfo()
+                    usage[char] = info
+                info.vocab_occurrences += 1
+                if reviewed_flag:
+                    info.reviewed = True
+                    if review_rank is not None and (
+                        info.first_review_order is None or review_rank < info.first_review_order
                     ):
-                        info.first_new_due = new_due_value
-                    if new_rank is not None and (
-                        info.first_new_order is None or new_rank < info.first_new_order
+                        info.first_review_order = review_rank
+                    if review_due_value is not None and (
+                        info.first_review_due is None or review_due_value < info.first_review_due
                     ):
-                        info.first_new_order = new_rank
+                        info.first_review_due = review_due_value
+                if new_due_value is not None and info.first_new_order is None:
+                    info.first_new_due = new_due_value
+                    info.first_new_order = position
         return usage
 
     def _notify_summary(self, stats: Dict[str, object]) -> None:
@@ -1992,8 +2220,10 @@ class KanjiVocabRecalcManager:
             context="index_existing_kanji_notes",
         )
         mapping: Dict[str, int] = {}
+        # Stop splitting right after the kanji field; the remaining fields (definitions, readings) are never read.
+        split_limit = kanji_field_index + 1
         for note_id, flds in rows:
-            fields = flds.split("\x1f")
+            fields = flds.split("\x1f", split_limit)
             if kanji_field_index >= len(fields):
                 continue
             value = fields[kanji_field_index].strip()
@@ -2007,7 +2237,16 @@ class KanjiVocabRecalcManager:
         kanji_model: NotetypeDict,
         kanji_field_index: int,
     ) -> Dict[str, int]:
-        key = (kanji_model["id"], kanji_field_index)
+        # Notes added, edited or deleted outside the add-on change the count or newest mod, so include both in
+        # the key; an unchanged collection reuses the index without rescanning every kanji note.
+        marker_rows = _db_all(
+            collection,
+            "SELECT COUNT(*), MAX(mod) FROM notes WHERE mid = ?",
+            kanji_model["id"],
+            context="get_existing_kanji_notes/marker",
+        )
+        count, max_mod = marker_rows[0] if marker_rows else (0, 0)
+        key = (kanji_model["id"], kanji_field_index, int(count or 0), int(max_mod or 0))
         cache = self._existing_notes_cache
         if cache and cache.get("key") == key:
             return cache["mapping"]
@@ -2015,14 +2254,21 @@ class KanjiVocabRecalcManager:
         self._existing_notes_cache = {"key": key, "mapping": mapping}
         return mapping
 
-    def _ensure_note_tagged(self, collection: Collection, note_id: int, tag: str) -> Tuple[bool, Note]:
+    def _ensure_note_tagged(
+        self,
+        collection: Collection,
+        note_id: int,
+        tag: str,
+        flush: bool = True,
+    ) -> Tuple[bool, Note]:
         note = _get_note(collection, note_id)
         if not tag:
             return False, note
         if tag in note.tags:
             return False, note
         _add_tag(note, tag)
-        note.flush()
+        if flush:
+            note.flush()
         return True, note
 
     def _apply_bucket_tag_to_note(
@@ -2043,11 +2289,12 @@ class KanjiVocabRecalcManager:
         changed = False
 
         for tag in active_bucket_tags:
-            if not tag:
+            tag_lower = tag.strip().lower()
+            if not tag_lower:
                 continue
-            if target_lower and tag.lower() == target_lower:
+            if target_lower and tag_lower == target_lower:
                 continue
-            if _remove_tag_case_insensitive(note, tag):
+            if _remove_tag_case_insensitive_prepared(note, tag_lower):
                 changed = True
 
         if target_tag:
@@ -2060,23 +2307,73 @@ class KanjiVocabRecalcManager:
             note.flush()
         return changed
 
+    def _apply_bucket_tags(
+        self,
+        collection: Collection,
+        note_buckets: Dict[int, Optional[int]],
+        note_tags: Dict[int, str],
+        bucket_tag_map: Dict[int, str],
+        active_bucket_tags: Set[str],
+    ) -> int:
+        tag_manager = getattr(collection, "tags", None)
+        bulk_add = getattr(tag_manager, "bulk_add", None)
+        bulk_remove = getattr(tag_manager, "bulk_remove", None)
+        if not callable(bulk_add) or not callable(bulk_remove):
+            updated = 0
+            for note_id, bucket_id in note_buckets.items():
+                if self._apply_bucket_tag_to_note(
+                    collection,
+                    note_id,
+                    bucket_id,
+                    bucket_tag_map,
+                    active_bucket_tags,
+                ):
+                    updated += 1
+            return updated
+
+        # Work out every change from the tag strings already loaded, then let Anki apply each tag in one call
+        # instead of loading and flushing every note.
+        active_lower = {tag.lower(): tag for tag in active_bucket_tags if tag}
+        removals: Dict[str, List[int]] = defaultdict(list)
+        additions: Dict[str, List[int]] = defaultdict(list)
+        changed_notes: Set[int] = set()
+        for note_id, bucket_id in note_buckets.items():
+            target_tag = bucket_tag_map.get(bucket_id, "") if bucket_id is not None else ""
+            target_lower = target_tag.lower()
+            existing_lower = {value.lower() for value in (note_tags.get(note_id) or "").split()}
+            for tag_lower, tag in active_lower.items():
+                if tag_lower != target_lower and tag_lower in existing_lower:
+                    removals[tag].append(note_id)
+                    changed_notes.add(note_id)
+            if target_tag and target_lower not in existing_lower:
+                additions[target_tag].append(note_id)
+                changed_notes.add(note_id)
+
+        for tag, note_ids in removals.items():
+            bulk_remove(note_ids, tag)
+        for tag, note_ids in additions.items():
+            bulk_add(note_ids, tag)
+        return len(changed_notes)
+
     def _find_notes_with_bucket_tags(
         self,
         collection: Collection,
         active_bucket_tags: Set[str],
-    ) -> Set[int]:
+    ) -> Dict[int, str]:
         if not active_bucket_tags:
-            return set()
+            return {}
 
         clauses = []
         params: List[object] = []
         for tag in active_bucket_tags:
             if not tag:
                 continue
-            clauses.append("tags LIKE ?")
-            params.append(f"%{tag}%")
+            # Anki stores tags space-delimited with surrounding spaces, so anchor each pattern on the delimiters
+            # to avoid pulling in notes whose tags merely contain the bucket tag as a substring.
+            clauses.append("tags LIKE ? ESCAPE '\\'")
+            params.append(f"% {_escape_like(tag)} %")
         if not clauses:
-            return set()
+            return {}
 
         sql = f"SELECT id, tags FROM notes WHERE {' OR '.join(clauses)}"
         rows = _db_all(
@@ -2086,14 +2383,13 @@ class KanjiVocabRecalcManager:
             context="find_notes_with_bucket_tags",
         )
 
-        tag_lower_map = {tag.lower(): tag for tag in active_bucket_tags if tag}
-        result: Set[int] = set()
-        for note_id, tags in rows:
-            tag_set = {value for value in tags.strip().split() if value}
-            lower_values = {value.lower() for value in tag_set}
-            if lower_values & set(tag_lower_map.keys()):
-                result.add(note_id)
-        return result
+        # One case-insensitive alternation anchored on whitespace confirms whole-tag matches per row without
+        # splitting and lowercasing every tag string.
+        matcher = re.compile(
+            r"(?:^|\s)(?:" + "|".join(re.escape(tag) for tag in active_bucket_tags if tag) + r")(?=\s|$)",
+            re.IGNORECASE,
+        ).search
+        return {note_id: tags for note_id, tags in rows if matcher(tags)}
 
     def _update_kanji_status_tags(
         self,
@@ -2101,7 +2397,8 @@ class KanjiVocabRecalcManager:
         cfg: AddonConfig,
         has_vocab: bool,
         has_reviewed_vocab: bool,
-    ) -> None:
+        flush: bool = True,
+    ) -> bool:
         only_new_tag = cfg.only_new_vocab_tag.strip()
         no_vocab_tag = cfg.no_vocab_tag.strip()
         desired: Set[str] = set()
@@ -2126,8 +2423,9 @@ class KanjiVocabRecalcManager:
                     changed = True
                     existing_lower.add(tag.lower())
 
-        if changed:
+        if changed and flush:
             note.flush()
+        return changed
 
     def _remove_unused_tags(
         self,
@@ -2142,7 +2440,7 @@ class KanjiVocabRecalcManager:
         scheduling_field_name: Optional[str] = None,
     ) -> Tuple[int, int]:
         removed = 0
-        resuspended_total = 0
+        resuspend_note_ids: List[int] = []
         created_tag = cfg.created_tag.strip()
         created_tag_lower = created_tag.lower() if created_tag else ""
         unsuspend_clean = (unsuspend_tag or "").strip()
@@ -2182,17 +2480,19 @@ class KanjiVocabRecalcManager:
             if created_tag_lower and created_tag_lower in tag_lookup:
                 resuspend_needed = True
             if resuspend_needed:
-                resuspended = _resuspend_note_cards(collection, note)
-                if resuspended:
-                    resuspended_total += resuspended
-            self._update_kanji_status_tags(
+                resuspend_note_ids.append(note.id)
+            if self._update_kanji_status_tags(
                 note,
                 cfg,
                 has_vocab=False,
                 has_reviewed_vocab=False,
-            )
+                flush=False,
+            ):
+                changed = True
             if changed:
                 note.flush()
+        # Suspend the cards of every pruned note with one query per batch instead of one per note.
+        resuspended_total = _resuspend_notes_cards(collection, resuspend_note_ids)
         return removed, resuspended_total
 
     def _reorder_new_kanji_cards(
@@ -2204,14 +2504,15 @@ class KanjiVocabRecalcManager:
         usage_info: Dict[str, KanjiUsageInfo],
         dictionary: Dict[str, Dict[str, object]],
     ) -> Dict[str, int]:
-        mode = cfg.reorder_mode
-        if mode not in {"frequency", "vocab", "vocab_frequency"}:
+        # Resolve the per-mode key builder once instead of branching on the mode for every card.
+        build_key = _REORDER_KEY_BUILDERS.get(cfg.reorder_mode)
+        if build_key is None:
             return {"cards_reordered": 0, "bucket_tags_updated": 0}
 
         rows = _db_all(
             collection,
             """
-            SELECT cards.id, cards.nid, cards.due, cards.did, cards.mod, cards.usn, notes.flds
+            SELECT cards.id, cards.nid, cards.due, cards.did, cards.mod, cards.usn, notes.flds, notes.tags
             FROM cards
             JOIN notes ON notes.id = cards.nid
             WHERE notes.mid = ? AND cards.queue = 0
@@ -2231,34 +2532,31 @@ class KanjiVocabRecalcManager:
         apply_bucket_tags = bool(active_bucket_tags)
 
         entries: List[Tuple[Tuple, int, int, int, int, int, int]] = []
-        for card_id, note_id, due_value, deck_id, original_mod, original_usn, flds in rows:
-            fields = flds.split("\x1f")
+        note_tags: Dict[int, str] = {}
+        kanji_split_limit = kanji_field_index + 1
+        usage_get = usage_info.get
+        dictionary_get = dictionary.get
+        # Shared stand-in for kanji without vocab usage; the key builders only read it.
+        no_usage = KanjiUsageInfo()
+        for card_id, note_id, due_value, deck_id, original_mod, original_usn, flds, tags in rows:
+            note_tags[note_id] = tags
+            fields = flds.split("\x1f", kanji_split_limit)
             if kanji_field_index >= len(fields):
                 continue
             kanji_char = fields[kanji_field_index].strip()
             if not kanji_char:
                 continue
-            info = usage_info.get(kanji_char)
-            has_vocab = True
-            if info is None:
-                info = KanjiUsageInfo()
-                has_vocab = False
-            entry = dictionary.get(kanji_char) or {}
-            freq_val = entry.get("frequency")
+            info = usage_get(kanji_char, no_usage)
+            has_vocab = info is not no_usage
+            entry = dictionary_get(kanji_char)
+            freq_val = entry.get("frequency") if entry else None
             freq = None
             if isinstance(freq_val, int):
                 freq = freq_val
             elif isinstance(freq_val, str) and freq_val.isdigit():
                 freq = int(freq_val)
 
-            key, bucket_id = self._build_reorder_key(
-                mode,
-                info,
-                freq,
-                due_value,
-                card_id,
-                has_vocab,
-            )
+            key, bucket_id = build_key(info, freq, due_value, card_id, has_vocab)
             entries.append((key, card_id, due_value, original_mod, original_usn, note_id, bucket_id))
 
         if not entries:
@@ -2266,52 +2564,42 @@ class KanjiVocabRecalcManager:
 
         now = intTime()
         usn = collection.usn()
-        entries.sort(key=lambda item: item[0])
-        processed_notes: Set[int] = set()
-        reordered_cards = 0
-        bucket_updates = 0
+        # Keys end in the card id, so they are unique and the C-level itemgetter is all the sort needs.
+        entries.sort(key=itemgetter(0))
+        note_buckets: Dict[int, Optional[int]] = {}
+        due_updates: List[Tuple[int, int, int, int]] = []
         for new_due, (key, card_id, original_due, original_mod, original_usn, note_id, bucket_id) in enumerate(entries):
-            due_changed = new_due != original_due
-            if due_changed:
-                reordered_cards += 1
-            new_mod = now if due_changed else original_mod
-            new_usn = usn if due_changed else original_usn
-            _db_execute(
-                collection,
-                "UPDATE cards SET due = ?, mod = ?, usn = ? WHERE id = ?",
-                new_due,
-                new_mod,
-                new_usn,
-                card_id,
-                context="reorder_new_kanji_cards/update",
-            )
-            if apply_bucket_tags and note_id not in processed_notes:
-                if self._apply_bucket_tag_to_note(
-                    collection,
-                    note_id,
-                    bucket_id,
-                    bucket_tag_map,
-                    active_bucket_tags,
-                ):
-                    bucket_updates += 1
-                processed_notes.add(note_id)
+            if new_due != original_due:
+                due_updates.append((new_due, now, usn, card_id))
+            if apply_bucket_tags and note_id not in note_buckets:
+                note_buckets[note_id] = bucket_id
 
+        bucket_updates = 0
         if apply_bucket_tags:
             tagged_notes = self._find_notes_with_bucket_tags(collection, active_bucket_tags)
-            for note_id in tagged_notes:
-                if note_id in processed_notes:
-                    continue
-                if self._apply_bucket_tag_to_note(
+            for note_id, tags in tagged_notes.items():
+                if note_id not in note_buckets:
+                    note_buckets[note_id] = None
+                    note_tags[note_id] = tags
+            with self._keeping_vocab_char_index(collection):
+                bucket_updates = self._apply_bucket_tags(
                     collection,
-                    note_id,
-                    None,
+                    note_buckets,
+                    note_tags,
                     bucket_tag_map,
                     active_bucket_tags,
-                ):
-                    bucket_updates += 1
+                )
+
+        if due_updates:
+            _db_executemany(
+                collection,
+                "UPDATE cards SET due = ?, mod = ?, usn = ? WHERE id = ?",
+                due_updates,
+                context="reorder_new_kanji_cards/update",
+            )
 
         return {
-            "cards_reordered": reordered_cards,
+            "cards_reordered": len(due_updates),
             "bucket_tags_updated": bucket_updates,
         }
 
@@ -2324,67 +2612,9 @@ class KanjiVocabRecalcManager:
         card_id: int,
         has_vocab: bool,
     ) -> Tuple[Tuple, int]:
-        big = 10**9
-        review_due = info.first_review_due if info.first_review_due is not None else big
-        new_due_raw = info.first_new_due
-        vocab_due = new_due_raw if new_due_raw is not None else big
-        due_sort = due_value if due_value is not None else big
-        has_frequency = frequency is not None
-        freq_value = frequency if has_frequency else big
-        vocab_count = info.vocab_occurrences if has_vocab else 0
-        review_rank = info.first_review_order if info.first_review_order is not None else big
-        new_rank = info.first_new_order if info.first_new_order is not None else big
-
-        if has_vocab and info.reviewed:
-            sort_tuple: Tuple = (
-                0,
-                review_due,
-                -vocab_count,
-                freq_value,
-                review_rank,
-                due_sort,
-                card_id,
-            )
-            bucket_id = 0
-        elif has_vocab:
-            sort_tuple = (
-                1,
-                vocab_due,
-                -vocab_count,
-                freq_value,
-                new_rank,
-                due_sort,
-                card_id,
-            )
-            bucket_id = 1
-        else:
-            sort_tuple = (
-                2,
-                0 if has_frequency else 1,
-                freq_value,
-                due_sort,
-                card_id,
-            )
-            bucket_id = 2
-
-        if mode == "vocab_frequency":
-            return (-vocab_count, *sort_tuple), bucket_id
-
-        if mode == "frequency":
-            if has_frequency:
-                return (
-                    0,
-                    freq_value,
-                    card_id,
-                ), bucket_id
-            return (
-                1,
-                due_sort,
-                card_id,
-            ), bucket_id
-
-        # mode == "vocab"
-        return sort_tuple, bucket_id
+        # Unknown modes keep the vocab ordering, as before the builders were split out.
+        build_key = _REORDER_KEY_BUILDERS.get(mode, _REORDER_KEY_BUILDERS["vocab"])
+        return build_key(info, frequency, due_value, card_id, has_vocab)
 
     def _apply_kanji_updates(
         self,
@@ -2405,7 +2635,7 @@ class KanjiVocabRecalcManager:
             "existing_tagged": 0,
             "created": 0,
             "unsuspended": 0,
-            "missing_dictionary": set(),
+            "missing_dictionary": [],
             "tag_removed": 0,
             "resuspended": 0,
             "vocab_suspended": 0,
@@ -2417,6 +2647,8 @@ class KanjiVocabRecalcManager:
 
         if existing_notes is None:
             existing_notes = self._get_existing_kanji_notes(collection, kanji_model, kanji_field_index)
+        # Decks may have been renamed or removed since the last run.
+        self._deck_name_to_id_cache = None
 
         unsuspend_tag = cfg.unsuspended_tag
         frequency_field_name: Optional[str] = None
@@ -2437,45 +2669,75 @@ class KanjiVocabRecalcManager:
                 if isinstance(scheduling_name, str):
                     scheduling_field_name = scheduling_name
 
-        for kanji_char in unique_chars:
+        # Split the kanji by what happens to them up front so each pass below only handles one case.
+        existing_chars = unique_chars & existing_notes.keys()
+        new_entries: Dict[str, Dict[str, object]] = {}
+        # unique_chars is already deduplicated, so missing kanji can be collected in a plain list.
+        missing_dictionary: List[str] = stats["missing_dictionary"]
+        for kanji_char in unique_chars - existing_chars:
             dictionary_entry = dictionary.get(kanji_char)
-            info = usage_info.get(kanji_char) if usage_info else None
-            if kanji_char in existing_notes:
-                note_id = existing_notes[kanji_char]
-                tagged, note = self._ensure_note_tagged(collection, note_id, cfg.existing_tag)
-                if tagged:
-                    stats["existing_tagged"] += 1
-                unsuspended = self._unsuspend_note_cards_if_needed(collection, note, unsuspend_tag)
-                if unsuspended:
-                    stats["unsuspended"] += unsuspended
-                note_changed = False
-                if frequency_field_name and isinstance(dictionary_entry, dict):
-                    if self._update_frequency_field(note, frequency_field_name, dictionary_entry.get("frequency")):
-                        note_changed = True
-                if self._update_scheduling_info_field(
-                    note,
-                    scheduling_field_name,
-                    kanji_char,
-                    cfg,
-                    dictionary_entry if isinstance(dictionary_entry, dict) else None,
-                    info,
-                ):
-                    note_changed = True
-                if info is not None:
-                    self._update_kanji_status_tags(
-                        note,
-                        cfg,
-                        has_vocab=True,
-                        has_reviewed_vocab=info.reviewed,
-                    )
-                if note_changed:
-                    note.flush()
-                continue
-
             if dictionary_entry is None:
-                stats["missing_dictionary"].add(kanji_char)
-                continue
+                missing_dictionary.append(kanji_char)
+            else:
+                new_entries[kanji_char] = dictionary_entry
+        usage_get = usage_info.get if usage_info else None
+
+        # Load card queues for every existing note up front instead of one query per note.
+        card_status = (
+            self._load_card_status_for_notes(collection, [existing_notes[char] for char in existing_chars])
+            if existing_chars
+            else {}
+        )
+        leech_lower = self._leech_tag_lower(collection)
+        for kanji_char in existing_chars:
+            dictionary_entry = dictionary.get(kanji_char)
+            if not isinstance(dictionary_entry, dict):
+                dictionary_entry = None
+            info = usage_get(kanji_char) if usage_get else None
+            note_id = existing_notes[kanji_char]
+            # Tag edits below are saved together with any field updates in a single flush per note.
+            tagged, note = self._ensure_note_tagged(collection, note_id, cfg.existing_tag, flush=False)
+            note_changed = tagged
+            if tagged:
+                stats["existing_tagged"] += 1
+            unsuspended, unsuspend_tagged = self._unsuspend_note_cards_if_needed(
+                collection,
+                note,
+                unsuspend_tag,
+                card_status.get(note_id, ()),
+                leech_lower,
+                flush=False,
+            )
+            stats["unsuspended"] += unsuspended
+            if unsuspend_tagged:
+                note_changed = True
+            if frequency_field_name and dictionary_entry is not None:
+                if self._update_frequency_field(note, frequency_field_name, dictionary_entry.get("frequency")):
+                    note_changed = True
+            if self._update_scheduling_info_field(
+                note,
+                scheduling_field_name,
+                kanji_char,
+                cfg,
+                dictionary_entry,
+                info,
+            ):
+                note_changed = True
+            if info is not None and self._update_kanji_status_tags(
+                note,
+                cfg,
+                has_vocab=True,
+                has_reviewed_vocab=info.reviewed,
+                flush=False,
+            ):
+                note_changed = True
+            if note_changed:
+                note.flush()
 
+        # Every note created in this run lands in the same deck, so resolve it once.
+        new_deck_id = self._resolve_deck_id(collection, kanji_model, cfg) if new_entries else None
+        for kanji_char, dictionary_entry in new_entries.items():
+            info = usage_get(kanji_char) if usage_get else None
             created_note_id = self._create_kanji_note(
                 collection,
                 kanji_model,
@@ -2486,6 +2748,7 @@ class KanjiVocabRecalcManager:
                 cfg.created_tag,
                 cfg,
                 info,
+                deck_id=new_deck_id,
             )
             if created_note_id:
                 stats["created"] += 1
@@ -2523,75 +2786,46 @@ class KanjiVocabRecalcManager:
     ) -> Dict[str, KanjiIntervalStatus]:
         if not existing_notes:
             return {}
-        note_ids = list(dict.fromkeys(existing_notes.values()))
+        # Sorted ids let SQLite walk the cards nid index in order for each IN batch.
+        note_ids = sorted(set(existing_notes.values()))
         if not note_ids:
             return {}
-        rows: List[Tuple[int, int, int]] = []
+        status_by_note: Dict[int, KanjiIntervalStatus] = {}
         for batch_index, batch_ids in enumerate(_chunk_sequence(note_ids, SQLITE_MAX_VARIABLES)):
-            placeholders = ",".join("?" for _ in batch_ids)
-            rows.extend(
-                _db_all(
-                    collection,
-                    (
-                        "SELECT nid, "
-                        "MAX(CASE WHEN type != 0 THEN 1 ELSE 0 END) AS reviewed_flag, "
-                        "MAX(CASE WHEN type != 0 THEN ivl ELSE 0 END) AS max_interval "
-                        f"FROM cards WHERE nid IN ({placeholders}) GROUP BY nid"
-                    ),
-                    *batch_ids,
-                    context=f"compute_kanji_interval_status/batch{batch_index}",
-                )
-            )
-        status_rows: Dict[int, Tuple[int, int]] = {}
-        for nid, reviewed_flag, max_interval in rows:
-            status_rows[nid] = (reviewed_flag, max_interval)
-
-        historical_max_by_note: Dict[int, int] = {}
-        for batch_index, batch_ids in enumerate(_chunk_sequence(note_ids, SQLITE_MAX_VARIABLES)):
-            placeholders = ",".join("?" for _ in batch_ids)
-            historical_rows = _db_all(
+            placeholders = _sql_placeholders(len(batch_ids))
+            rows = _db_all(
                 collection,
                 (
                     "SELECT cards.nid, "
-                    "MAX(CASE WHEN revlog.ivl > 0 THEN revlog.ivl ELSE 0 END) AS max_revlog_interval "
+                    "MAX(CASE WHEN cards.type != 0 THEN 1 ELSE 0 END) AS reviewed_flag, "
+                    "MAX(CASE WHEN cards.type != 0 THEN cards.ivl ELSE 0 END) AS max_interval, "
+                    "COALESCE(MAX(CASE WHEN revlog.ivl > 0 THEN revlog.ivl ELSE 0 END), 0) AS max_revlog_interval "
                     "FROM cards "
-                    "JOIN revlog ON revlog.cid = cards.id "
+                    "LEFT JOIN revlog ON revlog.cid = cards.id "
                     f"WHERE cards.nid IN ({placeholders}) "
                     "GROUP BY cards.nid"
                 ),
                 *batch_ids,
                 context=f"compute_kanji_interval_status/revlog_batch{batch_index}",
             )
-            for nid, max_revlog_interval in historical_rows:
+            for nid, reviewed_flag, max_interval, max_revlog_interval in rows:
                 try:
-                    historical_max_by_note[nid] = int(max_revlog_interval)
+                    current_interval = int(max_interval)
                 except Exception:
-                    historical_max_by_note[nid] = 0
-
-        status_by_note: Dict[int, KanjiIntervalStatus] = {}
-        for note_id in note_ids:
-            reviewed_flag, max_interval = status_rows.get(note_id, (0, 0))
-            has_review_card = bool(reviewed_flag)
-            try:
-                current_interval = int(max_interval)
-            except Exception:
-                current_interval = 0
-            if current_interval < 0:
-                current_interval = 0
-            historical_interval_raw = historical_max_by_note.get(note_id, 0)
-            try:
-                historical_interval = int(historical_interval_raw)
-            except Exception:
-                historical_interval = 0
-            if historical_interval < 0:
-                historical_interval = 0
-            if historical_interval <= 0 or historical_interval < current_interval:
-                historical_interval = current_interval
-            status_by_note[note_id] = KanjiIntervalStatus(
-                has_review_card=has_review_card,
-                current_interval=current_interval,
-                historical_interval=historical_interval,
-            )
+                    current_interval = 0
+                if current_interval < 0:
+                    current_interval = 0
+                try:
+                    historical_interval = int(max_revlog_interval)
+                except Exception:
+                    historical_interval = 0
+                if historical_interval < current_interval:
+                    historical_interval = current_interval
+                status_by_note[nid] = KanjiIntervalStatus(
+                    has_review_card=bool(reviewed_flag),
+                    current_interval=current_interval,
+                    historical_interval=historical_interval,
+                )
 
         return {
             char: status_by_note.get(note_id, KanjiIntervalStatus())
@@ -2603,47 +2837,133 @@ class KanjiVocabRecalcManager:
         collection: Collection,
         model_id: int,
         target_chars: Optional[Set[str]] = None,
-    ) -> List[Tuple[int, str, str]]:
+    ) -> List[Tuple[int, int, str, str]]:
         if not target_chars:
             return _db_all(
                 collection,
-                "SELECT id, flds, tags FROM notes WHERE mid = ?",
+                "SELECT id, mod, flds, tags FROM notes WHERE mid = ?",
                 model_id,
                 context="fetch_vocab_rows/all",
             )
-        chars = [char for char in target_chars if char]
-        if not chars:
+        # A single kanji (the usual realtime case) is cheaper to find with one instr() scan than by rebuilding a
+        # stale index, which has to regex every note; the rebuild is left to the next multi-kanji lookup.
+        single_char = next(iter(target_chars)) if len(target_chars) == 1 else None
+        index = self._get_vocab_char_index(collection, model_id, build=single_char is None)
+        if index is None:
+            return _db_all(
+                collection,
+                "SELECT id, mod, flds, tags FROM notes WHERE mid = ? AND instr(flds, ?) > 0",
+                model_id,
+                single_char,
+                context="fetch_vocab_rows/single",
+            )
+        note_ids: Set[int] = set()
+        for char in target_chars:
+            hits = index.get(char)
+            if hits:
+                note_ids.update(hits)
+        if not note_ids:
             return []
-        clause = " OR ".join("instr(notes.flds, ?) > 0" for _ in chars)
-        params: List[object] = [model_id, *chars]
-        sql = f"SELECT id, flds, tags FROM notes WHERE mid = ? AND ({clause})"
-        return _db_all(
+        rows: List[Tuple[int, int, str, str]] = []
+        for batch_index, batch_ids in enumerate(_chunk_sequence(sorted(note_ids), SQLITE_MAX_VARIABLES)):
+            placeholders = _sql_placeholders(len(batch_ids))
+            rows.extend(
+                _db_all(
+                    collection,
+                    f"SELECT id, mod, flds, tags FROM notes WHERE id IN ({placeholders})",
+                    *batch_ids,
+                    context=f"fetch_vocab_rows/batch{batch_index}",
+                )
+            )
+        return rows
+
+    def _get_vocab_char_index(
+        self,
+        collection: Collection,
+        model_id: int,
+        build: bool = True,
+    ) -> Optional[Dict[str, Set[int]]]:
+        # Same invalidation as the existing kanji note index: any add, edit or delete moves the count or newest mod.
+        marker = self._vocab_note_marker(collection, model_id)
+        cache = self._vocab_char_index
+        cached = cache.get(model_id)
+        if cached is not None and cached[0] == marker:
+            return cached[1]
+        if not build:
+            return None
+        index: Dict[str, Set[int]] = defaultdict(set)
+        for note_id, flds in _db_all(
             collection,
-            sql,
-            *params,
-            context="fetch_vocab_rows/filter",
+            "SELECT id, flds FROM notes WHERE mid = ?",
+            model_id,
+            context="vocab_char_index/build",
+        ):
+            for char in set(_find_kanji(flds)):
+                index[char].add(note_id)
+        mapping = dict(index)
+        cache[model_id] = (marker, mapping)
+        return mapping
+
+    def _vocab_note_marker(self, collection: Collection, model_id: int) -> Tuple[int, int]:
+        marker_rows = _db_all(
+            collection,
+            "SELECT COUNT(*), MAX(mod) FROM notes WHERE mid = ?",
+            model_id,
+            context="vocab_char_index/marker",
         )
+        count, max_mod = marker_rows[0] if marker_rows else (0, 0)
+        return int(count or 0), int(max_mod or 0)
+
+    @contextmanager
+    def _keeping_vocab_char_index(self, collection: Collection) -> Iterator[None]:
+        # Tag writes move a note's mod but never its fields, so a char index that was current before this add-on's
+        # own tag edits still holds afterwards; only its marker is moved along instead of rebuilding it.
+        cache = self._vocab_char_index
+        current = [
+            model_id
+            for model_id, (marker, _) in cache.items()
+            if self._vocab_note_marker(collection, model_id) == marker
+        ]
+        yield
+        for model_id in current:
+            cached = cache.get(model_id)
+            if cached is not None:
+                cache[model_id] = (self._vocab_note_marker(collection, model_id), cached[1])
 
     def _collect_vocab_note_chars(
         self,
         collection: Collection,
-        vocab_field_map: Dict[int, List[int]],
+        vocab_field_map: Dict[int, Sequence[int]],
         target_chars: Optional[Set[str]] = None,
-    ) -> Dict[int, Tuple[Set[str], Set[str]]]:
-        result: Dict[int, Tuple[Set[str], Set[str]]] = {}
+    ) -> Dict[int, Tuple[FrozenSet[str], Set[str]]]:
+        result: Dict[int, Tuple[FrozenSet[str], Set[str]]] = {}
+        # Note mod changes on every edit, so a note's kanji are only re-extracted after it was edited.
+        cache = self._vocab_note_chars_cache
+        target_list = list(target_chars) if target_chars else []
         for model_id, field_indexes in vocab_field_map.items():
             if not field_indexes:
                 continue
             rows = self._fetch_vocab_rows(collection, model_id, target_chars)
             if not rows:
                 continue
-            for note_id, flds, tags in rows:
-                fields = flds.split("\x1f")
-                chars: Set[str] = set()
-                for field_index in field_indexes:
-                    if field_index >= len(fields):
+            field_key = tuple(field_indexes)
+            field_split_limit = max(field_indexes) + 1
+            for note_id, mod, flds, tags in rows:
+                cached = cache.get(note_id)
+                if cached is not None and cached[0] == mod and cached[1] == field_key:
+                    chars = cached[2]
+                else:
+                    fields = flds.split("\x1f", field_split_limit)
+                    values = [fields[field_index] for field_index in field_indexes if field_index < len(fields)]
+                    # The char index matches targets anywhere in flds; a plain substring test on the configured
+                    # fields rules out notes whose match sits in another field without running the regex.
+                    if target_list and not any(char in value for value in values for char in target_list):
                         continue
-                    chars.update(KANJI_PATTERN.findall(fields[field_index]))
+                    found: Set[str] = set()
+                    for value in values:
+                        found.update(_find_kanji(value))
+                    chars = frozenset(found)
+                    cache[note_id] = (mod, field_key, chars)
                 if not chars:
                     continue
                 if target_chars and chars.isdisjoint(target_chars):
@@ -2657,55 +2977,27 @@ class KanjiVocabRecalcManager:
         collection: Collection,
         note_ids: Sequence[int],
     ) -> Dict[int, List[Tuple[int, int, int]]]:
-        unique_ids = list(dict.fromkeys(note_ids))
+        unique_ids = sorted(set(note_ids))
         if not unique_ids:
             return {}
-        rows: List[Tuple[int, int, int, int]] = []
-        for batch_index, batch_ids in enumerate(_chunk_sequence(unique_ids, SQLITE_MAX_VARIABLES)):
-            placeholders = ",".join("?" for _ in batch_ids)
-            rows.extend(
-                _db_all(
-                    collection,
-                    f"SELECT id, nid, queue, type FROM cards WHERE nid IN ({placeholders})",
-                    *batch_ids,
-                    context=f"load_card_status_for_notes/batch{batch_index}",
-                )
-            )
         card_map: Dict[int, List[Tuple[int, int, int]]] = defaultdict(list)
-        for card_id, nid, queue, ctype in rows:
-            card_map[nid].append((card_id, queue, ctype))
-        return card_map
-
-    def _load_note_active_status(
-        self,
-        collection: Collection,
-        note_ids: Sequence[int],
-    ) -> Dict[int, bool]:
-        unique_ids = list(dict.fromkeys(note_ids))
-        if not unique_ids:
-            return {}
-        rows: List[Tuple[int, int]] = []
         for batch_index, batch_ids in enumerate(_chunk_sequence(unique_ids, SQLITE_MAX_VARIABLES)):
-            placeholders = ",".join("?" for _ in batch_ids)
-            sql = (
-                "SELECT nid, MAX(CASE WHEN queue != -1 THEN 1 ELSE 0 END) "
-                f"FROM cards WHERE nid IN ({placeholders}) GROUP BY nid"
-            )
-            rows.extend(
-                _db_all(
-                    collection,
-                    sql,
-                    *batch_ids,
-                    context=f"load_note_active_status/batch{batch_index}",
-                )
-            )
-        return {nid: bool(flag) for nid, flag in rows}
+            placeholders = _sql_placeholders(len(batch_ids))
+            # Each batch is folded into the map straight away rather than collecting every card row first.
+            for card_id, nid, queue, ctype in _db_all(
+                collection,
+                f"SELECT id, nid, queue, type FROM cards WHERE nid IN ({placeholders})",
+                *batch_ids,
+                context=f"load_card_status_for_notes/batch{batch_index}",
+            ):
+                card_map[nid].append((card_id, queue, ctype))
+        return card_map
 
     def _update_vocab_suspension(
         self,
         collection: Collection,
         cfg: AddonConfig,
-        vocab_field_map: Dict[int, List[int]],
+        vocab_field_map: Dict[int, Sequence[int]],
         existing_notes: Dict[str, int],
         target_chars: Optional[Set[str]] = None,
     ) -> Dict[str, int]:
@@ -2735,7 +3027,40 @@ class KanjiVocabRecalcManager:
         kanji_status = self._compute_kanji_interval_status(collection, existing_notes)
         card_map = self._load_card_status_for_notes(collection, notes_info.keys())
 
+        # Each verdict depends only on the kanji, so settle it once per kanji rather than once per note using it.
+        known_for_unreviewed: Set[str] = set()
+        known_for_reviewed: Set[str] = set()
+        low_interval_chars: Set[str] = set()
+        check_low_interval = bool(low_interval_tag) and threshold > 0
+        resuspend_reviewed = cfg.resuspend_reviewed_low_interval
+        auto_suspend = cfg.auto_suspend_vocab
+        # Debug payloads sort each note's kanji, so only build them when debug logging is on.
+        debug_enabled = self._debug_enabled
+        for char, status in kanji_status.items():
+            below_current = threshold > 0 and status.current_interval < threshold
+            if status.has_review_card and not below_current:
+                known_for_unreviewed.add(char)
+            elif check_low_interval and status.has_review_card:
+                low_interval_chars.add(char)
+            if (
+                not resuspend_reviewed
+                and status.has_history
+                and not (threshold > 0 and status.historical_interval < threshold)
+            ):
+                known_for_reviewed.add(char)
+        if resuspend_reviewed:
+            # Reviewed notes then follow the same current-interval rule, so share the set instead of building it twice.
+            known_for_reviewed = known_for_unreviewed
+
+        # Every change is planned from the rows already loaded, then written with one call per kind of change
+        # instead of one suspend, unsuspend and flush per note.
+        suspend_ids: List[int] = []
+        unsuspend_ids: List[int] = []
+        tag_additions: Dict[str, List[int]] = defaultdict(list)
+        tag_removals: Dict[str, List[int]] = defaultdict(list)
+
         for note_id, (chars, tag_set) in notes_info.items():
+            # Lowered once and kept in step with every planned tag edit, so no later check re-lowers note.tags.
             tag_set_lower = {value.lower() for value in tag_set}
             note_has_tag = tag_lower in tag_set_lower
             cards = card_map.get(note_id, [])
@@ -2743,125 +3068,112 @@ class KanjiVocabRecalcManager:
                 isinstance(card_type, int) and card_type != 0
                 for _, _, card_type in cards
             )
-            requires_suspend = False
-            for char in chars:
-                status = kanji_status.get(char)
-                if status is None:
-                    requires_suspend = True
-                    break
-                if note_has_reviewed_card:
-                    if cfg.resuspend_reviewed_low_interval:
-                        if not status.has_review_card:
-                            requires_suspend = True
-                            break
-                        if threshold > 0 and status.current_interval < threshold:
-                            requires_suspend = True
-                            break
-                    else:
-                        has_history = status.has_history
-                        if not has_history:
-                            requires_suspend = True
-                            break
-                        if threshold > 0 and status.historical_interval < threshold:
-                            requires_suspend = True
-                            break
-                else:
-                    if not status.has_review_card:
-                        requires_suspend = True
-                        break
-                    if threshold > 0 and status.current_interval < threshold:
-                        requires_suspend = True
-                        break
-            needs_low_interval_tag = False
-            if low_interval_tag and threshold > 0:
-                for char in chars:
-                    status = kanji_status.get(char)
-                    if not status:
-                        continue
-                    if status.has_review_card and status.current_interval < threshold:
-                        needs_low_interval_tag = True
-                        break
-            note_obj: Optional[Note] = None
-            changed = False
-
-            def ensure_note() -> Note:
-                nonlocal note_obj
-                if note_obj is None:
-                    note_obj = _get_note(collection, note_id)
-                return note_obj
+            # A note stays suspended unless every kanji in it passed the check for its review state.
+            requires_suspend = not chars.issubset(
+                known_for_reviewed if note_has_reviewed_card else known_for_unreviewed
+            )
+            needs_low_interval_tag = bool(low_interval_chars) and not chars.isdisjoint(low_interval_chars)
 
-            if cfg.auto_suspend_vocab:
-                if requires_suspend:
+            if auto_suspend and requires_suspend:
+                unsuspended_cards = [card_id for card_id, queue, _ in cards if queue != -1]
+                if unsuspended_cards:
+                    if debug_enabled:
+                        self._debug(
+                            "realtime/keep_suspended",
+                            note_id=note_id,
+                            chars="".join(sorted(chars)),
+                        )
+                    suspend_ids.extend(unsuspended_cards)
+                    stats["vocab_suspended"] += len(unsuspended_cards)
+                    if not note_has_tag:
+                        tag_additions[tag].append(note_id)
+                        tag_set_lower.add(tag_lower)
+                elif debug_enabled:
                     self._debug(
-                        "realtime/keep_suspended",
+                        "realtime/already_suspended",
                         note_id=note_id,
                         chars="".join(sorted(chars)),
                     )
-                    unsuspended_cards = [card_id for card_id, queue, _ in cards if queue != -1]
-                    newly_suspended = 0
-                    if unsuspended_cards:
-                        note_obj_local = ensure_note()
-                        newly_suspended = _resuspend_note_cards(collection, note_obj_local)
-                        if newly_suspended > 0:
-                            stats["vocab_suspended"] += newly_suspended
-                            existing_lower = {value.lower() for value in note_obj_local.tags}
-                            if tag_lower not in existing_lower:
-                                _add_tag(note_obj_local, tag)
-                                changed = True
-                                note_has_tag = True
-                    else:
+            elif note_has_tag:
+                suspended_cards = [card_id for card_id, queue, _ in cards if queue == -1]
+                if suspended_cards:
+                    if debug_enabled:
                         self._debug(
-                            "realtime/already_suspended",
+                            "realtime/unsuspend",
                             note_id=note_id,
                             chars="".join(sorted(chars)),
+                            count=len(suspended_cards),
                         )
-                else:
-                    if note_has_tag:
-                        note_obj_local = ensure_note()
-                        suspended_cards = [card_id for card_id, queue, _ in cards if queue == -1]
-                        if suspended_cards:
-                            self._debug(
-                                "realtime/unsuspend",
-                                note_id=note_id,
-                                chars="".join(sorted(chars)),
-                                count=len(suspended_cards),
-                            )
-                            _unsuspend_cards(collection, suspended_cards)
-                            stats["vocab_unsuspended"] += len(suspended_cards)
-                        if _remove_tag_case_insensitive(note_obj_local, tag):
-                            changed = True
-                            note_has_tag = False
-            else:
-                if note_has_tag:
-                    note_obj_local = ensure_note()
-                    suspended_cards = [card_id for card_id, queue, _ in cards if queue == -1]
-                    if suspended_cards:
-                        _unsuspend_cards(collection, suspended_cards)
-                        stats["vocab_unsuspended"] += len(suspended_cards)
-                    if _remove_tag_case_insensitive(note_obj_local, tag):
-                        changed = True
-                        note_has_tag = False
-
-            if low_interval_tag and threshold > 0:
-                low_tag_present = False
-                if note_obj is not None:
-                    low_tag_present = any(value.lower() == low_interval_lower for value in note_obj.tags)
-                else:
-                    low_tag_present = low_interval_lower in tag_set_lower
-                if needs_low_interval_tag:
-                    if not low_tag_present:
-                        note_obj_local = ensure_note()
-                        _add_tag(note_obj_local, low_interval_tag)
-                        changed = True
-                elif low_tag_present:
-                    note_obj_local = ensure_note()
-                    if _remove_tag_case_insensitive(note_obj_local, low_interval_tag):
-                        changed = True
+                    unsuspend_ids.extend(suspended_cards)
+                    stats["vocab_unsuspended"] += len(suspended_cards)
+                tag_removals[tag].append(note_id)
+                tag_set_lower.discard(tag_lower)
+
+            if check_low_interval:
+                low_tag_present = low_interval_lower in tag_set_lower
+                if needs_low_interval_tag and not low_tag_present:
+                    tag_additions[low_interval_tag].append(note_id)
+                elif not needs_low_interval_tag and low_tag_present:
+                    tag_removals[low_interval_tag].append(note_id)
+
+        _suspend_cards(collection, suspend_ids)
+        _unsuspend_cards(collection, unsuspend_ids)
+        if tag_additions or tag_removals:
+            with self._keeping_vocab_char_index(collection):
+                self._apply_planned_note_tags(collection, tag_additions, tag_removals)
+        return stats
 
-            if note_obj is not None and changed:
-                note_obj.flush()
+    def _apply_planned_note_tags(
+        self,
+        collection: Collection,
+        tag_additions: Dict[str, List[int]],
+        tag_removals: Dict[str, List[int]],
+    ) -> None:
+        if not tag_additions and not tag_removals:
+            return
+        tag_manager = getattr(collection, "tags", None)
+        bulk_add = getattr(tag_manager, "bulk_add", None)
+        bulk_remove = getattr(tag_manager, "bulk_remove", None)
+        if callable(bulk_add) and callable(bulk_remove):
+            for tag, note_ids in tag_removals.items():
+                bulk_remove(note_ids, tag)
+            for tag, note_ids in tag_additions.items():
+                bulk_add(note_ids, tag)
+            return
 
-        return stats
+        # Older clients: load each affected note once, apply all of its edits, then save the changed ones together.
+        edits: Dict[int, Tuple[List[str], List[str]]] = {}
+        for tag, note_ids in tag_removals.items():
+            for note_id in note_ids:
+                edits.setdefault(note_id, ([], []))[1].append(tag)
+        for tag, note_ids in tag_additions.items():
+            for note_id in note_ids:
+                edits.setdefault(note_id, ([], []))[0].append(tag)
+        lowered = {tag: tag.strip().lower() for tag in (*tag_removals, *tag_additions)}
+        dirty_notes: List[Note] = []
+        for note_id, (additions, removals) in edits.items():
+            note = _get_note(collection, note_id)
+            changed = False
+            for tag in removals:
+                if lowered[tag] and _remove_tag_case_insensitive_prepared(note, lowered[tag]):
+                    changed = True
+            if additions:
+                existing_lower = {value.lower() for value in note.tags}
+                for tag in additions:
+                    if tag.lower() not in existing_lower:
+                        _add_tag(note, tag)
+                        existing_lower.add(tag.lower())
+                        changed = True
+            if changed:
+                dirty_notes.append(note)
+        if not dirty_notes:
+            return
+        update_notes = getattr(collection, "update_notes", None)
+        if callable(update_notes):
+            update_notes(dirty_notes)
+            return
+        for note in dirty_notes:
+            note.flush()
 
     def _create_kanji_note(
         self,
@@ -2874,6 +3186,7 @@ class KanjiVocabRecalcManager:
         created_tag: str,
         cfg: AddonConfig,
         usage: Optional[KanjiUsageInfo],
+        deck_id: Optional[int] = None,
     ) -> Optional[int]:
         note = _new_note(collection, kanji_model)
         field_names = {logical: kanji_model["flds"][idx]["name"] for logical, idx in field_indexes.items()}
@@ -2909,7 +3222,8 @@ class KanjiVocabRecalcManager:
         for tag in tags:
             _add_tag(note, tag)
 
-        deck_id = self._resolve_deck_id(collection, kanji_model, cfg)
+        if deck_id is None:
+            deck_id = self._resolve_deck_id(collection, kanji_model, cfg)
         if not _add_note(collection, note, deck_id):
             return None
         return getattr(note, "id", None)
@@ -2920,6 +3234,9 @@ class KanjiVocabRecalcManager:
         note[field_name] = value or ""
 
     def _format_frequency_value(self, value: object) -> str:
+        # Normalised dictionaries store plain ints, so check that exact type before the isinstance chain.
+        if type(value) is int:
+            return str(value)
         if value is None:
             return ""
         if isinstance(value, int):
@@ -2956,39 +3273,29 @@ class KanjiVocabRecalcManager:
         dictionary_entry: Optional[Dict[str, object]],
         usage: Optional[KanjiUsageInfo],
     ) -> str:
-        def _render_optional(value: Optional[int]) -> str:
-            if value is None:
-                return "-"
-            return str(value)
-
-        def _render_bool(value: bool) -> str:
-            return "yes" if value else "no"
-
         freq_value: Optional[object] = None
         if isinstance(dictionary_entry, dict):
             freq_value = dictionary_entry.get("frequency")
         frequency_text = self._format_frequency_value(freq_value)
-        frequency_display = frequency_text if frequency_text else "-"
-
-        mode = cfg.reorder_mode or "vocab"
-        has_usage = usage is not None
-        reviewed = bool(getattr(usage, "reviewed", False)) if usage else False
-        vocab_occurrences: Optional[int] = getattr(usage, "vocab_occurrences", None) if usage else None
-
-        lines = [
-            f"kanji: {kanji_char or '-'}",
-            f"reorder_mode: {mode}",
-            f"has_vocab_usage: {_render_bool(has_usage)}",
-            f"reviewed_vocab: {_render_bool(reviewed)}",
-            f"first_review_order: {_render_optional(getattr(usage, 'first_review_order', None) if usage else None)}",
-            f"first_review_due: {_render_optional(getattr(usage, 'first_review_due', None) if usage else None)}",
-            f"first_new_due: {_render_optional(getattr(usage, 'first_new_due', None) if usage else None)}",
-            f"first_new_order: {_render_optional(getattr(usage, 'first_new_order', None) if usage else None)}",
-            f"vocab_occurrences: {_render_optional(vocab_occurrences)}",
-            f"dictionary_entry: {_render_bool(isinstance(dictionary_entry, dict))}",
-            f"dictionary_frequency: {frequency_display}",
-        ]
-        return "\n".join(lines)
+        if usage is None:
+            usage_values: Tuple[str, ...] = ("no", "no", "-", "-", "-", "-", "-")
+        else:
+            usage_values = (
+                "yes",
+                "yes" if usage.reviewed else "no",
+                _render_optional_int(usage.first_review_order),
+                _render_optional_int(usage.first_review_due),
+                _render_optional_int(usage.first_new_due),
+                _render_optional_int(usage.first_new_order),
+                _render_optional_int(usage.vocab_occurrences),
+            )
+        return SCHEDULING_INFO_TEMPLATE % (
+            kanji_char or "-",
+            cfg.reorder_mode or "vocab",
+            *usage_values,
+            "yes" if isinstance(dictionary_entry, dict) else "no",
+            frequency_text or "-",
+        )
 
     def _update_scheduling_info_field(
         self,
@@ -3023,12 +3330,7 @@ class KanjiVocabRecalcManager:
             return "; ".join(str(item) for item in value if item)
         return str(value or "")
 
-    def _unsuspend_note_cards_if_needed(
-        self,
-        collection: Collection,
-        note: Note,
-        unsuspend_tag: str,
-    ) -> int:
+    def _leech_tag_lower(self, collection: Collection) -> str:
         leech_tag = "leech"
         try:
             col_conf = collection.conf
@@ -3036,21 +3338,34 @@ class KanjiVocabRecalcManager:
             col_conf = {}
         if isinstance(col_conf, dict):
             leech_tag = (col_conf.get("leechTag") or leech_tag).strip() or "leech"
+        return leech_tag.lower()
 
-        leech_lower = leech_tag.lower()
-        note_tags_lower = {tag.lower() for tag in note.tags}
-        if leech_lower and leech_lower in note_tags_lower:
-            return 0
-
-        card_rows = _db_all(
-            collection,
-            "SELECT id, queue FROM cards WHERE nid = ?",
-            note.id,
-            context="unsuspend_note_cards_if_needed",
-        )
-        to_unsuspend = [card_id for card_id, queue in card_rows if queue == -1]
+    def _unsuspend_note_cards_if_needed(
+        self,
+        collection: Collection,
+        note: Note,
+        unsuspend_tag: str,
+        card_rows: Optional[Sequence[Tuple[int, ...]]] = None,
+        leech_lower: Optional[str] = None,
+        flush: bool = True,
+    ) -> Tuple[int, bool]:
+        # Callers handling many notes pass preloaded (id, queue, ...) rows and the leech tag. Returns the number
+        # of cards unsuspended and whether the note itself was changed.
+        if leech_lower is None:
+            leech_lower = self._leech_tag_lower(collection)
+        if leech_lower and any(tag.lower() == leech_lower for tag in note.tags):
+            return 0, False
+
+        if card_rows is None:
+            card_rows = _db_all(
+                collection,
+                "SELECT id, queue FROM cards WHERE nid = ?",
+                note.id,
+                context="unsuspend_note_cards_if_needed",
+            )
+        to_unsuspend = [row[0] for row in card_rows if row[1] == -1]
         if not to_unsuspend:
-            return 0
+            return 0, False
 
         _unsuspend_cards(collection, to_unsuspend)
 
@@ -3058,9 +3373,9 @@ class KanjiVocabRecalcManager:
         if unsuspend_tag and unsuspend_tag not in note.tags:
             _add_tag(note, unsuspend_tag)
             changed = True
-        if changed:
+        if changed and flush:
             note.flush()
-        return len(to_unsuspend)
+        return len(to_unsuspend), changed
 
     def _resolve_deck_id(self, collection: Collection, model: NotetypeDict, cfg: AddonConfig) -> int:
         if cfg.kanji_deck_name:
@@ -3080,15 +3395,14 @@ class KanjiVocabRecalcManager:
             return did
 
         decks = collection.decks
-        for attr in ("get_current_id", "current_id", "selected"):
-            getter = getattr(decks, attr, None)
-            if callable(getter):
-                try:
-                    deck_id = getter()
-                    if isinstance(deck_id, int) and deck_id > 0:
-                        return deck_id
-                except TypeError:
-                    continue
+        for attr in _callable_attrs(decks, DECK_CURRENT_ID_ATTRS):
+            getter = getattr(decks, attr)
+            try:
+                deck_id = getter()
+                if isinstance(deck_id, int) and deck_id > 0:
+                    return deck_id
+            except TypeError:
+                continue
 
         current = getattr(decks, "current", None)
         if callable(current):
@@ -3124,45 +3438,87 @@ class KanjiVocabRecalcManager:
         decks = collection.decks
         if not name:
             return None
-        for attr in ("id_for_name", "idForName", "id"):
-            getter = getattr(decks, attr, None)
-            if callable(getter):
-                try:
-                    deck_id = getter(name)
-                    if isinstance(deck_id, int) and deck_id > 0:
-                        return deck_id
-                except Exception:
-                    continue
-        # Fall back to scanning deck list
+        deck_id = self._deck_name_index(collection).get(name)
+        if deck_id is not None:
+            return deck_id
+        for attr in _callable_attrs(decks, DECK_ID_FOR_NAME_ATTRS):
+            getter = getattr(decks, attr)
+            try:
+                deck_id = getter(name)
+                if isinstance(deck_id, int) and deck_id > 0:
+                    # decks.id() may have just created the deck; rebuild the index on next use.
+                    self._deck_name_to_id_cache = None
+                    return deck_id
+            except Exception:
+                continue
+        return None
+
+    def _deck_name_index(self, collection: Collection) -> Dict[str, int]:
+        decks = collection.decks
+        cached = self._deck_name_to_id_cache
+        if cached is not None and cached[0] is decks:
+            return cached[1]
+        index: Dict[str, int] = {}
         fetcher = getattr(decks, "all_names_and_ids", None)
         if callable(fetcher):
             try:
                 entries = fetcher()
             except TypeError:
                 entries = None
-            if entries:
-                for entry in entries:
-                    entry_name = self._deck_entry_name(entry)
-                    entry_id = getattr(entry, "id", None)
-                    if entry_id is None and isinstance(entry, (list, tuple)):
-                        entry_id = next((item for item in entry if isinstance(item, int)), None)
-                    if entry_name == name and isinstance(entry_id, int) and entry_id > 0:
-                        return entry_id
-        return None
+            for entry in entries or ():
+                entry_name, entry_id = self._deck_entry_id_pair(entry)
+                if entry_name is not None and entry_id is not None:
+                    index.setdefault(entry_name, entry_id)
+        self._deck_name_to_id_cache = (decks, index)
+        return index
+
+    def _deck_entry_id_pair(self, entry: Any) -> Tuple[Optional[str], Optional[int]]:
+        entry_name = self._deck_entry_name(entry)
+        entry_type = type(entry)
+        if entry_type is tuple or entry_type is list:
+            # Unpack the usual (id, name) / (name, id) shapes without scanning.
+            if entry and type(entry[0]) is int:
+                entry_id = entry[0]
+            elif len(entry) > 1 and type(entry[0]) is str and type(entry[1]) is int:
+                entry_id = entry[1]
+            else:
+                entry_id = next((item for item in entry if isinstance(item, int)), None)
+        else:
+            entry_id = getattr(entry, "id", None)
+            if entry_id is None and isinstance(entry, (list, tuple)):
+                entry_id = next((item for item in entry if isinstance(item, int)), None)
+        if not isinstance(entry_id, int) or entry_id <= 0:
+            entry_id = None
+        return entry_name, entry_id
 
     def _deck_entry_name(self, entry: Any) -> Optional[str]:
         if entry is None:
             return None
-        if hasattr(entry, "name"):
-            candidate = entry.name
-        elif isinstance(entry, (list, tuple)):
-            candidate = next((item for item in entry if isinstance(item, str)), None)
-        elif isinstance(entry, str):
-            candidate = entry
+        entry_type = type(entry)
+        if entry_type is str:
+            return entry or None
+        if entry_type is tuple or entry_type is list:
+            # Legacy decks return (name, id) or (id, name) pairs; check the two slots before scanning.
+            if entry and type(entry[0]) is str:
+                candidate = entry[0]
+            elif len(entry) > 1 and type(entry[1]) is str:
+                candidate = entry[1]
+            else:
+                candidate = next((item for item in entry if isinstance(item, str)), None)
         else:
-            candidate = None
+            try:
+                candidate = entry.name
+            except AttributeError:
+                if isinstance(entry, (list, tuple)):
+                    candidate = next((item for item in entry if isinstance(item, str)), None)
+                elif isinstance(entry, str):
+                    candidate = entry
+                else:
+                    candidate = None
         if not candidate:
             return None
+        if type(candidate) is str:
+            return candidate
         return str(candidate)
 
 
@@ -3174,6 +3530,8 @@ class KanjiVocabRecalcSettingsDialog(QDialog):  # pragma: no cover
         self.setWindowTitle("KanjiCards Settings")
         self.manager = manager
         self.config = config
+        # Note types may have changed since the dialog was last open.
+        manager._models_by_name_cache = None
 
         layout = QVBoxLayout(self)
         self.tabs = QTabWidget()
@@ -3267,7 +3625,8 @@ class KanjiVocabRecalcSettingsDialog(QDialog):  # pragma: no cover
         layout = QFormLayout(widget)
 
         self.kanji_model_combo = QComboBox()
-        self.models_by_index: List[Optional[NotetypeDict]] = []
+        # Holds one model per combo entry after the "<Select note type>" placeholder.
+        self.models_by_index: List[NotetypeDict] = []
         self._populate_model_combo(self.kanji_model_combo, self.models_by_index, self.config.kanji_note_type.name)
 
         layout.addRow("Kanji note type", self.kanji_model_combo)
@@ -3327,65 +3686,65 @@ class KanjiVocabRecalcSettingsDialog(QDialog):  # pragma: no cover
     def _populate_model_combo(
         self,
         combo: QComboBox,
-        container: List[Optional[NotetypeDict]],
+        container: List[NotetypeDict],
         selected_name: str,
     ) -> None:  # pragma: no cover
-        combo.clear()
-        container.clear()
-        models = self.manager.mw.col.models.all()
-        names = sorted(model["name"] for model in models)
-        combo.addItem("<Select note type>")
-        container.append(None)
-        selected_index = 0
-        for idx, name in enumerate(names, start=1):
-            combo.addItem(name)
-            container.append(self.manager.mw.col.models.byName(name))
-            if name == selected_name:
-                selected_index = idx
-        combo.setCurrentIndex(selected_index)
+        by_name = self.manager._models_by_name(self.manager.mw.col)
+        names = sorted(by_name)
+        container[:] = [by_name[name] for name in names]
+        selected_index = names.index(selected_name) + 1 if selected_name in by_name else 0
+        # Select while signals are blocked; callers refresh dependent widgets explicitly.
+        with _frozen_widget(combo):
+            combo.clear()
+            combo.addItem("<Select note type>")
+            combo.addItems(names)
+            combo.setCurrentIndex(selected_index)
 
     def _refresh_kanji_field_combos(self) -> None:  # pragma: no cover
         model = self._current_kanji_model()
         scheduling_enabled = bool(getattr(self, "scheduling_info_check", None) and self.scheduling_info_check.isChecked())
+        field_names = self._model_field_names(model) if model else []
+        field_positions: Dict[str, int] = {}
+        for idx, name in enumerate(field_names, start=1):
+            field_positions.setdefault(name, idx)
+        configured_fields = self.config.kanji_note_type.fields
         for logical, combo in self.kanji_field_combos.items():
-            combo.clear()
-            combo.addItem("<Not set>")
-            if not model:
-                combo.setEnabled(logical != "scheduling_info")
-                continue
-            raw_fields = model.get("flds", [])
-            field_names = [
-                fld.get("name")
-                for fld in raw_fields
-                if isinstance(fld, dict) and isinstance(fld.get("name"), str)
-            ]
-            combo.addItems(field_names)
-            current_name = self.config.kanji_note_type.fields.get(logical, "")
-            if logical == "scheduling_info" and scheduling_enabled and not current_name:
-                if SCHEDULING_FIELD_DEFAULT_NAME in field_names:
-                    current_name = SCHEDULING_FIELD_DEFAULT_NAME
-                    self.config.kanji_note_type.fields[logical] = current_name
-            try:
-                if current_name and current_name in field_names:
-                    combo.setCurrentIndex(field_names.index(current_name) + 1)
-                else:
-                    combo.setCurrentIndex(0)
-            except ValueError:
-                combo.setCurrentIndex(0)
-            combo.setEnabled(logical != "scheduling_info" or scheduling_enabled)
+            with _frozen_widget(combo):
+                combo.clear()
+                combo.addItem("<Not set>")
+                if not model:
+                    combo.setEnabled(logical != "scheduling_info")
+                    continue
+                combo.addItems(field_names)
+                current_name = configured_fields.get(logical, "")
+                if logical == "scheduling_info" and scheduling_enabled and not current_name:
+                    if SCHEDULING_FIELD_DEFAULT_NAME in field_positions:
+                        current_name = SCHEDULING_FIELD_DEFAULT_NAME
+                        configured_fields[logical] = current_name
+                combo.setCurrentIndex(field_positions.get(current_name, 0) if current_name else 0)
+                combo.setEnabled(logical != "scheduling_info" or scheduling_enabled)
+
+    @staticmethod
+    def _model_field_names(model: NotetypeDict) -> List[str]:  # pragma: no cover
+        return [
+            fld.get("name")
+            for fld in model.get("flds", [])
+            if isinstance(fld, dict) and isinstance(fld.get("name"), str)
+        ]
 
     def _current_kanji_model(self) -> Optional[NotetypeDict]:  # pragma: no cover
         index = self.kanji_model_combo.currentIndex()
-        if index < 0 or index >= len(self.models_by_index):
+        if index <= 0 or index > len(self.models_by_index):
             return None
-        return self.models_by_index[index]
+        return self.models_by_index[index - 1]
 
-    def _suggest_scheduling_field_name(self, model: NotetypeDict) -> str:  # pragma: no cover
-        existing = {
-            fld.get("name")
-            for fld in model.get("flds", [])
-            if isinstance(fld, dict) and isinstance(fld.get("name"), str)
-        }
+    def _suggest_scheduling_field_name(
+        self,
+        model: NotetypeDict,
+        existing: Optional[Set[str]] = None,
+    ) -> str:  # pragma: no cover
+        if existing is None:
+            existing = set(self._model_field_names(model))
         base = SCHEDULING_FIELD_DEFAULT_NAME
         if base not in existing:
             return base
@@ -3442,6 +3801,7 @@ class KanjiVocabRecalcSettingsDialog(QDialog):  # pragma: no cover
             show_warning(f"Unable to create the scheduling info field:\n{err}")
             return False
         self.manager._kanji_model_cache = None
+        self.manager._models_by_name_cache = None
         self.manager._existing_notes_cache = None
         reset = getattr(mw_obj, "reset", None)
         if callable(reset):
@@ -3452,17 +3812,20 @@ class KanjiVocabRecalcSettingsDialog(QDialog):  # pragma: no cover
         return True
 
     def _reload_vocab_entries(self) -> None:  # pragma: no cover
-        self.vocab_list.clear()
+        items: List[QListWidgetItem] = []
         for entry in self.config.vocab_note_types:
             fields = ", ".join(entry.fields)
             multiplier = float(entry.due_multiplier) if entry.due_multiplier else 1.0
             if multiplier <= 0:
                 multiplier = 1.0
-            multiplier_text = f"×{multiplier:g}"
-            suffix = f" ({multiplier_text})" if multiplier != 1.0 else ""
+            suffix = f" (×{multiplier:g})" if multiplier != 1.0 else ""
             item = QListWidgetItem(f"{entry.name} — {fields}{suffix}")
             item.setData(USER_ROLE, entry)
-            self.vocab_list.addItem(item)
+            items.append(item)
+        with _frozen_widget(self.vocab_list):
+            self.vocab_list.clear()
+            for item in items:
+                self.vocab_list.addItem(item)
 
     def _add_vocab_entry(self) -> None:  # pragma: no cover
         dialog = VocabNoteConfigDialog(self.manager)
@@ -3542,6 +3905,10 @@ class KanjiVocabRecalcSettingsDialog(QDialog):  # pragma: no cover
         return True
 
     def _populate_deck_combo(self) -> None:
+        with _frozen_widget(self.deck_combo):
+            self._fill_deck_combo()
+
+    def _fill_deck_combo(self) -> None:
         self.deck_combo.clear()
         self.deck_combo.addItem("<Use note type/default deck>", "")
 
@@ -3552,14 +3919,13 @@ class KanjiVocabRecalcSettingsDialog(QDialog):  # pragma: no cover
         deck_names: List[str] = []
 
         entries = None
-        for attr in ("all_names_and_ids", "allNamesAndIds", "allNames"):
-            getter = getattr(decks, attr, None)
-            if callable(getter):
-                try:
-                    entries = getter()
-                    break
-                except TypeError:
-                    continue
+        for attr in _callable_attrs(decks, DECK_NAMES_ATTRS):
+            getter = getattr(decks, attr)
+            try:
+                entries = getter()
+                break
+            except TypeError:
+                continue
         if entries is None:
             entries = []
 
@@ -3589,33 +3955,24 @@ class KanjiVocabRecalcSettingsDialog(QDialog):  # pragma: no cover
                 self.config.kanji_note_type.fields[logical] = ""
                 continue
             self.config.kanji_note_type.fields[logical] = combo.currentText()
-        field_names = {
-            fld.get("name")
-            for fld in model.get("flds", [])
-            if isinstance(fld, dict) and isinstance(fld.get("name"), str)
-        }
         self.config.store_scheduling_info = bool(self.scheduling_info_check.isChecked())
         if not self.config.store_scheduling_info:
             self.config.kanji_note_type.fields["scheduling_info"] = ""
         else:
             scheduling_field = self.config.kanji_note_type.fields.get("scheduling_info", "").strip()
+            field_names = set(self._model_field_names(model))
             if not scheduling_field:
                 if SCHEDULING_FIELD_DEFAULT_NAME in field_names:
                     scheduling_field = SCHEDULING_FIELD_DEFAULT_NAME
                 else:
-                    scheduling_field = self._suggest_scheduling_field_name(model)
+                    scheduling_field = self._suggest_scheduling_field_name(model, field_names)
                 self.config.kanji_note_type.fields["scheduling_info"] = scheduling_field
             if scheduling_field not in field_names:
                 if not self._confirm_scheduling_field_full_sync():
                     return False
                 if not self._create_scheduling_field(model, scheduling_field):
                     return False
-                field_names = {
-                    fld.get("name")
-                    for fld in model.get("flds", [])
-                    if isinstance(fld, dict) and isinstance(fld.get("name"), str)
-                }
-                if scheduling_field not in field_names:
+                if scheduling_field not in self._model_field_names(model):
                     show_warning("Failed to add the scheduling info field to the kanji note type.")
                     return False
                 self._refresh_kanji_field_combos()
@@ -3651,7 +4008,8 @@ class VocabNoteConfigDialog(QDialog):  # pragma: no cover
         layout.addLayout(form)
 
         self.model_combo = QComboBox()
-        self._models: List[Optional[NotetypeDict]] = []
+        # Holds one model per combo entry after the "<Select note type>" placeholder.
+        self._models: List[NotetypeDict] = []
         selected_name = existing.name if existing else ""
         self._populate_models(selected_name)
         form.addRow("Note type", self.model_combo)
@@ -3686,35 +4044,33 @@ class VocabNoteConfigDialog(QDialog):  # pragma: no cover
         layout.addWidget(buttons)
 
     def _populate_models(self, selected_name: str) -> None:  # pragma: no cover
-        models = self.manager.mw.col.models.all()
-        names = sorted(model["name"] for model in models)
-        self.model_combo.addItem("<Select note type>")
-        self._models.append(None)
-        selected_index = 0
-        for idx, name in enumerate(names, start=1):
-            self.model_combo.addItem(name)
-            self._models.append(self.manager.mw.col.models.byName(name))
-            if name == selected_name:
-                selected_index = idx
-        self.model_combo.setCurrentIndex(selected_index)
+        by_name = self.manager._models_by_name(self.manager.mw.col)
+        names = sorted(by_name)
+        self._models = [by_name[name] for name in names]
+        selected_index = names.index(selected_name) + 1 if selected_name in by_name else 0
+        with _frozen_widget(self.model_combo):
+            self.model_combo.addItem("<Select note type>")
+            self.model_combo.addItems(names)
+            self.model_combo.setCurrentIndex(selected_index)
 
     def _populate_fields(self) -> None:  # pragma: no cover
-        self.fields_list.clear()
-        model = self._current_model()
-        if not model:
-            return
-        existing_fields = set(self.existing.fields) if self.existing else set()
-        for field in model["flds"]:
-            item = QListWidgetItem(field["name"])
-            item.setFlags(item.flags() | ITEM_IS_USER_CHECKABLE)
-            item.setCheckState(CHECKED_STATE if field["name"] in existing_fields else UNCHECKED_STATE)
-            self.fields_list.addItem(item)
+        with _frozen_widget(self.fields_list):
+            self.fields_list.clear()
+            model = self._current_model()
+            if not model:
+                return
+            existing_fields = set(self.existing.fields) if self.existing else set()
+            for field in model["flds"]:
+                item = QListWidgetItem(field["name"])
+                item.setFlags(item.flags() | ITEM_IS_USER_CHECKABLE)
+                item.setCheckState(CHECKED_STATE if field["name"] in existing_fields else UNCHECKED_STATE)
+                self.fields_list.addItem(item)
 
     def _current_model(self) -> Optional[NotetypeDict]:  # pragma: no cover
         index = self.model_combo.currentIndex()
-        if index < 0 or index >= len(self._models):
+        if index <= 0 or index > len(self._models):
             return None
-        return self._models[index]
+        return self._models[index - 1]
 
     def _on_accept(self) -> None:  # pragma: no cover
         model = self._current_model()
@@ -3760,6 +4116,13 @@ def _initialize_manager() -> None:
 
 
 def on_profile_loaded() -> None:
+    # Each profile opens its own collection and deck manager, so drop names resolved for the previous one.
+    _CALLABLE_ATTRS_CACHE.clear()
+    if _manager is not None:
+        _manager._deck_name_to_id_cache = None
+        _manager._models_by_name_cache = None
+        _manager._invalidate_config_cache()
+        _manager._reset_note_caches()
     _initialize_manager()
 
 
@@ -3775,8 +4138,9 @@ gui_hooks.main_window_did_init.append(on_main_window_did_init)
 # Backwards compatibility helpers
 # ----------------------------------------------------------------------
 def _add_note(collection: Collection, note: Note, deck_id: Optional[int] = None) -> bool:
-    handler = getattr(collection, "add_note", None)
-    if callable(handler):
+    available = _callable_attrs(collection, ADD_NOTE_ATTRS)
+    if available and available[0] == "add_note":
+        handler = collection.add_note
         try:
             if deck_id is None:
                 return handler(note)
@@ -3799,46 +4163,66 @@ def _unsuspend_cards(collection: Collection, card_ids: Sequence[int]) -> None:
         for attr in ("unsuspend_cards", "unsuspendCards"):
             func = getattr(sched, attr, None)
             if callable(func):
-                func(list(card_ids))
+                func(card_ids if isinstance(card_ids, list) else list(card_ids))
                 return
 
-    placeholders = ",".join("?" for _ in card_ids)
-    params: List[object] = [intTime(), collection.usn(), *card_ids]
-    _db_execute(
-        collection,
-        f"UPDATE cards SET mod = ?, usn = ?, queue = type WHERE id IN ({placeholders})",
-        *params,
-        context="unsuspend_cards",
-    )
-
-
-def _resuspend_note_cards(collection: Collection, note: Note) -> int:
-    card_rows = _db_all(
-        collection,
-        "SELECT id, queue FROM cards WHERE nid = ?",
-        note.id,
-        context="resuspend_note_cards/load",
-    )
-    to_suspend = [card_id for card_id, queue in card_rows if queue != -1]
-    if not to_suspend:
-        return 0
+    _set_card_queues(collection, card_ids, "queue = type", context="unsuspend_cards")
 
+
+def _suspend_cards(collection: Collection, card_ids: Sequence[int]) -> None:
+    if not card_ids:
+        return
     sched = getattr(collection, "sched", None)
     if sched is not None:
         for attr in ("suspend_cards", "suspendCards"):
             func = getattr(sched, attr, None)
             if callable(func):
-                func(list(to_suspend))
-                return len(to_suspend)
-
-    placeholders = ",".join("?" for _ in to_suspend)
-    params: List[object] = [intTime(), collection.usn(), *to_suspend]
-    _db_execute(
-        collection,
-        f"UPDATE cards SET mod = ?, usn = ?, queue = -1 WHERE id IN ({placeholders})",
-        *params,
-        context="resuspend_note_cards/update",
-    )
+                func(card_ids if isinstance(card_ids, list) else list(card_ids))
+                return
+
+    _set_card_queues(collection, card_ids, "queue = -1", context="suspend_cards")
+
+
+def _set_card_queues(collection: Collection, card_ids: Sequence[int], assignment: str, context: str) -> None:
+    mod = intTime()
+    usn = collection.usn()
+    if callable(getattr(collection.db, "executemany", None)):
+        # One fixed statement lets SQLite reuse its prepared plan for every card.
+        _db_executemany(
+            collection,
+            f"UPDATE cards SET mod = ?, usn = ?, {assignment} WHERE id = ?",
+            [(mod, usn, card_id) for card_id in card_ids],
+            context=context,
+        )
+        return
+    # mod and usn take two of the statement's parameters.
+    for batch_ids in _chunk_sequence(card_ids, SQLITE_MAX_VARIABLES - 2):
+        placeholders = _sql_placeholders(len(batch_ids))
+        _db_execute(
+            collection,
+            f"UPDATE cards SET mod = ?, usn = ?, {assignment} WHERE id IN ({placeholders})",
+            mod,
+            usn,
+            *batch_ids,
+            context=context,
+        )
+
+
+def _resuspend_notes_cards(collection: Collection, note_ids: Sequence[int]) -> int:
+    unique_ids = sorted(set(note_ids))
+    if not unique_ids:
+        return 0
+    to_suspend: List[int] = []
+    for batch_index, batch_ids in enumerate(_chunk_sequence(unique_ids, SQLITE_MAX_VARIABLES)):
+        placeholders = _sql_placeholders(len(batch_ids))
+        card_rows = _db_all(
+            collection,
+            f"SELECT id, queue FROM cards WHERE nid IN ({placeholders})",
+            *batch_ids,
+            context=f"resuspend_note_cards/batch{batch_index}",
+        )
+        to_suspend.extend(card_id for card_id, queue in card_rows if queue != -1)
+    _suspend_cards(collection, to_suspend)
     return len(to_suspend)
 
 
@@ -3861,6 +4245,8 @@ def _db_execute(
     *params: object,
     context: str = "",
 ) -> None:
+    # Anki owns the transaction: writes join the collection's open transaction and are committed
+    # with it, so issuing BEGIN/COMMIT here would conflict with it rather than save fsyncs.
     try:
         collection.db.execute(sql, *params)
     except Exception as err:  # noqa: BLE001
@@ -3868,6 +4254,24 @@ def _db_execute(
         raise
 
 
+def _db_executemany(
+    collection: Collection,
+    sql: str,
+    rows: Sequence[Sequence[object]],
+    context: str = "",
+) -> None:
+    handler = getattr(collection.db, "executemany", None)
+    if not callable(handler):
+        for params in rows:
+            _db_execute(collection, sql, *params, context=context)
+        return
+    try:
+        handler(sql, list(rows))
+    except Exception as err:  # noqa: BLE001
+        _log_db_error("executemany", sql, list(rows[:3]), context, err)
+        raise
+
+
 def _log_db_error(
     operation: str,
     sql: str,
@@ -3881,7 +4285,63 @@ def _log_db_error(
     _safe_print(prefix + f": {err}")
     _safe_print(f"  SQL: {sql}")
     if params:
-        _safe_print(f"  Params: {params}")
+        if len(params) > DB_ERROR_MAX_PARAMS:
+            # Chunked IN lists can carry tens of thousands of ids; a prefix is enough to debug.
+            shown = ", ".join(repr(value) for value in params[:DB_ERROR_MAX_PARAMS])
+            _safe_print(f"  Params: ({shown}, ...) [{len(params)} total]")
+        else:
+            _safe_print(f"  Params: {params}")
+
+
+_CALLABLE_ATTRS_CACHE: "weakref.WeakKeyDictionary[Any, Dict[Tuple[str, ...], Tuple[str, ...]]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _callable_attrs(obj: Any, names: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Return the names in *names* that are callable on *obj*, probing each object only once."""
+    try:
+        per_obj = _CALLABLE_ATTRS_CACHE.get(obj)
+    except TypeError:
+        per_obj = None
+    if per_obj is not None:
+        cached = per_obj.get(names)
+        if cached is not None:
+            return cached
+    found = tuple(name for name in names if callable(getattr(obj, name, None)))
+    try:
+        _CALLABLE_ATTRS_CACHE.setdefault(obj, {})[names] = found
+    except TypeError:
+        # Objects without weakref support are simply probed every time.
+        pass
+    return found
+
+
+@contextmanager
+def _frozen_widget(widget: Any) -> Iterator[None]:
+    """Suspend repaints and signals on *widget* while it is being rebuilt."""
+    set_updates = getattr(widget, "setUpdatesEnabled", None)
+    block_signals = getattr(widget, "blockSignals", None)
+    if callable(set_updates):
+        set_updates(False)
+    previously_blocked = block_signals(True) if callable(block_signals) else False
+    try:
+        yield
+    finally:
+        if callable(block_signals):
+            block_signals(bool(previously_blocked))
+        if callable(set_updates):
+            set_updates(True)
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+@lru_cache(maxsize=32)
+def _sql_placeholders(count: int) -> str:
+    """Return ``?,?,...`` for an IN list; full-size chunks reuse the same string."""
+    return ",".join("?" * count)
 
 
 def _chunk_sequence(values: Sequence[int], chunk_size: int) -> Iterator[List[int]]:
@@ -3892,6 +4352,121 @@ def _chunk_sequence(values: Sequence[int], chunk_size: int) -> Iterator[List[int
         yield list(values[start : start + chunk_size])
 
 
+def _render_optional_int(value: Optional[int]) -> str:
+    return "-" if value is None else str(value)
+
+
+def _positive_count(value: object) -> bool:
+    if type(value) is int:
+        return value > 0
+    if not value:
+        return False
+    try:
+        return int(value) > 0  # type: ignore[call-overload]
+    except Exception:
+        return False
+
+
+_CARD_STATE_GETTER = attrgetter("id", "type", "queue", "nid")
+
+
+def _card_state_attrs(card: Any) -> Tuple[Any, Any, Any, Any]:
+    # Real cards carry all four attributes, so the reviewer hooks read them in one call; stand-ins fall back.
+    try:
+        return _CARD_STATE_GETTER(card)
+    except AttributeError:
+        return (
+            getattr(card, "id", None),
+            getattr(card, "type", None),
+            getattr(card, "queue", None),
+            getattr(card, "nid", None),
+        )
+
+
+def _coerce_card_id(value: Any) -> Optional[int]:
+    if isinstance(value, int):
+        return value
+    if isinstance(value, (str, bytes)):
+        try:
+            return int(value)
+        except Exception:
+            return None
+    return None
+
+
+# Sorts after every real due, rank or frequency value.
+_REORDER_KEY_MISSING = 10**9
+
+
+def _reorder_key_vocab(
+    info: KanjiUsageInfo,
+    frequency: Optional[int],
+    due_value: Optional[int],
+    card_id: int,
+    has_vocab: bool,
+) -> Tuple[Tuple, int]:
+    missing = _REORDER_KEY_MISSING
+    due_sort = missing if due_value is None else due_value
+    freq_value = missing if frequency is None else frequency
+    if not has_vocab:
+        return (2, 1 if frequency is None else 0, freq_value, due_sort, card_id), 2
+    if info.reviewed:
+        review_due = info.first_review_due
+        review_rank = info.first_review_order
+        return (
+            0,
+            missing if review_due is None else review_due,
+            -info.vocab_occurrences,
+            freq_value,
+            missing if review_rank is None else review_rank,
+            due_sort,
+            card_id,
+        ), 0
+    new_due = info.first_new_due
+    new_rank = info.first_new_order
+    return (
+        1,
+        missing if new_due is None else new_due,
+        -info.vocab_occurrences,
+        freq_value,
+        missing if new_rank is None else new_rank,
+        due_sort,
+        card_id,
+    ), 1
+
+
+def _reorder_key_vocab_frequency(
+    info: KanjiUsageInfo,
+    frequency: Optional[int],
+    due_value: Optional[int],
+    card_id: int,
+    has_vocab: bool,
+) -> Tuple[Tuple, int]:
+    key, bucket_id = _reorder_key_vocab(info, frequency, due_value, card_id, has_vocab)
+    return (-info.vocab_occurrences if has_vocab else 0,) + key, bucket_id
+
+
+def _reorder_key_frequency(
+    info: KanjiUsageInfo,
+    frequency: Optional[int],
+    due_value: Optional[int],
+    card_id: int,
+    has_vocab: bool,
+) -> Tuple[Tuple, int]:
+    # Buckets still follow vocab usage so bucket tags stay meaningful in frequency mode.
+    bucket_id = (0 if info.reviewed else 1) if has_vocab else 2
+    if frequency is None:
+        return (1, _REORDER_KEY_MISSING if due_value is None else due_value, card_id), bucket_id
+    return (0, frequency, card_id), bucket_id
+
+
+_REORDER_KEY_BUILDERS: Dict[str, Callable[..., Tuple[Tuple, int]]] = {
+    "vocab": _reorder_key_vocab,
+    "frequency": _reorder_key_frequency,
+    "vocab_frequency": _reorder_key_vocab_frequency,
+}
+
+
 def _new_note(collection: Collection, model: NotetypeDict) -> Note:
     handler = getattr(collection, "new_note", None)
     if callable(handler):
@@ -3906,7 +4481,28 @@ def _get_note(collection: Collection, note_id: int) -> Note:
     return collection.getNote(note_id)
 
 
+_NOTE_TAG_METHODS: "weakref.WeakKeyDictionary[type, Tuple[Optional[Callable[..., Any]], Optional[Callable[..., Any]]]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _note_tag_methods(note: Note) -> Tuple[Optional[Callable[..., Any]], Optional[Callable[..., Any]]]:
+    """Return the note class's add_tag/remove_tag functions, looked up once per class."""
+    cls = type(note)
+    methods = _NOTE_TAG_METHODS.get(cls)
+    if methods is None:
+        add_tag = getattr(cls, "add_tag", None)
+        remove_tag = getattr(cls, "remove_tag", None)
+        methods = (add_tag if callable(add_tag) else None, remove_tag if callable(remove_tag) else None)
+        _NOTE_TAG_METHODS[cls] = methods
+    return methods
+
+
 def _add_tag(note: Note, tag: str) -> None:
+    add_tag = _note_tag_methods(note)[0]
+    if add_tag is not None:
+        add_tag(note, tag)
+        return
     handler = getattr(note, "add_tag", None)
     if callable(handler):
         handler(tag)
@@ -3915,6 +4511,10 @@ def _add_tag(note: Note, tag: str) -> None:
 
 
 def _remove_tag(note: Note, tag: str) -> None:
+    remove_tag = _note_tag_methods(note)[1]
+    if remove_tag is not None:
+        remove_tag(note, tag)
+        return
     handler = getattr(note, "remove_tag", None)
     if callable(handler):
         handler(tag)
@@ -3926,10 +4526,18 @@ def _remove_tag_case_insensitive(note: Note, tag: str) -> bool:
     cleaned = tag.strip()
     if not cleaned:
         return False
-    target = cleaned.lower()
-    removed = False
-    for existing in list(note.tags):
-        if existing.lower() == target:
-            _remove_tag(note, existing)
-            removed = True
-    return removed
+    return _remove_tag_case_insensitive_prepared(note, cleaned.lower())
+
+
+def _remove_tag_case_insensitive_prepared(note: Note, target: str) -> bool:
+    """Like _remove_tag_case_insensitive, for callers that already hold the stripped, lowercased tag."""
+    tags = note.tags
+    # Filter in one pass rather than dispatching remove_tag, which rescans the list, per match.
+    kept = [existing for existing in tags if existing.lower() != target]
+    if len(kept) == len(tags):
+        return False
+    if isinstance(tags, list):
+        tags[:] = kept
+    else:
+        note.tags = kept
+    return True
@@ -322,8 +322,60 @@ def kanjicards_module(stub_anki_env):
         return module
 
 
+class _StubMenu:
+    def addAction(self, label: str):
+        return types.SimpleNamespace(triggered=_Signal())
+
+
+class _StubAddonManager:
+    def __init__(self, folder: str) -> None:
+        self._folder = folder
+
+    def addonFromModule(self, module_name: str) -> str:
+        return "KanjiCards"
+
+    def addonsFolder(self) -> str:
+        return self._folder
+
+    def setConfigAction(self, module_name: str, action) -> None:
+        return None
+
+    def getConfig(self, module_name: str) -> dict:
+        return {}
+
+    def writeConfig(self, module_name: str, data: dict) -> None:
+        return None
+
+
+@pytest.fixture(scope="session")
+def make_manager(kanjicards_module, tmp_path_factory):
+    """Build a manager through its constructor against a stub main window."""
+    addons_folder = tmp_path_factory.mktemp("stub_addons")
+
+    def _make(module=None):
+        module = module or kanjicards_module
+        stub_mw = types.SimpleNamespace(
+            form=types.SimpleNamespace(menuTools=_StubMenu()),
+            addonManager=_StubAddonManager(str(addons_folder)),
+        )
+        # Hooks registered by the constructor go to a throwaway set so managers do not pile up on the shared stubs.
+        stub_hooks = types.SimpleNamespace(
+            reviewer_did_answer_card=_Hook(),
+            reviewer_did_show_question=_Hook(),
+            sync_did_finish=_Hook(),
+        )
+        previous_mw, previous_hooks = module.mw, module.gui_hooks
+        module.mw, module.gui_hooks = stub_mw, stub_hooks
+        try:
+            return module.KanjiVocabRecalcManager()
+        finally:
+            module.mw, module.gui_hooks = previous_mw, previous_hooks
+
+    return _make
+
+
 @pytest.fixture
-def manager_with_profile(kanjicards_module, tmp_path):
+def manager_with_profile(make_manager, tmp_path):
     class _AddonManager:
         def __init__(self, folder: str) -> None:
             self._folder = folder
@@ -347,7 +399,7 @@ def manager_with_profile(kanjicards_module, tmp_path):
             self._config = dict(data)
             self.written_configs.append((module_name, data))
 
-    manager = kanjicards_module.KanjiVocabRecalcManager.__new__(kanjicards_module.KanjiVocabRecalcManager)
+    manager = make_manager()
     profile_dir = tmp_path / "profile"
     profile_dir.mkdir()
     addons_folder = tmp_path / "addons"
@@ -360,22 +412,6 @@ def manager_with_profile(kanjicards_module, tmp_path):
     manager.addon_dir = str(tmp_path / "addon")
     os.makedirs(manager.addon_dir, exist_ok=True)
     manager._debug_path = str(tmp_path / "debug.log")
-    manager._debug_enabled = False
-    manager._profile_config_error_logged = False
-    manager._profile_state_error_logged = False
-    manager._dictionary_cache = None
-    manager._existing_notes_cache = None
-    manager._kanji_model_cache = None
-    manager._vocab_model_cache = None
-    manager._realtime_error_logged = False
-    manager._missing_deck_logged = False
     manager._sync_hook_installed = False
     manager._sync_hook_target = None
-    manager._last_vocab_sync_mod = None
-    manager._last_vocab_sync_count = None
-    manager._pending_vocab_sync_marker = None
-    manager._last_synced_config_hash = None
-    manager._pending_config_hash = None
-    manager._suppress_next_auto_sync = False
-    manager._prioritysieve_waiting_post_sync = False
     return manager
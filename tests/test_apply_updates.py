@@ -1,3 +1,4 @@
+import json
 import types
 from typing import List
 
@@ -58,15 +59,22 @@ class FakeDB:
                 for note in self.collection.notes.values()
                 if note.mid == target_mid
             ]
-        if sql_simple.startswith("SELECT id, queue FROM cards WHERE nid = ?"):
-            note_id = params[0]
+        if sql_simple.startswith("SELECT id, nid, queue, type FROM cards WHERE nid IN"):
+            note_ids = set(params)
+            return [
+                (card_id, card["nid"], card["queue"], card["type"])
+                for card_id, card in self.collection.cards.items()
+                if card["nid"] in note_ids
+            ]
+        if sql_simple.startswith("SELECT id, queue FROM cards WHERE nid IN"):
+            note_ids = set(params)
             return [
                 (card_id, card["queue"])
                 for card_id, card in self.collection.cards.items()
-                if card["nid"] == note_id
+                if card["nid"] in note_ids
             ]
         if sql_simple.startswith("SELECT COUNT(*), MAX(mod) FROM notes WHERE mid IN"):
-            mids = {int(mid) for mid in params}
+            mids = {int(mid) for mid in json.loads(params[0])}
             matching = [note for note in self.collection.notes.values() if note.mid in mids]
             count = len(matching)
             max_mod = 0
@@ -133,27 +141,10 @@ class FakeCollection:
 
 
 @pytest.fixture
-def manager(kanjicards_module):
-    manager = kanjicards_module.KanjiVocabRecalcManager.__new__(kanjicards_module.KanjiVocabRecalcManager)
+def manager(make_manager):
+    manager = make_manager()
     manager.mw = types.SimpleNamespace()
-    manager._profile_config_error_logged = False
-    manager._profile_state_error_logged = False
-    manager._prioritysieve_waiting_post_sync = False
-    manager._debug_enabled = False
     manager._debug_path = None
-    manager._pre_answer_card_state = {}
-    manager._last_question_card_id = None
-    manager._kanji_model_cache = None
-    manager._existing_notes_cache = None
-    manager._dictionary_cache = None
-    manager._vocab_model_cache = None
-    manager._realtime_error_logged = False
-    manager._last_vocab_sync_mod = None
-    manager._last_vocab_sync_count = None
-    manager._pending_vocab_sync_marker = None
-    manager._last_synced_config_hash = None
-    manager._pending_config_hash = None
-    manager._suppress_next_auto_sync = False
     return manager
 
 
@@ -250,7 +241,7 @@ def test_apply_updates_existing_note_unsuspends_and_tags(manager, kanjicards_mod
 
     assert stats["existing_tagged"] == 1
     assert stats["unsuspended"] == 1
-    assert existing_note.flush_count >= 1
+    assert existing_note.flush_count == 1
     assert "existing" in existing_note.tags
     assert "unsuspend" in existing_note.tags
     assert collection.cards[11]["queue"] == collection.cards[11]["type"]
@@ -360,7 +351,7 @@ def test_apply_updates_creates_new_notes_and_prunes_old(manager, kanjicards_modu
     assert stats["created"] == 1
     assert stats["tag_removed"] == 1
     assert stats["resuspended"] == 1
-    assert stats["missing_dictionary"] == {"木"}
+    assert stats["missing_dictionary"] == ["木"]
 
     new_notes = [note for note in collection.notes.values() if note["Character"] == "水"]
     assert len(new_notes) == 1
@@ -373,6 +364,31 @@ def test_apply_updates_creates_new_notes_and_prunes_old(manager, kanjicards_modu
     assert collection.cards[21]["queue"] == -1
 
 
+def test_apply_updates_resolves_deck_once_per_run(manager, kanjicards_module, monkeypatch):
+    model = make_model()
+    collection = FakeCollection(model)
+    cfg = make_config(kanjicards_module)
+    resolved = []
+    monkeypatch.setattr(manager, "_resolve_deck_id", lambda *_: resolved.append(True) or 1)
+
+    dictionary = {"水": {"frequency": 1}, "火": {"frequency": 2}}
+    field_indexes = {"kanji": 0, "frequency": 5, "definition": 1, "stroke_count": 2, "kunyomi": 3, "onyomi": 4}
+
+    stats = manager._apply_kanji_updates(
+        collection,
+        ["水", "火"],
+        dictionary,
+        model,
+        field_indexes,
+        0,
+        cfg,
+        existing_notes={},
+    )
+
+    assert stats["created"] == 2
+    assert len(resolved) == 1
+
+
 class SimpleNote:
     def __init__(self, note_id, tags=None):
         self.id = note_id
@@ -428,7 +444,7 @@ def test_update_vocab_suspension_auto_suspend(manager, kanjicards_module, monkey
     )
     monkeypatch.setattr(
         kanjicards_module,
-        "_resuspend_note_cards",
+        "_suspend_cards",
         lambda *args, **kwargs: 1,
     )
     monkeypatch.setattr(
@@ -449,6 +465,86 @@ def test_update_vocab_suspension_auto_suspend(manager, kanjicards_module, monkey
     assert note.flush_count == 1
 
 
+def test_update_vocab_suspension_bulk_tags_without_loading_notes(manager, kanjicards_module, monkeypatch):
+    cfg = make_config(
+        kanjicards_module,
+        auto_suspend_vocab=True,
+        auto_suspend_tag="NeedsSuspend",
+        low_interval_vocab_tag="LowInterval",
+    )
+    bulk_calls = []
+    collection = types.SimpleNamespace(
+        tags=types.SimpleNamespace(
+            bulk_add=lambda ids, tag: bulk_calls.append(("add", tag, list(ids))),
+            bulk_remove=lambda ids, tag: bulk_calls.append(("remove", tag, list(ids))),
+        )
+    )
+    suspended = []
+    unsuspended = []
+
+    monkeypatch.setattr(
+        manager,
+        "_collect_vocab_note_chars",
+        lambda *args, **kwargs: {
+            101: ({"火"}, set()),
+            102: ({"水"}, {"needssuspend", "lowinterval"}),
+        },
+    )
+    monkeypatch.setattr(
+        manager,
+        "_compute_kanji_interval_status",
+        lambda *args, **kwargs: {
+            "火": kanjicards_module.KanjiIntervalStatus(has_review_card=True, current_interval=3, historical_interval=3),
+            "水": kanjicards_module.KanjiIntervalStatus(has_review_card=True, current_interval=90, historical_interval=90),
+        },
+    )
+    monkeypatch.setattr(
+        manager,
+        "_load_card_status_for_notes",
+        lambda *args, **kwargs: {101: [(501, 0, 0), (502, -1, 0)], 102: [(601, -1, 0)]},
+    )
+    monkeypatch.setattr(kanjicards_module, "_get_note", lambda *args, **kwargs: pytest.fail("note loaded"))
+    monkeypatch.setattr(kanjicards_module, "_suspend_cards", lambda col, ids: suspended.extend(ids))
+    monkeypatch.setattr(kanjicards_module, "_unsuspend_cards", lambda col, ids: unsuspended.extend(ids))
+
+    stats = manager._update_vocab_suspension(collection, cfg, {1: [0]}, existing_notes={"火": 1, "水": 2})
+
+    assert stats == {"vocab_suspended": 1, "vocab_unsuspended": 1}
+    assert suspended == [501]
+    assert unsuspended == [601]
+    assert sorted(bulk_calls) == [
+        ("add", "LowInterval", [101]),
+        ("add", "NeedsSuspend", [101]),
+        ("remove", "LowInterval", [102]),
+        ("remove", "NeedsSuspend", [102]),
+    ]
+
+
+def test_apply_planned_note_tags_loads_each_note_once(manager, kanjicards_module, monkeypatch):
+    notes = {1: SimpleNote(1, tags=["lowinterval"]), 2: SimpleNote(2, tags=["Keep"])}
+    loaded = []
+    updated = []
+
+    def fake_get_note(collection, note_id):
+        loaded.append(note_id)
+        return notes[note_id]
+
+    monkeypatch.setattr(kanjicards_module, "_get_note", fake_get_note)
+    collection = types.SimpleNamespace(update_notes=lambda batch: updated.append([note.id for note in batch]))
+
+    manager._apply_planned_note_tags(
+        collection,
+        {"NeedsSuspend": [1], "keep": [2]},
+        {"LowInterval": [1]},
+    )
+
+    assert sorted(loaded) == [1, 2]
+    assert notes[1].tags == ["NeedsSuspend"]
+    assert notes[2].tags == ["Keep"]
+    assert updated == [[1]]
+    assert notes[1].flush_count == 0
+
+
 def test_update_vocab_suspension_skips_tag_when_already_suspended(manager, kanjicards_module, monkeypatch):
     cfg = make_config(
         kanjicards_module,
@@ -488,13 +584,14 @@ def test_update_vocab_suspension_skips_tag_when_already_suspended(manager, kanji
 
     called_resuspend = []
 
-    def fail_resuspend(*args, **kwargs):
-        called_resuspend.append(True)
-        raise AssertionError("should not resuspend already suspended note")
+    def fail_resuspend(collection, card_ids):
+        if card_ids:
+            called_resuspend.append(True)
+            raise AssertionError("should not resuspend already suspended note")
 
     monkeypatch.setattr(
         kanjicards_module,
-        "_resuspend_note_cards",
+        "_suspend_cards",
         fail_resuspend,
     )
     monkeypatch.setattr(
@@ -559,7 +656,7 @@ def test_update_vocab_suspension_unsuspends_and_clears_tag(manager, kanjicards_m
     )
     monkeypatch.setattr(
         kanjicards_module,
-        "_resuspend_note_cards",
+        "_suspend_cards",
         lambda *args, **kwargs: 0,
     )
 
@@ -677,7 +774,7 @@ def test_update_vocab_suspension_resuspends_reviewed_when_option_enabled(manager
     )
     monkeypatch.setattr(
         kanjicards_module,
-        "_resuspend_note_cards",
+        "_suspend_cards",
         lambda *_: 1,
     )
 
@@ -745,9 +842,7 @@ def test_compute_kanji_interval_status_basic(manager, kanjicards_module, monkeyp
 
     def fake_db_all(collection, sql, *params, context=""):
         contexts.append(context)
-        if context.startswith("compute_kanji_interval_status/revlog"):
-            return []
-        return [(1, 1, 25), (2, 1, 10), (3, 0, 0)]
+        return [(1, 1, 25, 0), (2, 1, 10, 0), (3, 0, 0, 0)]
 
     monkeypatch.setattr(kanjicards_module, "_db_all", fake_db_all)
 
@@ -765,9 +860,7 @@ def test_compute_kanji_interval_status_basic(manager, kanjicards_module, monkeyp
 
 def test_compute_kanji_interval_status_fallback_to_current(manager, kanjicards_module, monkeypatch):
     def fake_db_all(collection, sql, *params, context=""):
-        if context.startswith("compute_kanji_interval_status/revlog"):
-            return [(1, 0)]
-        return [(1, 1, 7)]
+        return [(1, 1, 7, 0)]
 
     monkeypatch.setattr(kanjicards_module, "_db_all", fake_db_all)
 
@@ -780,9 +873,7 @@ def test_compute_kanji_interval_status_fallback_to_current(manager, kanjicards_m
 
 def test_compute_kanji_interval_status_prefers_current_when_higher(manager, kanjicards_module, monkeypatch):
     def fake_db_all(collection, sql, *params, context=""):
-        if context.startswith("compute_kanji_interval_status/revlog"):
-            return [(1, 5)]
-        return [(1, 1, 40)]
+        return [(1, 1, 40, 5)]
 
     monkeypatch.setattr(kanjicards_module, "_db_all", fake_db_all)
 
@@ -797,14 +888,13 @@ def test_compute_kanji_interval_status_historical_uses_revlog(manager, kanjicard
 
     def fake_db_all(collection, sql, *params, context=""):
         contexts.append(context)
-        if context.startswith("compute_kanji_interval_status/revlog"):
-            return [(1, 200), (2, 60)]
-        return [(1, 0, 30), (2, 1, 50)]
+        assert "LEFT JOIN revlog" in sql
+        return [(1, 0, 30, 200), (2, 1, 50, 60)]
 
     monkeypatch.setattr(kanjicards_module, "_db_all", fake_db_all)
 
     result = manager._compute_kanji_interval_status(types.SimpleNamespace(), {"火": 1, "水": 2})
-    assert any("revlog" in ctx for ctx in contexts)
+    assert contexts == ["compute_kanji_interval_status/revlog_batch0"]
     assert result["火"].historical_interval == 200
     assert result["火"].has_history is True
     assert result["水"].historical_interval == 60
@@ -813,8 +903,8 @@ def test_compute_kanji_interval_status_historical_uses_revlog(manager, kanjicard
 
 def test_collect_vocab_note_chars_filters(manager, monkeypatch):
     rows = [
-        (10, "火\x1freading", "tag1"),
-        (11, "山\x1fmeaning", "tagA tagB"),
+        (10, 1, "火\x1freading", "tag1"),
+        (11, 1, "山\x1fmeaning", "tagA tagB"),
     ]
     monkeypatch.setattr(
         manager,
@@ -833,6 +923,117 @@ def test_collect_vocab_note_chars_filters(manager, monkeypatch):
     assert 11 in result_filtered and 10 not in result_filtered
 
 
+def test_collect_vocab_note_chars_reuses_unchanged_notes(manager, kanjicards_module, monkeypatch):
+    rows = [(10, 5, "火\x1freading", "")]
+    monkeypatch.setattr(manager, "_fetch_vocab_rows", lambda *args, **kwargs: rows)
+    calls = []
+    original_find = kanjicards_module._find_kanji
+
+    def counting_find(value):
+        calls.append(value)
+        return original_find(value)
+
+    monkeypatch.setattr(kanjicards_module, "_find_kanji", counting_find)
+
+    assert manager._collect_vocab_note_chars(types.SimpleNamespace(), {50: [0]})[10][0] == {"火"}
+    assert manager._collect_vocab_note_chars(types.SimpleNamespace(), {50: [0]})[10][0] == {"火"}
+    assert calls == ["火"]
+
+    rows[0] = (10, 6, "水\x1freading", "")
+    assert manager._collect_vocab_note_chars(types.SimpleNamespace(), {50: [0]})[10][0] == {"水"}
+    assert manager._collect_vocab_note_chars(types.SimpleNamespace(), {50: [0, 1]})[10][0] == {"水"}
+    assert calls == ["火", "水", "水", "reading"]
+
+
+def test_collect_vocab_note_chars_skips_targets_outside_configured_fields(manager, kanjicards_module, monkeypatch):
+    rows = [(10, 1, "reading\x1f火", ""), (11, 1, "火山\x1f", "")]
+    monkeypatch.setattr(manager, "_fetch_vocab_rows", lambda *args, **kwargs: rows)
+    calls = []
+    original_find = kanjicards_module._find_kanji
+    monkeypatch.setattr(kanjicards_module, "_find_kanji", lambda value: calls.append(value) or original_find(value))
+
+    result = manager._collect_vocab_note_chars(types.SimpleNamespace(), {50: [0]}, target_chars={"火"})
+
+    assert set(result) == {11}
+    assert calls == ["火山"]
+
+
+def test_fetch_vocab_rows_uses_char_index(manager, kanjicards_module, monkeypatch):
+    notes = {10: ("火山\x1fvolcano", "tag1"), 11: ("水\x1fwater", ""), 12: ("fire\x1f", "")}
+    mod = {"value": 100}
+    contexts = []
+
+    def fake_db_all(collection, sql, *params, context=""):
+        contexts.append(context)
+        if context == "vocab_char_index/marker":
+            return [(len(notes), mod["value"])]
+        if context == "vocab_char_index/build":
+            return [(nid, flds) for nid, (flds, _tags) in notes.items()]
+        if context == "fetch_vocab_rows/single":
+            model_id, char = params
+            return [(nid, mod["value"], flds, tags) for nid, (flds, tags) in notes.items() if char in flds]
+        assert context.startswith("fetch_vocab_rows/batch")
+        return [(nid, mod["value"], notes[nid][0], notes[nid][1]) for nid in params]
+
+    monkeypatch.setattr(kanjicards_module, "_db_all", fake_db_all)
+
+    rows = manager._fetch_vocab_rows(types.SimpleNamespace(), 50, {"火", "風"})
+    assert rows == [(10, 100, "火山\x1fvolcano", "tag1")]
+    assert manager._fetch_vocab_rows(types.SimpleNamespace(), 50, {"風"}) == []
+    assert manager._fetch_vocab_rows(types.SimpleNamespace(), 50, {"水"}) == [(11, 100, "水\x1fwater", "")]
+    assert contexts.count("vocab_char_index/build") == 1
+    assert "fetch_vocab_rows/single" not in contexts
+
+    notes[11] = ("火\x1fwater", "")
+    mod["value"] = 200
+    rows = manager._fetch_vocab_rows(types.SimpleNamespace(), 50, {"火"})
+    assert [row[0] for row in rows] == [10, 11]
+    assert contexts[-1] == "fetch_vocab_rows/single"
+    assert contexts.count("vocab_char_index/build") == 1
+
+    rows = manager._fetch_vocab_rows(types.SimpleNamespace(), 50, {"火", "水"})
+    assert [row[0] for row in rows] == [10, 11]
+    assert contexts.count("vocab_char_index/build") == 2
+
+
+def test_own_tag_edits_keep_vocab_char_index(manager, kanjicards_module, monkeypatch):
+    notes = {10: ("火山\x1fvolcano", "tag1"), 11: ("水\x1fwater", "")}
+    mod = {"value": 100}
+    contexts = []
+
+    def fake_db_all(collection, sql, *params, context=""):
+        contexts.append(context)
+        if context == "vocab_char_index/marker":
+            return [(len(notes), mod["value"])]
+        if context == "vocab_char_index/build":
+            return [(nid, flds) for nid, (flds, _tags) in notes.items()]
+        assert context.startswith("fetch_vocab_rows/batch")
+        return [(nid, mod["value"], notes[nid][0], notes[nid][1]) for nid in params]
+
+    def bulk_add(note_ids, tag):
+        # Anki stamps every retagged note with a new mod.
+        mod["value"] += 10
+
+    monkeypatch.setattr(kanjicards_module, "_db_all", fake_db_all)
+    collection = types.SimpleNamespace(tags=types.SimpleNamespace(bulk_add=bulk_add, bulk_remove=bulk_add))
+
+    assert [row[0] for row in manager._fetch_vocab_rows(collection, 50, {"火", "水"})] == [10, 11]
+    with manager._keeping_vocab_char_index(collection):
+        manager._apply_planned_note_tags(collection, {"suspended": [10]}, {})
+    assert manager._vocab_char_index[50][0] == (2, 110)
+    assert [row[0] for row in manager._fetch_vocab_rows(collection, 50, {"火", "水"})] == [10, 11]
+    assert contexts.count("vocab_char_index/build") == 1
+
+    # An edit made elsewhere moves the marker without the add-on knowing what changed, so the index is rebuilt.
+    notes[11] = ("火\x1fwater", "")
+    mod["value"] = 200
+    with manager._keeping_vocab_char_index(collection):
+        manager._apply_planned_note_tags(collection, {"suspended": [10]}, {})
+    assert manager._vocab_char_index[50][0] == (2, 110)
+    assert [row[0] for row in manager._fetch_vocab_rows(collection, 50, {"火", "水"})] == [10, 11]
+    assert contexts.count("vocab_char_index/build") == 2
+
+
 def test_load_card_status_for_notes(manager, kanjicards_module, monkeypatch):
     def fake_db_all(collection, sql, *params, context=""):
         assert "load_card_status_for_notes" in context
@@ -846,19 +1047,6 @@ def test_load_card_status_for_notes(manager, kanjicards_module, monkeypatch):
     assert mapping == {1: [(101, -1, 2)], 2: [(102, 0, 0)]}
 
 
-def test_load_note_active_status(manager, kanjicards_module, monkeypatch):
-    def fake_db_all(collection, sql, *params, context=""):
-        assert "load_note_active_status" in context
-        return [
-            (1, 1),
-            (2, 0),
-        ]
-
-    monkeypatch.setattr(kanjicards_module, "_db_all", fake_db_all)
-    status = manager._load_note_active_status(types.SimpleNamespace(), [1, 2])
-    assert status == {1: True, 2: False}
-
-
 def test_recalc_internal_aggregates_stats(manager, kanjicards_module, monkeypatch):
     cfg = make_config(
         kanjicards_module,
@@ -892,7 +1080,7 @@ def test_recalc_internal_aggregates_stats(manager, kanjicards_module, monkeypatc
         "existing_tagged": 1,
         "created": 0,
         "unsuspended": 0,
-        "missing_dictionary": set(),
+        "missing_dictionary": [],
         "tag_removed": 0,
         "resuspended": 0,
         "vocab_suspended": 0,
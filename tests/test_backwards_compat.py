@@ -62,7 +62,7 @@ def test_unsuspend_cards_updates_db(kanjicards_module, monkeypatch):
     assert captured["call"][0].startswith("UPDATE cards SET mod")
 
 
-def test_resuspend_note_cards_uses_scheduler(kanjicards_module, monkeypatch):
+def test_resuspend_notes_cards_uses_scheduler(kanjicards_module, monkeypatch):
     class Sched:
         def __init__(self):
             self.calls = []
@@ -70,21 +70,19 @@ def test_resuspend_note_cards_uses_scheduler(kanjicards_module, monkeypatch):
         def suspend_cards(self, ids):
             self.calls.append(list(ids))
 
-    note = types.SimpleNamespace(id=9)
     monkeypatch.setattr(kanjicards_module, "_db_all", lambda *args, **kwargs: [(1, 0), (2, -1)])
     collection = types.SimpleNamespace(sched=Sched(), db=types.SimpleNamespace(), usn=lambda: 0)
-    count = kanjicards_module._resuspend_note_cards(collection, note)
+    count = kanjicards_module._resuspend_notes_cards(collection, [9])
     assert count == 1
     assert collection.sched.calls == [[1]]
 
 
-def test_resuspend_note_cards_updates_db(kanjicards_module, monkeypatch):
+def test_resuspend_notes_cards_updates_db(kanjicards_module, monkeypatch):
     calls = {}
     monkeypatch.setattr(kanjicards_module, "_db_all", lambda *args, **kwargs: [(1, 0), (2, 1)])
     monkeypatch.setattr(kanjicards_module, "_db_execute", lambda col, sql, *params, context="": calls.setdefault("sql", sql))
     collection = types.SimpleNamespace(sched=None, db=types.SimpleNamespace(), usn=lambda: 0)
-    note = types.SimpleNamespace(id=5)
-    count = kanjicards_module._resuspend_note_cards(collection, note)
+    count = kanjicards_module._resuspend_notes_cards(collection, [5])
     assert count == 2
     assert calls["sql"].startswith("UPDATE cards SET mod")
 
@@ -115,6 +113,14 @@ def test_log_db_error_prints(capsys, kanjicards_module):
     assert "SQL" in output
 
 
+def test_log_db_error_truncates_long_params(capsys, kanjicards_module):
+    params = tuple(range(1000))
+    kanjicards_module._log_db_error("all", "SQL", params, "", RuntimeError("boom"))
+    output = capsys.readouterr().out
+    assert "[1000 total]" in output
+    assert "999" not in output
+
+
 def test_new_note_and_get_note_fallbacks(kanjicards_module):
     class Coll:
         def __init__(self):
@@ -129,3 +135,59 @@ def test_new_note_and_get_note_fallbacks(kanjicards_module):
     col = Coll()
     assert kanjicards_module._new_note(col, {"id": 1}) == {"model": {"id": 1}}
     assert kanjicards_module._get_note(col, 1) == "note"
+
+
+def test_add_note_probes_collection_once(kanjicards_module):
+    probes = []
+
+    class Coll:
+        def __init__(self):
+            self.calls = []
+
+        def __getattr__(self, name):
+            probes.append(name)
+            raise AttributeError(name)
+
+        def add_note(self, note, deck_id=None):
+            self.calls.append((note, deck_id))
+            return True
+
+    col = Coll()
+    for idx in range(3):
+        assert kanjicards_module._add_note(col, "note", idx) is True
+    assert col.calls == [("note", 0), ("note", 1), ("note", 2)]
+    assert probes == ["addNote"]
+
+
+def test_resuspend_notes_cards_batches_note_ids(kanjicards_module, monkeypatch):
+    queries = []
+
+    def fake_db_all(col, sql, *params, context=""):
+        queries.append((sql, params))
+        return [(10, 0), (11, -1), (12, 1)]
+
+    suspended = []
+    monkeypatch.setattr(kanjicards_module, "_db_all", fake_db_all)
+    monkeypatch.setattr(kanjicards_module, "_suspend_cards", lambda col, ids: suspended.append(list(ids)))
+    assert kanjicards_module._resuspend_notes_cards(types.SimpleNamespace(), [3, 1, 3]) == 2
+    assert queries == [("SELECT id, queue FROM cards WHERE nid IN (?,?)", (1, 3))]
+    assert suspended == [[10, 12]]
+    assert kanjicards_module._resuspend_notes_cards(types.SimpleNamespace(), []) == 0
+    assert len(queries) == 1
+
+
+def test_suspend_cards_uses_executemany_when_available(kanjicards_module, monkeypatch):
+    calls = []
+
+    class DB:
+        def executemany(self, sql, rows):
+            calls.append((sql, rows))
+
+    monkeypatch.setattr(kanjicards_module, "intTime", lambda: 100)
+    collection = types.SimpleNamespace(sched=None, db=DB(), usn=lambda: 7)
+    kanjicards_module._suspend_cards(collection, [1, 2])
+    kanjicards_module._unsuspend_cards(collection, [3])
+    assert calls == [
+        ("UPDATE cards SET mod = ?, usn = ?, queue = -1 WHERE id = ?", [(100, 7, 1), (100, 7, 2)]),
+        ("UPDATE cards SET mod = ?, usn = ?, queue = type WHERE id = ?", [(100, 7, 3)]),
+    ]
@@ -7,32 +7,14 @@ import pytest
 
 
 @pytest.fixture
-def manager(kanjicards_module, tmp_path):
-    manager = kanjicards_module.KanjiVocabRecalcManager.__new__(kanjicards_module.KanjiVocabRecalcManager)
+def manager(make_manager, tmp_path):
+    manager = make_manager()
     manager.mw = types.SimpleNamespace()
     manager.addon_name = "KanjiCards"
     manager.addon_dir = str(tmp_path)
-    manager._dictionary_cache = None
-    manager._existing_notes_cache = None
-    manager._kanji_model_cache = None
-    manager._vocab_model_cache = None
-    manager._realtime_error_logged = False
-    manager._missing_deck_logged = False
     manager._sync_hook_installed = False
     manager._sync_hook_target = None
-    manager._profile_config_error_logged = False
-    manager._profile_state_error_logged = False
-    manager._pre_answer_card_state = {}
-    manager._last_question_card_id = None
-    manager._debug_enabled = False
     manager._debug_path = None
-    manager._last_vocab_sync_mod = None
-    manager._last_vocab_sync_count = None
-    manager._pending_vocab_sync_marker = None
-    manager._last_synced_config_hash = None
-    manager._pending_config_hash = None
-    manager._suppress_next_auto_sync = False
-    manager._prioritysieve_waiting_post_sync = False
     return manager
 
 
@@ -137,6 +119,22 @@ def test_load_dictionary_json_frequency_normalization(manager):
     assert data["水"]["frequency"] is None
 
 
+def test_load_dictionary_json_uses_module_decoder(manager, kanjicards_module, monkeypatch):
+    path = Path(manager.addon_dir) / "decoder.json"
+    path.write_text(json.dumps({"火": {"frequency": 7}, "水": {"definition": "water"}}), encoding="utf-8")
+    seen = []
+
+    def fake_loads(raw):
+        seen.append(type(raw))
+        return json.loads(raw)
+
+    monkeypatch.setattr(kanjicards_module, "_json_loads", fake_loads)
+    data = manager._load_dictionary_json(str(path))
+    assert seen == [bytes]
+    assert data["火"]["frequency"] == 7
+    assert "frequency" not in data["水"]
+
+
 def test_load_dictionary_json_invalid(manager):
     bad_path = Path(manager.addon_dir) / "invalid.json"
     bad_path.write_text("[]", encoding="utf-8")
@@ -221,17 +219,69 @@ def test_load_dictionary_kanjidic_invalid_xml(manager):
         manager._load_dictionary_kanjidic(str(xml_path))
 
 
+def test_load_dictionary_kanjidic_streams_top_level_characters(manager):
+    xml_path = Path(manager.addon_dir) / "stream.xml"
+    xml_path.write_text(
+        "<kanjidic2><header><character><literal>外</literal></character></header>"
+        "<character><literal>水</literal></character>"
+        "<character><literal></literal></character>"
+        "<character><literal>木</literal></character></kanjidic2>",
+        encoding="utf-8",
+    )
+    data = manager._load_dictionary_kanjidic(str(xml_path))
+    assert list(data) == ["水", "木"]
+
+    wrong_root = Path(manager.addon_dir) / "wrong.xml"
+    wrong_root.write_text("<other><character><literal>水</literal></character></other>", encoding="utf-8")
+    with pytest.raises(RuntimeError, match="KANJIDIC2"):
+        manager._load_dictionary_kanjidic(str(wrong_root))
+
+
+def test_load_dictionary_kanjidic_wraps_backend_parse_errors(manager, kanjicards_module, monkeypatch):
+    class FakeSyntaxError(Exception):
+        pass
+
+    def fake_iterparse(handle, events):
+        raise FakeSyntaxError("broken")
+
+    monkeypatch.setattr(kanjicards_module, "_xml_etree", types.SimpleNamespace(iterparse=fake_iterparse))
+    monkeypatch.setattr(kanjicards_module, "_XML_PARSE_ERRORS", (FakeSyntaxError,))
+    xml_path = Path(manager.addon_dir) / "backend.xml"
+    xml_path.write_text("<kanjidic2/>", encoding="utf-8")
+    with pytest.raises(RuntimeError, match="could not be parsed"):
+        manager._load_dictionary_kanjidic(str(xml_path))
+
+
+def test_xml_backend_is_imported_on_first_use(kanjicards_module, monkeypatch):
+    monkeypatch.setattr(kanjicards_module, "_xml_etree", None)
+    monkeypatch.setattr(kanjicards_module, "_XML_PARSE_ERRORS", kanjicards_module._XML_PARSE_ERRORS)
+    backend = kanjicards_module._ensure_xml_backend()
+    assert callable(backend.iterparse)
+    assert kanjicards_module._xml_etree is backend
+    assert kanjicards_module._ensure_xml_backend() is backend
+
+
 def test_profile_config_path(manager_with_profile, tmp_path):
     expected = Path(manager_with_profile._profile_config_path())
     assert expected.name == "kanjicards_config.json"
     assert expected.parent == tmp_path / "profile"
 
 
-def test_debug_writes_payload(manager_with_profile):
+def test_debug_writes_payload(manager_with_profile, kanjicards_module, monkeypatch):
     manager_with_profile._debug_enabled = True
+    makedirs_calls = []
+    real_makedirs = kanjicards_module.os.makedirs
+    monkeypatch.setattr(
+        kanjicards_module.os,
+        "makedirs",
+        lambda *args, **kwargs: makedirs_calls.append(args) or real_makedirs(*args, **kwargs),
+    )
     manager_with_profile._debug("event", value=object())
+    manager_with_profile._debug("second")
     contents = Path(manager_with_profile._debug_path).read_text(encoding="utf-8")
     assert "event" in contents
+    assert "second" in contents
+    assert len(makedirs_calls) == 1
 
 
 def test_load_profile_config_roundtrip(manager_with_profile):
@@ -280,6 +330,21 @@ def test_write_profile_config_creates_directory(manager_with_profile, tmp_path):
     assert not state_path.exists()
 
 
+def test_write_profile_config_skips_unchanged_content(manager_with_profile):
+    path = Path(manager_with_profile._profile_config_path())
+    manager_with_profile._write_profile_config({"value": 3})
+    first_stat = path.stat()
+    os.utime(path, ns=(first_stat.st_atime_ns, first_stat.st_mtime_ns - 10_000_000))
+    stale_mtime = path.stat().st_mtime_ns
+
+    manager_with_profile._write_profile_config({"value": 3})
+    assert path.stat().st_mtime_ns == stale_mtime
+
+    manager_with_profile._write_profile_config({"value": 4})
+    assert json.loads(path.read_text(encoding="utf-8"))["value"] == 4
+    assert not Path(f"{path}.tmp").exists()
+
+
 def test_write_profile_config_separates_state(manager_with_profile):
     config_path = Path(manager_with_profile._profile_config_path())
     state_path = Path(manager_with_profile._profile_state_path())
@@ -329,12 +394,14 @@ def test_load_profile_config_migrates_legacy_state(manager_with_profile):
 
 
 def test_merge_config_sources_nested(manager_with_profile):
-    global_cfg = {"nested": {"value": 1, "other": 2}, "plain": 3}
-    profile_cfg = {"nested": {"value": 99}, "plain": 4}
+    global_cfg = {"nested": {"value": 1, "other": 2, "deep": {"a": 1, "b": 2}}, "plain": 3}
+    profile_cfg = {"nested": {"value": 99, "deep": {"b": 5}}, "plain": 4}
     merged = manager_with_profile._merge_config_sources(global_cfg, profile_cfg)
     assert merged["nested"]["value"] == 99
     assert merged["nested"]["other"] == 2
+    assert merged["nested"]["deep"] == {"a": 1, "b": 5}
     assert merged["plain"] == 4
+    assert global_cfg["nested"] == {"value": 1, "other": 2, "deep": {"a": 1, "b": 2}}
 
 
 def test_load_config_uses_profile_and_global(manager_with_profile, kanjicards_module):
@@ -353,6 +420,33 @@ def test_load_config_uses_profile_and_global(manager_with_profile, kanjicards_mo
     assert cfg.kanji_note_type.name == "Profile"
 
 
+def test_load_config_reuses_parsed_config_until_saved(manager_with_profile, monkeypatch):
+    manager_with_profile.mw.addonManager._config = {"existing_tag": "global_tag"}
+    reads = []
+    original = manager_with_profile._read_config
+    monkeypatch.setattr(manager_with_profile, "_read_config", lambda: reads.append(1) or original())
+    monkeypatch.setattr(manager_with_profile, "_install_sync_hook", lambda: None)
+
+    first = manager_with_profile.load_config()
+    assert manager_with_profile.load_config() is first
+    assert len(reads) == 1
+
+    saved = manager_with_profile._config_from_raw({"existing_tag": "saved"})
+    manager_with_profile.save_config(saved)
+    assert manager_with_profile.load_config() is saved
+    assert len(reads) == 1
+
+
+def test_read_config_leaves_cached_config_and_realtime_flag(manager_with_profile):
+    cfg = manager_with_profile.load_config()
+    assert manager_with_profile._realtime_enabled_cached is cfg.realtime_review
+
+    manager_with_profile._realtime_enabled_cached = None
+    assert manager_with_profile._read_config() is not cfg
+    assert manager_with_profile._realtime_enabled_cached is None
+    assert manager_with_profile.load_config() is cfg
+
+
 def test_save_config_writes_and_resets(manager_with_profile, kanjicards_module, monkeypatch):
     cfg = manager_with_profile._config_from_raw(
         {
@@ -379,7 +473,7 @@ def test_save_config_writes_and_resets(manager_with_profile, kanjicards_module,
 
     assert manager_with_profile.mw.addonManager.written_configs
     assert written["existing_tag"] == "existing"
-    assert manager_with_profile._dictionary_cache is None
+    assert manager_with_profile._dictionary_cache == {}
     assert manager_with_profile._existing_notes_cache is None
     assert manager_with_profile._kanji_model_cache is None
     assert manager_with_profile._vocab_model_cache is None
@@ -404,3 +498,38 @@ def test_load_dictionary_handles_xml_path(manager):
     )
     data = manager._load_dictionary(str(xml_path))
     assert "火" in data
+
+
+def test_load_dictionary_reuses_disk_cache_until_xml_changes(manager, kanjicards_module, monkeypatch):
+    xml_path = Path(manager.addon_dir) / "dict.xml"
+    xml_path.write_text("<kanjidic2><character><literal>火</literal></character></kanjidic2>", encoding="utf-8")
+    first = manager._load_dictionary(str(xml_path))
+    assert (Path(manager.addon_dir) / kanjicards_module.DICTIONARY_CACHE_FILE_NAME).exists()
+
+    original_parse = manager._load_dictionary_kanjidic
+    parses = []
+
+    def counting_parse(path):
+        parses.append(path)
+        return original_parse(path)
+
+    monkeypatch.setattr(manager, "_load_dictionary_kanjidic", counting_parse)
+    manager._dictionary_cache = None
+    assert manager._load_dictionary(str(xml_path)) == first
+    assert parses == []
+
+    xml_path.write_text("<kanjidic2><character><literal>水</literal></character></kanjidic2>", encoding="utf-8")
+    os.utime(xml_path, (1_000_000, 1_000_000))
+    manager._dictionary_cache = None
+    assert list(manager._load_dictionary(str(xml_path))) == ["水"]
+    assert parses == [str(xml_path)]
+
+
+def test_load_dictionary_json_source_served_normalized_from_disk_cache(manager, monkeypatch):
+    path = Path(manager.addon_dir) / "freq.json"
+    path.write_text(json.dumps({"火": {"frequency": "12"}}), encoding="utf-8")
+    assert manager._load_dictionary(str(path))["火"]["frequency"] == 12
+
+    monkeypatch.setattr(manager, "_load_dictionary_json", lambda _path: pytest.fail("source should not be re-read"))
+    manager._dictionary_cache = None
+    assert manager._load_dictionary(str(path)) == {"火": {"frequency": 12}}
@@ -42,19 +42,9 @@ class FakeCollection:
 
 
 @pytest.fixture
-def manager(kanjicards_module):
-    manager = kanjicards_module.KanjiVocabRecalcManager.__new__(kanjicards_module.KanjiVocabRecalcManager)
+def manager(make_manager):
+    manager = make_manager()
     manager.mw = types.SimpleNamespace()
-    manager._profile_config_error_logged = False
-    manager._profile_state_error_logged = False
-    manager._prioritysieve_waiting_post_sync = False
-    manager._missing_deck_logged = False
-    manager._last_vocab_sync_mod = None
-    manager._last_vocab_sync_count = None
-    manager._pending_vocab_sync_marker = None
-    manager._last_synced_config_hash = None
-    manager._pending_config_hash = None
-    manager._suppress_next_auto_sync = False
     return manager
 
 
@@ -92,6 +82,32 @@ def test_chunk_sequence_splits_and_validates(kanjicards_module):
         list(kanjicards_module._chunk_sequence([1], 0))
 
 
+def test_callable_attrs_probes_each_object_once(kanjicards_module):
+    probes = []
+
+    class Decks:
+        def __getattr__(self, name):
+            probes.append(name)
+            raise AttributeError(name)
+
+        def id(self, name):
+            return 1
+
+    decks = Decks()
+    names = kanjicards_module.DECK_ID_FOR_NAME_ATTRS
+    assert kanjicards_module._callable_attrs(decks, names) == ("id",)
+    assert kanjicards_module._callable_attrs(decks, names) == ("id",)
+    assert probes == ["id_for_name", "idForName"]
+
+
+def test_load_card_status_for_notes_splits_at_variable_limit(manager, kanjicards_module, monkeypatch):
+    batches = []
+    monkeypatch.setattr(kanjicards_module, "_db_all", lambda col, sql, *params, context="": batches.append(params) or [])
+    limit = kanjicards_module.SQLITE_MAX_VARIABLES
+    manager._load_card_status_for_notes(types.SimpleNamespace(), list(range(limit + 1)))
+    assert [len(params) for params in batches] == [limit, 1]
+
+
 def test_have_vocab_notes_changed_initial_run(manager, kanjicards_module, monkeypatch):
     cfg = make_config(kanjicards_module)
     monkeypatch.setattr(manager, "_resolve_vocab_models", lambda *args, **kwargs: [])
@@ -118,9 +134,21 @@ def test_have_vocab_notes_changed_detects_change(manager, kanjicards_module, mon
 
 def test_remove_tag_case_insensitive(kanjicards_module):
     note = FakeNote(1, tags=["Tag", "other"])
+    tags = note.tags
     removed = kanjicards_module._remove_tag_case_insensitive(note, "tag")
     assert removed is True
     assert "Tag" not in note.tags
+    assert note.tags is tags
+
+    note = FakeNote(2, tags=["TAG", "other", "tag"])
+    assert kanjicards_module._remove_tag_case_insensitive(note, " Tag ") is True
+    assert note.tags == ["other"]
+    assert kanjicards_module._remove_tag_case_insensitive(note, "tag") is False
+    assert kanjicards_module._remove_tag_case_insensitive(note, "  ") is False
+
+    note = FakeNote(3, tags=["Bucket", "keep"])
+    assert kanjicards_module._remove_tag_case_insensitive_prepared(note, "bucket") is True
+    assert note.tags == ["keep"]
 
 
 def test_ensure_note_tagged(manager, kanjicards_module):
@@ -215,8 +243,9 @@ def test_unsuspend_note_cards_if_needed(manager, kanjicards_module, monkeypatch)
         "_unsuspend_cards",
         lambda col, ids: calls.extend(ids),
     )
-    count = manager._unsuspend_note_cards_if_needed(collection, note, "Unsuspend")
+    count, changed = manager._unsuspend_note_cards_if_needed(collection, note, "Unsuspend")
     assert count == 2
+    assert changed is True
     assert calls == [11, 12]
     assert "Unsuspend" in note.tags
     assert note.flush_count == 1
@@ -227,11 +256,20 @@ def test_unsuspend_note_cards_if_needed_skips_leech(manager, kanjicards_module,
     collection = types.SimpleNamespace(conf={"leechTag": "Leech"})
     called = []
     monkeypatch.setattr(kanjicards_module, "_db_all", lambda *args, **kwargs: called.append(True))
-    count = manager._unsuspend_note_cards_if_needed(collection, note, "Unsuspend")
-    assert count == 0
+    assert manager._unsuspend_note_cards_if_needed(collection, note, "Unsuspend") == (0, False)
     assert called == []
 
 
+def test_unsuspend_note_cards_if_needed_uses_preloaded_rows(manager, kanjicards_module, monkeypatch):
+    note = FakeNote(8, tags=[])
+    monkeypatch.setattr(kanjicards_module, "_db_all", lambda *args, **kwargs: pytest.fail("unexpected query"))
+    calls = []
+    monkeypatch.setattr(kanjicards_module, "_unsuspend_cards", lambda col, ids: calls.extend(ids))
+    rows = [(21, -1, 0), (22, 0, 0)]
+    assert manager._unsuspend_note_cards_if_needed(types.SimpleNamespace(), note, "", rows, "leech") == (1, False)
+    assert calls == [21]
+
+
 def test_deck_entry_name_variants(manager):
     entry_obj = types.SimpleNamespace(name="DeckObj")
     assert manager._deck_entry_name(entry_obj) == "DeckObj"
@@ -259,6 +297,21 @@ def test_lookup_deck_id_scans_entries(manager):
     assert manager._lookup_deck_id(collection, "Target") == 654
 
 
+def test_lookup_deck_id_builds_name_index_once(manager):
+    calls = []
+
+    def all_names_and_ids():
+        calls.append(True)
+        return [("Target", 654), types.SimpleNamespace(name="Other", id=777)]
+
+    collection = types.SimpleNamespace(decks=types.SimpleNamespace(all_names_and_ids=all_names_and_ids))
+    assert manager._lookup_deck_id(collection, "Target") == 654
+    assert manager._lookup_deck_id(collection, "Other") == 777
+    assert manager._lookup_deck_id(collection, "Missing") is None
+    assert len(calls) == 1
+    assert manager._deck_entry_id_pair(("Bad", 0)) == ("Bad", None)
+
+
 def test_resolve_deck_id_uses_lookup(manager, kanjicards_module, monkeypatch):
     cfg = make_config(kanjicards_module, kanji_deck_name="Target")
     collection = types.SimpleNamespace(decks=types.SimpleNamespace())
@@ -339,3 +392,145 @@ def test_resolve_deck_id_raises_when_missing(manager, kanjicards_module):
     collection = types.SimpleNamespace(decks=decks)
     with pytest.raises(RuntimeError):
         manager._resolve_deck_id(collection, {"did": None}, cfg)
+
+
+def test_compute_vocab_sync_marker_uses_fixed_statement(manager):
+    calls = []
+
+    class DB:
+        def all(self, sql, *params):
+            calls.append((sql, params))
+            return [(3, 42)]
+
+    collection = types.SimpleNamespace(db=DB())
+    one_model = [({"id": 1}, [0], 1.0)]
+    two_models = [({"id": 1}, [0], 1.0), ({"id": 2}, [0], 1.0)]
+    assert manager._compute_vocab_sync_marker(collection, one_model) == (3, 42)
+    assert manager._compute_vocab_sync_marker(collection, two_models) == (3, 42)
+    assert calls[0][0] == calls[1][0]
+    assert calls[1][1] == ("[1, 2]",)
+
+
+def test_find_notes_with_bucket_tags_uses_anchored_patterns(manager):
+    captured = {}
+
+    def fake_all(sql, *params):
+        captured["sql"] = sql
+        captured["params"] = params
+        return [(1, " Bucket_A other "), (2, " bucket_a_old ")]
+
+    collection = types.SimpleNamespace(db=types.SimpleNamespace(all=fake_all))
+    result = manager._find_notes_with_bucket_tags(collection, {"bucket_a"})
+
+    assert captured["params"] == ("% bucket\\_a %",)
+    assert "ESCAPE" in captured["sql"]
+    assert result == {1: " Bucket_A other "}
+
+
+def test_find_kanji_skips_ascii_fields(kanjicards_module):
+    assert kanjicards_module._find_kanji("[sound:kasai.mp3] fire") == []
+    assert kanjicards_module._find_kanji("火事 (かじ)") == ["火", "事"]
+    assert kanjicards_module._find_kanji("ｶﾀｶﾅ only") == []
+
+
+def test_field_name_index_cached_until_model_changes(manager):
+    model = {"id": 5, "mod": 10, "name": "Vocab", "flds": [{"name": "Front"}, {"name": "Back"}]}
+    first = manager._field_name_index(model)
+    assert first == {"Front": 0, "Back": 1}
+    assert manager._field_name_index(dict(model)) is first
+
+    changed = {"id": 5, "mod": 11, "name": "Vocab", "flds": [{"name": "Back"}, {"name": "Front"}]}
+    assert manager._field_name_index(changed) == {"Back": 0, "Front": 1}
+    unversioned = {"id": 6, "name": "Fake", "flds": [{"name": "Only"}]}
+    assert manager._field_name_index(unversioned) is not manager._field_name_index(unversioned)
+
+
+def test_index_existing_kanji_notes_reads_kanji_field(manager):
+    rows = [(1, "meaning\x1f火\x1fextra\x1fmore"), (2, "other\x1f火"), (3, "short"), (4, "x\x1f 水 ")]
+    collection = types.SimpleNamespace(db=types.SimpleNamespace(all=lambda sql, *params: rows))
+    mapping = manager._index_existing_kanji_notes(collection, {"id": 9}, 1)
+    assert mapping == {"火": 1, "水": 4}
+
+
+def test_get_existing_kanji_notes_rebuilds_when_notes_change(manager):
+    state = {"marker": (1, 100), "rows": [(1, "火")], "scans": 0}
+
+    def fake_all(sql, *params):
+        if sql.startswith("SELECT COUNT(*), MAX(mod) FROM notes WHERE mid = ?"):
+            return [state["marker"]]
+        state["scans"] += 1
+        return list(state["rows"])
+
+    collection = types.SimpleNamespace(db=types.SimpleNamespace(all=fake_all))
+    model = {"id": 9}
+    manager._existing_notes_cache = None
+    assert manager._get_existing_kanji_notes(collection, model, 0) == {"火": 1}
+    assert manager._get_existing_kanji_notes(collection, model, 0) == {"火": 1}
+    assert state["scans"] == 1
+
+    state["marker"] = (0, 100)
+    state["rows"] = []
+    assert manager._get_existing_kanji_notes(collection, model, 0) == {}
+    assert state["scans"] == 2
+
+
+def test_frozen_widget_restores_updates_and_signals(kanjicards_module):
+    calls = []
+
+    class Widget:
+        def setUpdatesEnabled(self, enabled):
+            calls.append(("updates", enabled))
+
+        def blockSignals(self, blocked):
+            calls.append(("signals", blocked))
+            return False
+
+    with pytest.raises(RuntimeError):
+        with kanjicards_module._frozen_widget(Widget()):
+            raise RuntimeError("boom")
+    assert calls == [("updates", False), ("signals", True), ("signals", False), ("updates", True)]
+
+    with kanjicards_module._frozen_widget(object()):
+        pass
+
+
+def test_sql_placeholders_matches_count(kanjicards_module):
+    assert kanjicards_module._sql_placeholders(1) == "?"
+    assert kanjicards_module._sql_placeholders(3) == "?,?,?"
+    assert kanjicards_module._sql_placeholders(3) is kanjicards_module._sql_placeholders(3)
+
+
+def test_tag_helpers_resolve_note_methods_per_class(kanjicards_module):
+    class TaggedNote:
+        def __init__(self):
+            self.tags = []
+
+        def add_tag(self, tag):
+            self.tags.append(tag)
+
+        def remove_tag(self, tag):
+            self.tags.remove(tag)
+
+    first, second = TaggedNote(), TaggedNote()
+    kanjicards_module._add_tag(first, "a")
+    kanjicards_module._add_tag(second, "b")
+    kanjicards_module._remove_tag(first, "a")
+    assert first.tags == [] and second.tags == ["b"]
+    assert kanjicards_module._NOTE_TAG_METHODS[TaggedNote] == (TaggedNote.add_tag, TaggedNote.remove_tag)
+
+    legacy = types.SimpleNamespace(tags=[])
+    legacy.addTag = legacy.tags.append
+    kanjicards_module._add_tag(legacy, "c")
+    assert legacy.tags == ["c"]
+
+
+def test_card_state_helpers_read_and_coerce_ids(kanjicards_module):
+    card = types.SimpleNamespace(id=1, type=2, queue=3, nid=4)
+    assert kanjicards_module._card_state_attrs(card) == (1, 2, 3, 4)
+    assert kanjicards_module._card_state_attrs(types.SimpleNamespace(id="5")) == ("5", None, None, None)
+
+    assert kanjicards_module._coerce_card_id(7) == 7
+    assert kanjicards_module._coerce_card_id("8") == 8
+    assert kanjicards_module._coerce_card_id(b"9") == 9
+    assert kanjicards_module._coerce_card_id("x") is None
+    assert kanjicards_module._coerce_card_id(None) is None
@@ -293,6 +293,26 @@ def test_prioritysieve_recalc_runs_kanjicards_afterwards(manager_with_profile, m
     assert events == ["priority_recalc", "priority_followup", "kanjicards"]
 
 
+def test_prioritysieve_completion_hook_wrapped_once(manager_with_profile):
+    events: list[str] = []
+    ps_main = types.ModuleType("prioritysieve.recalc.recalc_main")
+
+    def on_success():
+        events.append("success")
+
+    ps_main._on_success = on_success
+    manager_with_profile._handle_prioritysieve_recalc_completed = lambda: events.append("kanjicards")
+
+    manager_with_profile._wrap_prioritysieve_completion_hook(ps_main, "_on_success")
+    wrapped = ps_main._on_success
+    manager_with_profile._wrap_prioritysieve_completion_hook(ps_main, "_on_success")
+
+    assert ps_main._on_success is wrapped
+    assert not hasattr(wrapped, "_kanjicards_completion_wrapper")
+    ps_main._on_success()
+    assert events == ["success", "kanjicards"]
+
+
 def test_prioritysieve_recalc_skips_kanjicards_when_not_waiting(manager_with_profile, monkeypatch):
     events: list[str] = []
 
@@ -403,6 +423,35 @@ def test_on_sync_event_handles_busy_and_followup(manager_with_profile, kanjicard
     assert delays.count(200) >= 2
 
 
+def test_run_after_sync_backs_off_while_busy(manager_with_profile, kanjicards_module, tmp_path, monkeypatch):
+    mw = FakeMainWindow(tmp_path)
+    manager_with_profile.mw = mw
+    manager_with_profile._suppress_next_auto_sync = False
+    cfg = manager_with_profile._config_from_raw(
+        {
+            "kanji_note_type": {"name": "Kanji", "fields": {}},
+            "vocab_note_types": [],
+            "auto_run_on_sync": True,
+        }
+    )
+    manager_with_profile.load_config = lambda: cfg  # type: ignore[assignment]
+    manager_with_profile._have_vocab_notes_changed = lambda collection, cfg: True  # type: ignore[assignment]
+    manager_with_profile.run_recalc = lambda: pytest.fail("recalc should not run while busy")  # type: ignore[assignment]
+    mw.col = object()
+    mw.progress.busy_values = [True] * (kanjicards_module.SYNC_BUSY_MAX_RETRIES + 1)
+
+    delays = []
+    monkeypatch.setattr(kanjicards_module.QTimer, "singleShot", lambda delay, callback: (delays.append(delay), callback()))
+    results = []
+
+    manager_with_profile.run_after_sync(on_finished=results.append)
+
+    assert delays[:4] == [200, 400, 800, 1600]
+    assert max(delays) == kanjicards_module.SYNC_BUSY_RETRY_MAX_DELAY_MS
+    assert len(delays) == kanjicards_module.SYNC_BUSY_MAX_RETRIES
+    assert results == [False]
+
+
 def test_on_sync_event_skips_when_prioritysieve_enabled(manager_with_profile, monkeypatch):
     run_calls = {}
 
@@ -554,6 +603,17 @@ def test_on_sync_event_respects_suppression(manager_with_profile):
     assert manager_with_profile._suppress_next_auto_sync is False
 
 
+def test_on_sync_event_drops_note_caches(manager_with_profile):
+    manager_with_profile._suppress_next_auto_sync = True
+    manager_with_profile._existing_notes_cache = {"key": (1, 0, 1, 1), "mapping": {"火": 5}}
+    manager_with_profile._vocab_char_index = {1: ((1, 1), {"火": {10}})}
+    manager_with_profile._vocab_note_chars_cache = {10: (1, (0,), frozenset({"火"}))}
+    manager_with_profile._on_sync_event()
+    assert manager_with_profile._existing_notes_cache is None
+    assert manager_with_profile._vocab_char_index == {}
+    assert manager_with_profile._vocab_note_chars_cache == {}
+
+
 def test_on_sync_event_skips_when_no_vocab_changes(manager_with_profile, tmp_path):
     mw = FakeMainWindow(tmp_path)
     manager_with_profile.mw = mw
@@ -577,3 +637,12 @@ def test_on_sync_event_skips_when_no_vocab_changes(manager_with_profile, tmp_pat
     mw.col = types.SimpleNamespace()
     manager_with_profile._on_sync_event()
     assert "run" not in called
+
+
+def test_on_profile_loaded_resets_config_and_realtime_flag(manager_with_profile, kanjicards_module, monkeypatch):
+    monkeypatch.setattr(kanjicards_module, "_manager", manager_with_profile)
+    manager_with_profile._config_cache = manager_with_profile._config_from_raw({})
+    manager_with_profile._realtime_enabled_cached = False
+    kanjicards_module.on_profile_loaded()
+    assert manager_with_profile._config_cache is None
+    assert manager_with_profile._realtime_enabled_cached is None
@@ -62,27 +62,10 @@ class FakeCollection:
 
 
 @pytest.fixture
-def manager(kanjicards_module):
-    manager = kanjicards_module.KanjiVocabRecalcManager.__new__(kanjicards_module.KanjiVocabRecalcManager)
+def manager(make_manager):
+    manager = make_manager()
     manager.mw = types.SimpleNamespace()
-    manager._profile_config_error_logged = False
-    manager._profile_state_error_logged = False
-    manager._prioritysieve_waiting_post_sync = False
-    manager._debug_enabled = False
     manager._debug_path = None
-    manager._pre_answer_card_state = {}
-    manager._last_question_card_id = None
-    manager._kanji_model_cache = None
-    manager._existing_notes_cache = None
-    manager._dictionary_cache = None
-    manager._vocab_model_cache = None
-    manager._realtime_error_logged = False
-    manager._last_vocab_sync_mod = None
-    manager._last_vocab_sync_count = None
-    manager._pending_vocab_sync_marker = None
-    manager._suppress_next_auto_sync = False
-    manager._last_synced_config_hash = None
-    manager._pending_config_hash = None
     return manager
 
 
@@ -252,6 +235,19 @@ def test_on_reviewer_did_show_question_handles_string_id(manager):
     assert manager._last_question_card_id == 42
 
 
+def test_on_reviewer_did_show_question_bounds_pending_state(manager, kanjicards_module):
+    limit = kanjicards_module.PRE_ANSWER_STATE_LIMIT
+    for card_id in range(1, limit + 3):
+        manager._on_reviewer_did_show_question(types.SimpleNamespace(id=card_id, type=0, queue=0, nid=card_id))
+    manager._on_reviewer_did_show_question(types.SimpleNamespace(id=3, type=0, queue=0, nid=3))
+
+    state = manager._pre_answer_card_state
+    assert len(state) == limit
+    assert 1 not in state and 2 not in state
+    assert next(reversed(state)) == 3
+    assert manager._last_question_card_id == 3
+
+
 def test_on_reviewer_did_answer_card_logs_errors(manager, monkeypatch):
     manager.mw.col = types.SimpleNamespace()
     called = {}
@@ -409,7 +405,7 @@ def test_process_reviewed_card_respects_interval_threshold(manager, kanjicards_m
     )
     monkeypatch.setattr(
         kanjicards_module,
-        "_resuspend_note_cards",
+        "_suspend_cards",
         lambda *args, **kwargs: 0,
     )
     manager.mw.col = types.SimpleNamespace()
@@ -478,7 +474,7 @@ def test_process_reviewed_card_unsuspends_when_interval_sufficient(manager, kanj
     )
     monkeypatch.setattr(
         kanjicards_module,
-        "_resuspend_note_cards",
+        "_suspend_cards",
         lambda *args, **kwargs: 0,
     )
     manager.mw.col = types.SimpleNamespace()
@@ -497,6 +493,8 @@ def test_stats_warrant_sync_checks_keys(manager):
     assert manager._stats_warrant_sync(stats_true) is True
     stats_false = {"created": "0", "existing_tagged": 0}
     assert manager._stats_warrant_sync(stats_false) is False
+    assert manager._stats_warrant_sync({"cards_reordered": "3", "created": None}) is True
+    assert manager._stats_warrant_sync({"created": "n/a", "tag_removed": -1}) is False
 
 
 def test_trigger_followup_sync_uses_handler(manager):
@@ -538,7 +536,7 @@ def test_resolve_vocab_models_filters_missing_fields(manager, kanjicards_module)
     collection = FakeCollection([vocab_model])
     cfg = make_config(kanjicards_module)
     results = manager._resolve_vocab_models(collection, cfg)
-    assert results == [(vocab_model, [0], 1.0)]
+    assert results == [(vocab_model, (0,), 1.0)]
 
 
 def test_resolve_field_indexes_maps_names(manager):
@@ -566,6 +564,18 @@ def test_get_vocab_model_map_uses_cache(manager, kanjicards_module):
     assert cached == mapping
 
 
+def test_models_by_name_reuses_single_all_call(manager):
+    model = {"id": 1, "name": "Vocab", "flds": []}
+    collection = FakeCollection([model])
+
+    assert manager._models_by_name(collection) == {"Vocab": model}
+    collection.models._models.clear()
+    assert manager._models_by_name(collection) == {"Vocab": model}
+
+    manager._models_by_name_cache = None
+    assert manager._models_by_name(collection) == {}
+
+
 def test_notify_summary_formats_message(manager, kanjicards_module, monkeypatch):
     messages = []
 
@@ -600,7 +610,7 @@ def test_progress_step_runs_update(manager, kanjicards_module, monkeypatch):
             callback()
 
     manager.mw = types.SimpleNamespace(taskman=FakeTaskman())
-    tracker = {"progress": FakeProgress(), "current": 0, "max": 2}
+    tracker = manager._new_progress_tracker(FakeProgress(), 2)
     monkeypatch.setattr(
         kanjicards_module.QApplication,
         "processEvents",
@@ -609,3 +619,50 @@ def test_progress_step_runs_update(manager, kanjicards_module, monkeypatch):
     manager._progress_step(tracker, "Step")
     assert updates and updates[0]["label"] == "Step"
     assert tracker["current"] == 1
+
+
+def test_progress_step_throttles_event_pump(manager, kanjicards_module, monkeypatch):
+    pumps = []
+
+    class FakeProgress:
+        def update(self, **kwargs):
+            return None
+
+    manager.mw = types.SimpleNamespace()
+    tracker = manager._new_progress_tracker(FakeProgress(), 3)
+    monkeypatch.setattr(kanjicards_module.QApplication, "processEvents", staticmethod(lambda: pumps.append(True)))
+    manager._progress_step(tracker, "First")
+    manager._progress_step(tracker, "Second")
+    assert len(pumps) == 1
+    assert tracker["current"] == 2
+
+
+def test_reviewer_hooks_skip_when_realtime_disabled(manager, kanjicards_module):
+    manager._realtime_enabled_cached = False
+    processed = []
+    manager._process_reviewed_card = lambda card: processed.append(card)  # type: ignore[assignment]
+    manager.mw.col = types.SimpleNamespace()
+    card = types.SimpleNamespace(id=42, type=0, queue=0, nid=9)
+    manager._on_reviewer_did_show_question(card)
+    manager._on_reviewer_did_answer_card(card)
+    assert manager._pre_answer_card_state == {}
+    assert processed == []
+
+
+def test_progress_step_uses_handles_resolved_with_tracker(manager, kanjicards_module, monkeypatch):
+    updates = []
+    scheduled = []
+
+    def run_on_main(callback):
+        scheduled.append(callback)
+        callback()
+
+    manager.mw = types.SimpleNamespace(taskman=types.SimpleNamespace(run_on_main=run_on_main))
+    tracker = manager._new_progress_tracker(types.SimpleNamespace(update=lambda **kwargs: updates.append(kwargs)), 2)
+    # Handles swapped after the tracker was built are not looked up again.
+    manager.mw = types.SimpleNamespace()
+    tracker["progress"] = object()
+    monkeypatch.setattr(kanjicards_module.QApplication, "processEvents", staticmethod(lambda: None))
+    manager._progress_step(tracker, "Cached")
+    assert updates == [{"label": "Cached", "value": 1, "max": 2}]
+    assert len(scheduled) == 1
@@ -1,3 +1,4 @@
+import json
 import types
 
 import pytest
@@ -71,21 +72,24 @@ class FakeDB:
                         card["mod"],
                         card["usn"],
                         note.serialize_fields(),
+                        note.tag_string(),
                     )
                 )
             return rows
 
         if sql_simple.startswith("SELECT id, tags FROM notes"):
-            patterns = [param.strip("%").lower() for param in params]
+            assert sql_simple.count("ESCAPE") == len(params)
+            patterns = [param[1:-1].replace("\\_", "_").replace("\\%", "%").lower() for param in params]
             results = []
             for note in self.collection.notes.values():
-                tags_str = note.tag_string()
+                # Anki stores tags with a leading and trailing space.
+                tags_str = f" {note.tag_string()} "
                 tag_lower = tags_str.lower()
-                if any(pattern and pattern in tag_lower for pattern in patterns):
+                if any(pattern.strip() and pattern in tag_lower for pattern in patterns):
                     results.append((note.id, tags_str))
             return results
         if sql_simple.startswith("SELECT COUNT(*), MAX(mod) FROM notes WHERE mid IN"):
-            mids = {int(mid) for mid in params}
+            mids = {int(mid) for mid in json.loads(params[0])}
             matching = [note for note in self.collection.notes.values() if note.mid in mids]
             count = len(matching)
             max_mod = 0
@@ -106,12 +110,18 @@ class FakeDB:
 
         raise AssertionError(f"Unhandled SQL execute in test stub: {sql}")
 
+    def executemany(self, sql, rows):
+        self.collection.executemany_calls += 1
+        for params in rows:
+            self.execute(sql, *params)
+
 
 class FakeCollection:
     def __init__(self, notes, cards, usn=100):
         self.notes = {note.id: note for note in notes}
         self.cards = {card["id"]: dict(card) for card in cards}
         self.updated_cards = []
+        self.executemany_calls = 0
         self._usn = usn
         self.db = FakeDB(self)
 
@@ -122,18 +132,9 @@ class FakeCollection:
         return self.notes[note_id]
 
 
-def build_environment(kanjicards_module, reorder_mode):
-    manager = kanjicards_module.KanjiVocabRecalcManager.__new__(kanjicards_module.KanjiVocabRecalcManager)
+def build_environment(make_manager, kanjicards_module, reorder_mode):
+    manager = make_manager()
     manager.mw = types.SimpleNamespace()
-    manager._profile_config_error_logged = False
-    manager._profile_state_error_logged = False
-    manager._prioritysieve_waiting_post_sync = False
-    manager._last_vocab_sync_mod = None
-    manager._last_vocab_sync_count = None
-    manager._pending_vocab_sync_marker = None
-    manager._last_synced_config_hash = None
-    manager._pending_config_hash = None
-    manager._suppress_next_auto_sync = False
 
     kanji_model = {
         "id": 900,
@@ -252,7 +253,7 @@ def build_environment(kanjicards_module, reorder_mode):
         ("frequency", [5, 1, 2, 3, 4, 6]),
     ],
 )
-def test_reorder_new_kanji_cards_full_collection(mode, expected_order, kanjicards_module):
+def test_reorder_new_kanji_cards_full_collection(mode, expected_order, make_manager, kanjicards_module):
     (
         manager,
         collection,
@@ -263,7 +264,7 @@ def test_reorder_new_kanji_cards_full_collection(mode, expected_order, kanjicard
         dictionary,
         initial_tags,
     ) = build_environment(
-        kanjicards_module, mode
+        make_manager, kanjicards_module, mode
     )
 
     stats = manager._reorder_new_kanji_cards(
@@ -309,12 +310,59 @@ def test_reorder_new_kanji_cards_full_collection(mode, expected_order, kanjicard
                 assert tag not in note.tags
 
 
-def test_build_reorder_key_vocab_bucket_sorting(kanjicards_module):
-    manager = kanjicards_module.KanjiVocabRecalcManager.__new__(kanjicards_module.KanjiVocabRecalcManager)
-    manager._profile_config_error_logged = False
-    manager._profile_state_error_logged = False
-    manager._last_synced_config_hash = None
-    manager._pending_config_hash = None
+def test_reorder_new_kanji_cards_batches_only_changed_cards(make_manager, kanjicards_module):
+    manager, collection, kanji_model, kanji_field_index, cfg, usage_info, dictionary, _ = build_environment(
+        make_manager, kanjicards_module, "vocab"
+    )
+    args = (collection, kanji_model, kanji_field_index, cfg, usage_info, dictionary)
+
+    manager._reorder_new_kanji_cards(*args)
+    assert collection.executemany_calls == 1
+    assert {card_id for card_id, _due, mod, usn in collection.updated_cards} == set(collection.cards)
+    assert all(usn == 100 for _card_id, _due, _mod, usn in collection.updated_cards)
+
+    collection.updated_cards.clear()
+    stats = manager._reorder_new_kanji_cards(*args)
+    assert stats["cards_reordered"] == 0
+    assert collection.updated_cards == []
+    assert collection.executemany_calls == 1
+
+
+def test_reorder_new_kanji_cards_bulk_updates_bucket_tags(make_manager, kanjicards_module):
+    manager, collection, kanji_model, kanji_field_index, cfg, usage_info, dictionary, _ = build_environment(
+        make_manager, kanjicards_module, "vocab"
+    )
+    calls = []
+
+    class FakeTagManager:
+        def bulk_add(self, note_ids, tags):
+            calls.append(("add", tags, sorted(note_ids)))
+            for note_id in note_ids:
+                collection.notes[note_id].add_tag(tags)
+
+        def bulk_remove(self, note_ids, tags):
+            calls.append(("remove", tags, sorted(note_ids)))
+            for note_id in note_ids:
+                collection.notes[note_id].remove_tag(tags)
+
+    collection.tags = FakeTagManager()
+    stats = manager._reorder_new_kanji_cards(
+        collection, kanji_model, kanji_field_index, cfg, usage_info, dictionary
+    )
+
+    assert sorted(calls) == [
+        ("add", "bucket_no_vocab", [5, 6]),
+        ("add", "bucket_reviewed", [1, 2]),
+        ("add", "bucket_unreviewed", [3]),
+        ("remove", "bucket_reviewed", [3, 6]),
+        ("remove", "bucket_unreviewed", [5]),
+    ]
+    assert stats["bucket_tags_updated"] == 5
+    assert all(note.flush_count == 0 for note in collection.notes.values())
+
+
+def test_build_reorder_key_vocab_bucket_sorting(make_manager, kanjicards_module):
+    manager = make_manager()
     cases = [
         (
             101,
@@ -383,3 +431,7 @@ def test_build_reorder_key_vocab_bucket_sorting(kanjicards_module):
 
     sorted_ids = [card_id for key, card_id in sorted(keys, key=lambda entry: entry[0])]
     assert sorted_ids == [101, 102, 103, 104, 105]
+
+    unknown_key = manager._build_reorder_key("unknown", cases[0][1], 300, due_value=0, card_id=101, has_vocab=True)
+    vocab_key = manager._build_reorder_key("vocab", cases[0][1], 300, due_value=0, card_id=101, has_vocab=True)
+    assert unknown_key == vocab_key
@@ -19,18 +19,9 @@ class FakeCollection:
 
 
 @pytest.fixture
-def manager(kanjicards_module):
-    manager = kanjicards_module.KanjiVocabRecalcManager.__new__(kanjicards_module.KanjiVocabRecalcManager)
+def manager(make_manager):
+    manager = make_manager()
     manager.mw = types.SimpleNamespace()
-    manager._profile_config_error_logged = False
-    manager._profile_state_error_logged = False
-    manager._prioritysieve_waiting_post_sync = False
-    manager._last_vocab_sync_mod = None
-    manager._last_vocab_sync_count = None
-    manager._pending_vocab_sync_marker = None
-    manager._last_synced_config_hash = None
-    manager._pending_config_hash = None
-    manager._suppress_next_auto_sync = False
     return manager
 
 
@@ -61,9 +52,9 @@ def make_config(kanjicards_module):
 
 def test_collect_vocab_usage_tracks_firsts(manager, kanjicards_module):
     rows = [
-        (1, "火火\x1fmeaning", "", 1, None, None, 15),
-        (2, "火曜\x1fmeaning", "", 0, 10, None, None),
-        (3, "水\x1fmeaning", "", 0, 20, None, None),
+        (1, "火火\x1fmeaning", "", 1, None, None, 15, 1),
+        (2, "火曜\x1fmeaning", "", 0, 10, None, None, 1),
+        (3, "水\x1fmeaning", "", 0, 20, None, None, 1),
     ]
     collection = FakeCollection(rows)
     model = {
@@ -92,7 +83,7 @@ def test_collect_vocab_usage_tracks_firsts(manager, kanjicards_module):
 
 def test_collect_vocab_usage_includes_tagged_suspended_due(manager, kanjicards_module):
     rows = [
-        (1, "未\x1fmeaning", "kanjicards_new ", 0, None, 7, None),
+        (1, "未\x1fmeaning", "kanjicards_new ", 0, None, 7, None, 1),
     ]
     collection = FakeCollection(rows)
     model = {
@@ -111,7 +102,7 @@ def test_collect_vocab_usage_includes_tagged_suspended_due(manager, kanjicards_m
 
 def test_collect_vocab_usage_applies_due_multiplier(manager, kanjicards_module):
     rows = [
-        (1, "火\x1fmeaning", "", 0, 100, None, None),
+        (1, "火\x1fmeaning", "", 0, 100, None, None, 1),
     ]
     collection = FakeCollection(rows)
     model = {
@@ -131,3 +122,66 @@ def test_collect_vocab_usage_applies_due_multiplier(manager, kanjicards_module):
     info = usage["火"]
     assert info.first_new_due == 3000
     assert info.first_new_order == 0
+
+
+def test_collect_vocab_usage_counts_kanji_once_per_note_across_fields(manager, kanjicards_module):
+    rows = [
+        (1, "火山\x1f火\x1f山火事\x1f9", "", 0, 5, None, None, 1),
+    ]
+    collection = FakeCollection(rows)
+    model = {"id": 1, "name": "Vocab", "flds": [{"name": "Expression"}, {"name": "Reading"}]}
+    usage = manager._collect_vocab_usage(collection, [(model, [0, 1], 1.0)], make_config(kanjicards_module))
+    assert list(usage) == ["火", "山"]
+    assert usage["火"].vocab_occurrences == 1
+    assert usage["山"].vocab_occurrences == 1
+    assert "事" not in usage
+
+
+def test_collect_vocab_usage_new_firsts_ignore_query_order(manager, kanjicards_module):
+    rows = [
+        (1, "火", "", 0, 30, None, None, 1),
+        (2, "水", "", 0, 20, None, None, 1),
+        (3, "火水", "", 0, 10, None, None, 1),
+        (4, "火", "", 1, None, None, 3, 1),
+    ]
+    collection = FakeCollection(rows)
+    model = {"id": 1, "name": "Vocab", "flds": [{"name": "Expression"}]}
+    usage = manager._collect_vocab_usage(collection, [(model, [0], 1.0)], make_config(kanjicards_module))
+    assert (usage["火"].first_new_due, usage["火"].first_new_order) == (10, 0)
+    assert (usage["水"].first_new_due, usage["水"].first_new_order) == (10, 0)
+    assert usage["火"].first_review_order == 0
+    assert usage["火"].vocab_occurrences == 3
+
+
+def test_collect_vocab_usage_reads_active_status_from_usage_query(manager, kanjicards_module):
+    rows = [
+        (1, "火", "", 0, 5, None, None, 1),
+        (2, "水", "", 0, 6, None, None, 0),
+    ]
+    collection = FakeCollection(rows)
+    cfg = make_config(kanjicards_module)
+    cfg.ignore_suspended_vocab = True
+    models = [
+        ({"id": 1, "name": "VocabA", "flds": [{"name": "Expression"}]}, [0], 1.0),
+        ({"id": 2, "name": "VocabB", "flds": [{"name": "Expression"}]}, [0], 1.0),
+    ]
+    usage = manager._collect_vocab_usage(collection, models, cfg)
+    assert len(collection.db.calls) == 2
+    assert all("has_active" in sql for sql, _params in collection.db.calls)
+    assert set(usage) == {"火"}
+    assert usage["火"].vocab_occurrences == 2
+
+
+def test_collect_vocab_usage_matches_auto_suspend_tag_exactly(manager, kanjicards_module):
+    rows = [
+        (1, "未", " KanjiCards_New other ", 0, None, 7, None, 0),
+        (2, "来", " kanjicards_new_old ", 0, None, 8, None, 0),
+    ]
+    collection = FakeCollection(rows)
+    cfg = make_config(kanjicards_module)
+    cfg.auto_suspend_tag = "kanjicards_new"
+    cfg.ignore_suspended_vocab = True
+    model = {"id": 1, "name": "Vocab", "flds": [{"name": "Expression"}]}
+    usage = manager._collect_vocab_usage(collection, [(model, [0], 1.0)], cfg)
+    assert set(usage) == {"未"}
+    assert usage["未"].first_new_due == 7
@@ -10,7 +10,7 @@ aqt = pytest.importorskip("aqt", reason="Requires aqt installed for headless int
 
 
 @pytest.fixture(scope="module")
-def real_env(tmp_path_factory):
+def real_env(tmp_path_factory, make_manager):
     # Remove stubbed modules that earlier tests inject.
     for name in list(sys.modules):
         if name == "KanjiCards" or name.startswith("KanjiCards."):
@@ -49,7 +49,7 @@ def real_env(tmp_path_factory):
 
     KC = importlib.import_module("KanjiCards")
 
-    manager = KC.KanjiVocabRecalcManager.__new__(KC.KanjiVocabRecalcManager)
+    manager = make_manager(KC)
     dummy_addon_dir = tmp_dir / "addon"
     dummy_addon_dir.mkdir()
 
@@ -74,24 +74,8 @@ def real_env(tmp_path_factory):
         addonManager=_DummyAddonManager(),
     )
     manager.addon_dir = str(dummy_addon_dir)
-    manager._dictionary_cache = None
-    manager._existing_notes_cache = None
-    manager._kanji_model_cache = None
-    manager._vocab_model_cache = None
-    manager._realtime_error_logged = False
-    manager._missing_deck_logged = False
     manager._sync_hook_installed = False
     manager._sync_hook_target = None
-    manager._profile_config_error_logged = False
-    manager._profile_state_error_logged = False
-    manager._prioritysieve_waiting_post_sync = False
-    manager._pre_answer_card_state = {}
-    manager._last_question_card_id = None
-    manager._debug_enabled = False
-    manager._last_vocab_sync_mod = None
-    manager._last_vocab_sync_count = None
-    manager._pending_vocab_sync_marker = None
-    manager._suppress_next_auto_sync = False
 
     aqt.mw = manager.mw
 
@@ -296,22 +280,18 @@ def test_headless_apply_updates_creates_real_notes(real_env):
     assert "created_kanji" in tags.split()
 
     manager._progress_step(None, "skip")
-    tracker = {"progress": types.SimpleNamespace(update="not callable")}
+    tracker = manager._new_progress_tracker(types.SimpleNamespace(update="not callable"), 1)
     manager._progress_step(tracker, "no-op")
     class FailingProgress:
         def update(self, **kwargs):
             raise TypeError("fail")
 
-    manager._progress_step({"progress": FailingProgress(), "current": 0, "max": 1}, "TypeError")
-    tracker_callable = {
-        "progress": types.SimpleNamespace(update=lambda **kwargs: None),
-        "current": 0,
-        "max": 2,
-    }
+    manager._progress_step(manager._new_progress_tracker(FailingProgress(), 1), "TypeError")
     def bad_run(fn):
         raise RuntimeError("fail")
 
     manager.mw.taskman = types.SimpleNamespace(run_on_main=bad_run)
+    tracker_callable = manager._new_progress_tracker(types.SimpleNamespace(update=lambda **kwargs: None), 2)
     manager._progress_step(tracker_callable, "Step")
 
     extra_note = col.new_note(kanji_model_resolved)